@@ -0,0 +1,184 @@
+"""
+Query-count and latency regression benchmarks for the public views.
+
+A large synthetic league (see league/synthetic.py) is created in the test
+database and each view is requested repeatedly through the test client
+with page caching disabled. The query count and p50/p95 latency of every
+view are compared with the committed baseline (baseline.json): a view fails
+if it runs more queries than its budget or its latency regresses past the
+baseline multiplied by the threshold.
+
+The benchmarks are slow, so they only run when RUN_BENCHMARKS is set:
+
+    RUN_BENCHMARKS=1 python manage.py test benchmarks
+
+Optional environment variables:
+    BENCHMARK_RUNS: Timed requests per view (default 20).
+    BENCHMARK_THRESHOLD: Allowed latency regression factor (overrides the
+                         baseline threshold).
+    BENCHMARK_OUTPUT: Path to write the measured results to as JSON.
+    BENCHMARK_UPDATE_BASELINE: Set to rewrite baseline.json with the
+                               measured results.
+"""
+
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from unittest import skipUnless
+from django.db import connection
+from django.test import TestCase, override_settings, tag
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from clubs.models import Club
+from league.cache import CACHE_ALIAS
+from league.models import FixtureResult, Team
+from league.synthetic import create_synthetic_league
+
+
+# Constants
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+WARMUP_RUNS = 2
+DEFAULT_RUNS = 20
+
+# Size of the synthetic league
+NUM_SEASONS = 3
+NUM_DIVISIONS = 4
+TEAMS_PER_DIVISION = 10
+SEED = 2024
+
+# Latency differences below this are treated as noise
+MIN_REGRESSION_MS = 5
+
+# Rendered pages are not cached so every request does the full work
+UNCACHED = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    CACHE_ALIAS: {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+}
+
+
+def get_percentile(timings, percentile):
+    """Returns a percentile (1-99) of the timings."""
+    if len(timings) < 2:
+        return timings[0]
+    return statistics.quantiles(timings, n=100)[percentile - 1]
+
+
+@tag("benchmark")
+@skipUnless(
+    os.environ.get("RUN_BENCHMARKS"),
+    "Set RUN_BENCHMARKS=1 to run the view benchmarks.",
+)
+@override_settings(CACHES=UNCACHED)
+class ViewBenchmarkTests(TestCase):
+    """Benchmarks for the query count and latency of the public views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_synthetic_league(
+            NUM_SEASONS, NUM_DIVISIONS, TEAMS_PER_DIVISION, seed=SEED
+        )
+        cls.team = Team.objects.filter(season__is_current=True).first()
+        cls.result = FixtureResult.objects.order_by("-id").first()
+        cls.club = Club.objects.order_by("name").first()
+
+    def get_view_urls(self):
+        """Returns the URL to benchmark for each view."""
+        return {
+            "fixtures": reverse("fixtures"),
+            "results": reverse("results"),
+            "tables": reverse("tables"),
+            "team_summary": reverse("team_summary", args=[self.team.id]),
+            "result_breakdown": reverse(
+                "result_breakdown", args=[self.result.fixture_id]
+            ),
+            "clubs": reverse("clubs"),
+            "club_reviews": reverse("club_reviews", args=[self.club.id]),
+        }
+
+    def measure(self, url, runs):
+        """
+        Requests a URL repeatedly and returns its query count and latency.
+
+        Returns:
+            dict: The query count and the p50 and p95 latency (ms).
+        """
+        for _ in range(WARMUP_RUNS):
+            self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        # Read now as later requests reset the connection's query log
+        num_queries = len(queries)
+
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            self.client.get(url)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        return {
+            "queries": num_queries,
+            "p50_ms": round(statistics.median(timings), 2),
+            "p95_ms": round(get_percentile(timings, 95), 2),
+        }
+
+    def check_against_baseline(self, name, measured, baseline, threshold):
+        """Fails if a view exceeds its query budget or latency baseline."""
+        expected = baseline.get(name)
+        if expected is None:
+            self.fail(f"No baseline for {name} (update the baseline).")
+
+        self.assertLessEqual(
+            measured["queries"],
+            expected["queries"],
+            f"{name} ran {measured['queries']} queries "
+            f"(budget {expected['queries']}).",
+        )
+        for key in ("p50_ms", "p95_ms"):
+            limit = max(
+                expected[key] * threshold, expected[key] + MIN_REGRESSION_MS
+            )
+            self.assertLessEqual(
+                measured[key],
+                limit,
+                f"{name} {key} of {measured[key]} exceeds {limit:.2f} "
+                f"(baseline {expected[key]} x {threshold}).",
+            )
+
+    def test_views_within_budget(self):
+        """Verify every view is within its query budget and latency."""
+        baseline = json.loads(BASELINE_PATH.read_text())
+        threshold = float(
+            os.environ.get("BENCHMARK_THRESHOLD", baseline["threshold"])
+        )
+        runs = int(os.environ.get("BENCHMARK_RUNS", DEFAULT_RUNS))
+        update = bool(os.environ.get("BENCHMARK_UPDATE_BASELINE"))
+
+        results = {}
+        for name, url in self.get_view_urls().items():
+            results[name] = self.measure(url, runs)
+            print(
+                f"\n{name:<17} {results[name]['queries']:>4} queries  "
+                f"p50 {results[name]['p50_ms']:>8.2f} ms  "
+                f"p95 {results[name]['p95_ms']:>8.2f} ms",
+                end="",
+            )
+        print()
+
+        output_path = os.environ.get("BENCHMARK_OUTPUT")
+        if output_path:
+            Path(output_path).write_text(json.dumps(results, indent=2))
+
+        if update:
+            baseline["views"] = results
+            BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n")
+            return
+
+        for name, measured in results.items():
+            with self.subTest(view=name):
+                self.check_against_baseline(
+                    name, measured, baseline["views"], threshold
+                )
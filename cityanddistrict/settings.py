@@ -71,10 +71,12 @@ AUTHENTICATION_BACKENDS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "league.nplusone.NPlusOneMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "league.instrumentation.RequestMetricsMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
@@ -108,6 +110,79 @@ if "test" in sys.argv:
 CSRF_TRUSTED_ORIGINS = ["https://*.herokuapp.com"]
 
 
+# Caches
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# The "league" cache holds rendered league pages and must be shared by all
+# workers. It uses the database (run createcachetable after migrate) unless
+# REDIS_URL is set (requires the redis package).
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "league": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "league_cache",
+    },
+}
+
+if os.environ.get("REDIS_URL"):
+    CACHES["league"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("REDIS_URL"),
+    }
+
+
+# Request metrics
+# Query, template and cache timings are logged for every request (logger
+# "league.requests") and sent in a Server-Timing header to staff users and
+# this fraction (0 to 1) of other requests. Set REQUEST_METRICS_ENABLED to
+# "false" to turn them off. While they are enabled, Django's Template.render
+# method is wrapped for the whole process to time template rendering.
+
+REQUEST_METRICS_ENABLED = (
+    os.environ.get("REQUEST_METRICS_ENABLED", "true").lower() == "true"
+)
+REQUEST_METRICS_SAMPLE_RATE = float(
+    os.environ.get("REQUEST_METRICS_SAMPLE_RATE", "0")
+)
+
+# Repeated query (N+1) detection
+# Set N_PLUS_ONE_MODE to "log" (e.g. on staging) or "raise" to report any
+# SELECT query shape repeated more than N_PLUS_ONE_THRESHOLD times in a
+# request (raises by default during tests). N_PLUS_ONE_ALLOWLIST holds
+# regular expressions for query shapes or locations which may repeat.
+
+N_PLUS_ONE_MODE = os.environ.get(
+    "N_PLUS_ONE_MODE", "raise" if "test" in sys.argv else ""
+)
+N_PLUS_ONE_THRESHOLD = int(os.environ.get("N_PLUS_ONE_THRESHOLD", "5"))
+N_PLUS_ONE_ALLOWLIST = [
+    # The database cache backend queries its table for each cache operation
+    r'FROM "league_cache"',
+]
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "league.requests": {
+            "handlers": ["console"],
+            "level": "WARNING" if "test" in sys.argv else "INFO",
+            "propagate": False,
+        },
+        "league.queries": {
+            "handlers": ["console"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
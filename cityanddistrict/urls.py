@@ -5,6 +5,7 @@ from django.urls import path, include
 urlpatterns = [
     path("accounts/", include("allauth.urls")),
     path("admin/", admin.site.urls),
+    path("api/v1/", include("league.api_urls"), name="api-urls"),
     path("clubs/", include("clubs.urls"), name="clubs-urls"),
     path("contact/", include("contact.urls"), name="contact-urls"),
     path("league/", include("league.urls"), name="league-urls"),
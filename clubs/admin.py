@@ -10,8 +10,9 @@ from .models import (
 )
 
 # Register your models here.
-admin.site.register(Club)
-admin.site.register(Venue)
+# (search fields are used by the league admin's autocomplete widgets)
+admin.site.register(Club, search_fields=("name",))
+admin.site.register(Venue, search_fields=("name",))
 admin.site.register(ClubVenue)
 
 
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.20 on 2026-10-17 01:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0054_alter_clubinfo_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='club',
+            name='updated_on',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='clubinfo',
+            name='updated_on',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='clubvenue',
+            name='updated_on',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='venue',
+            name='updated_on',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='venueinfo',
+            name='updated_on',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
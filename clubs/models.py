@@ -27,6 +27,7 @@ class Club(models.Model):
     """
 
     name = models.CharField(max_length=100, unique=True)
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["name"]
@@ -69,6 +70,7 @@ class ClubInfo(models.Model):
     free_taster = models.BooleanField(default=False)
     created_on = models.DateTimeField(auto_now_add=True)
     approved = models.BooleanField(default=False)
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Club Information"
@@ -107,6 +109,7 @@ class Venue(models.Model):
     """
 
     name = models.CharField(max_length=100, unique=True)
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["name"]
@@ -148,6 +151,7 @@ class VenueInfo(models.Model):
         blank=True,
         help_text="This field is autopopulated from the postcode.",
     )
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["venue", "-created_on"]
@@ -204,6 +208,7 @@ class ClubVenue(models.Model):
     venue = models.ForeignKey(
         Venue, on_delete=models.CASCADE, related_name="venue_clubs"
     )
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ("club", "venue")
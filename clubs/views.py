@@ -10,6 +10,7 @@ from django.http import (
 from django.forms.models import model_to_dict
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from league.conditional import conditional_page
 from league.models import Team
 from .models import Club, ClubInfo, Venue, VenueInfo, ClubVenue, ClubReview
 from .forms import (
@@ -176,7 +177,23 @@ def build_locations_context(approved_venue_infos_qs, approved_club_infos_qs):
     return locations
 
 
+def get_clubs_scope(request):
+    """
+    Returns the querysets displayed on the clubs page (for conditional GET
+    requests).
+    """
+    return [
+        Club.objects.all(),
+        ClubInfo.objects.all(),
+        Venue.objects.all(),
+        VenueInfo.objects.all(),
+        ClubVenue.objects.all(),
+        ClubReview.objects.all(),
+    ]
+
+
 # View functions
+@conditional_page(get_clubs_scope)
 def clubs(request):
     """
     Renders a public-facing list of all clubs with approved information.
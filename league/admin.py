@@ -1,4 +1,5 @@
 from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
 from .models import (
     Division,
     Season,
@@ -12,13 +13,120 @@ from .models import (
     DoublesMatch,
     SinglesGame,
     DoublesGame,
+    LeagueStanding,
 )
+from .archive import finalize_season
+from .bulk_actions import (
+    approve_teams,
+    confirm_players,
+    mark_fees_paid,
+    postpone_fixtures,
+    reschedule_fixtures,
+)
+from .fixture_generator import generate_season_fixtures
 from .forms import DoublesMatchAdminForm
 
 
+def report_bulk_update(modeladmin, request, result, success, verb):
+    """
+    Reports how many records a bulk action changed and lists the records
+    it rejected.
+
+    Args:
+        modeladmin (ModelAdmin): The admin running the action.
+        request (HttpRequest): The admin request.
+        result (BulkUpdateResult): The result of the bulk change.
+        success (str): The success message, with a {count} placeholder.
+        verb (str): The action, used to list the rejected records.
+    """
+    modeladmin.message_user(
+        request,
+        success.format(count=result.updated),
+        level=messages.SUCCESS,
+    )
+    for description, names in result.rejected.items():
+        modeladmin.message_user(
+            request,
+            f"Could not {verb} {description}: {', '.join(names)}.",
+            level=messages.WARNING,
+        )
+
+
+class RelatedRecordsAdmin(admin.ModelAdmin):
+    """
+    Admin which loads the related records its rows are displayed with
+    (list_select_related and list_prefetch_related) in the same queries as
+    the rows, so changelists and autocomplete results run a fixed number of
+    queries however many rows are shown.
+
+    Many of the league models build __str__ from related records, so these
+    are applied in get_queryset (used by both the changelist and the
+    autocomplete view) rather than only by the changelist.
+    """
+
+    list_select_related = ()
+    list_prefetch_related = ()
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related(*self.list_select_related)
+            .prefetch_related(*self.list_prefetch_related)
+        )
+
+
+class SeasonScopedListFilter(admin.SimpleListFilter):
+    """
+    List filter offering only the records of one season: the season chosen
+    with the changelist's season filter or, if none is chosen, the current
+    season. Listing every team or week ever created would make the filter
+    (and every changelist page) grow each season.
+
+    Subclasses set the filtered model, the field shown for each choice and
+    the query parameter of the season filter.
+    """
+
+    model = None
+    label_field = None
+    season_parameter = "season__id__exact"
+
+    def lookups(self, request, model_admin):
+        season_id = request.GET.get(self.season_parameter, "")
+        if season_id.isdigit():
+            records = self.model.objects.filter(season_id=season_id)
+        else:
+            records = self.model.objects.filter(season__is_current=True)
+        return [
+            (str(pk), label)
+            for pk, label in records.values_list("pk", self.label_field)
+        ]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.parameter_name: self.value()})
+        return queryset
+
+
+class TeamListFilter(SeasonScopedListFilter):
+    title = "team"
+    parameter_name = "team"
+    model = Team
+    label_field = "team_name"
+    season_parameter = "team__season__id__exact"
+
+
+class WeekListFilter(SeasonScopedListFilter):
+    title = "week"
+    parameter_name = "week"
+    model = Week
+    label_field = "name"
+
+
 @admin.register(Division)
 class DivisionAdmin(admin.ModelAdmin):
     list_display = ("name", "rank")
+    search_fields = ("name",)
 
     def has_delete_permission(self, request, obj=None):
         """
@@ -84,18 +192,65 @@ class DivisionAdmin(admin.ModelAdmin):
 @admin.register(Season)
 class SeasonAdmin(admin.ModelAdmin):
     list_display = ("name", "is_current")
+    search_fields = ("name", "short_name")
     prepopulated_fields = {"slug": ("short_name",)}
+    actions = ["generate_fixtures", "finalize_seasons"]
+
+    @admin.action(description="Generate round-robin fixtures")
+    def generate_fixtures(self, request, queryset):
+        """
+        Generates a double round-robin fixture list for each selected
+        season. Seasons which already have fixtures are left unchanged.
+        """
+        for season in queryset:
+            try:
+                fixtures = generate_season_fixtures(season)
+            except ValidationError as error:
+                self.message_user(
+                    request,
+                    " ".join(error.messages),
+                    level=messages.ERROR,
+                )
+                continue
+            self.message_user(
+                request,
+                f"Generated {len(fixtures)} fixture(s) for {season}.",
+                level=messages.SUCCESS,
+            )
+
+    @admin.action(description="Finalize (archive) completed seasons")
+    def finalize_seasons(self, request, queryset):
+        """
+        Stores a frozen snapshot of each selected season, from which its
+        pages are then served. Seasons which have not finished are skipped.
+        """
+        for season in queryset:
+            try:
+                finalize_season(season)
+            except ValidationError as error:
+                self.message_user(
+                    request,
+                    " ".join(error.messages),
+                    level=messages.ERROR,
+                )
+                continue
+            self.message_user(
+                request, f"Archived {season}.", level=messages.SUCCESS
+            )
 
 
 @admin.register(Week)
-class WeekAdmin(admin.ModelAdmin):
+class WeekAdmin(RelatedRecordsAdmin):
     list_display = ("name", "start_date", "details", "season")
     list_filter = ("name", "season")
+    list_select_related = ("season",)
+    search_fields = ("name",)
+    autocomplete_fields = ("season",)
     ordering = ("-start_date",)
 
 
 @admin.register(Player)
-class PlayerAdmin(admin.ModelAdmin):
+class PlayerAdmin(RelatedRecordsAdmin):
     list_display = (
         "surname",
         "forename",
@@ -104,55 +259,193 @@ class PlayerAdmin(admin.ModelAdmin):
         "club_status",
     )
     list_filter = ("current_club", "club_status")
+    list_select_related = ("current_club",)
+    search_fields = ("surname", "forename")
+    autocomplete_fields = ("current_club",)
     ordering = ("surname", "forename")
+    actions = ["confirm_club_status"]
+
+    @admin.action(description="Confirm club status")
+    def confirm_club_status(self, request, queryset):
+        report_bulk_update(
+            self,
+            request,
+            confirm_players(queryset),
+            "Confirmed the club status of {count} player(s).",
+            "confirm",
+        )
 
 
 @admin.register(TeamPlayer)
-class TeamPlayerAdmin(admin.ModelAdmin):
+class TeamPlayerAdmin(RelatedRecordsAdmin):
     list_display = ("player", "team", "paid_fees")
-    list_filter = ("paid_fees", "team")
+    list_filter = ("paid_fees", "team__season", TeamListFilter)
+    list_select_related = ("player", "team__season")
+    search_fields = ("player__surname", "player__forename", "team__team_name")
+    autocomplete_fields = ("player", "team")
     ordering = ("player", "team")
+    actions = ["mark_fees_paid"]
+
+    @admin.action(description="Mark fees as paid")
+    def mark_fees_paid(self, request, queryset):
+        report_bulk_update(
+            self,
+            request,
+            mark_fees_paid(queryset),
+            "Marked fees as paid for {count} team player(s).",
+            "update",
+        )
 
 
 @admin.register(Team)
-class TeamAdmin(admin.ModelAdmin):
+class TeamAdmin(RelatedRecordsAdmin):
     list_display = ("team_name", "club", "division", "season", "approved")
     list_filter = ("approved", "season", "division", "club")
+    list_select_related = ("club", "division", "season")
+    search_fields = ("team_name",)
+    autocomplete_fields = ("season", "division", "club", "home_venue")
     ordering = ("team_name", "season")
+    actions = ["approve_teams"]
+
+    @admin.action(description="Approve teams")
+    def approve_teams(self, request, queryset):
+        report_bulk_update(
+            self,
+            request,
+            approve_teams(queryset),
+            "Approved {count} team(s).",
+            "approve",
+        )
 
 
 @admin.register(Fixture)
-class FixtureAdmin(admin.ModelAdmin):
-    list_filter = ("season", "division", "week")
+class FixtureAdmin(RelatedRecordsAdmin):
+    list_display = ("__str__", "division", "datetime", "status")
+    list_filter = ("season", "division", WeekListFilter)
+    list_select_related = (
+        "season",
+        "division",
+        "week",
+        "home_team",
+        "away_team",
+    )
+    search_fields = ("home_team__team_name", "away_team__team_name")
+    autocomplete_fields = (
+        "season",
+        "division",
+        "week",
+        "home_team",
+        "away_team",
+        "venue",
+    )
     ordering = ("-datetime",)
+    actions = ["postpone_fixtures", "reschedule_fixtures"]
+
+    @admin.action(description="Postpone fixtures")
+    def postpone_fixtures(self, request, queryset):
+        report_bulk_update(
+            self,
+            request,
+            postpone_fixtures(queryset),
+            "Postponed {count} fixture(s).",
+            "postpone",
+        )
+
+    @admin.action(description="Reschedule fixtures to the following week")
+    def reschedule_fixtures(self, request, queryset):
+        report_bulk_update(
+            self,
+            request,
+            reschedule_fixtures(queryset),
+            "Rescheduled {count} fixture(s).",
+            "reschedule",
+        )
 
 
 @admin.register(FixtureResult)
-class FixtureResultAdmin(admin.ModelAdmin):
-    readonly_fields = ("winner",)
+class FixtureResultAdmin(RelatedRecordsAdmin):
+    readonly_fields = (
+        "winner",
+        "home_individual_sets",
+        "away_individual_sets",
+    )
+    list_select_related = ("fixture__home_team", "fixture__away_team")
+    search_fields = (
+        "fixture__home_team__team_name",
+        "fixture__away_team__team_name",
+    )
+    autocomplete_fields = ("fixture",)
     ordering = ("-fixture__datetime",)
 
 
 @admin.register(SinglesMatch)
-class SinglesMatchAdmin(admin.ModelAdmin):
+class SinglesMatchAdmin(RelatedRecordsAdmin):
     readonly_fields = ("winner",)
+    list_select_related = ("home_player__player", "away_player__player")
+    search_fields = (
+        "home_player__player__surname",
+        "away_player__player__surname",
+    )
+    autocomplete_fields = ("fixture_result", "home_player", "away_player")
     ordering = ["home_player", "away_player"]
 
 
 @admin.register(DoublesMatch)
-class DoublesMatchAdmin(admin.ModelAdmin):
+class DoublesMatchAdmin(RelatedRecordsAdmin):
     form = DoublesMatchAdminForm
     readonly_fields = ("winner",)
+    list_prefetch_related = ("home_players__player", "away_players__player")
+    search_fields = (
+        "fixture_result__fixture__home_team__team_name",
+        "fixture_result__fixture__away_team__team_name",
+    )
+    autocomplete_fields = ("fixture_result", "home_players", "away_players")
     ordering = ["fixture_result"]
 
 
 @admin.register(SinglesGame)
-class SinglesGameAdmin(admin.ModelAdmin):
+class SinglesGameAdmin(RelatedRecordsAdmin):
     readonly_fields = ("winner",)
+    list_select_related = (
+        "singles_match__home_player__player",
+        "singles_match__away_player__player",
+    )
+    autocomplete_fields = ("singles_match",)
     ordering = ["singles_match", "set_num"]
 
 
 @admin.register(DoublesGame)
-class DoublesGameAdmin(admin.ModelAdmin):
+class DoublesGameAdmin(RelatedRecordsAdmin):
     readonly_fields = ("winner",)
+    list_select_related = (
+        "doubles_match__fixture_result__fixture__home_team__season",
+        "doubles_match__fixture_result__fixture__away_team__season",
+    )
+    autocomplete_fields = ("doubles_match",)
     ordering = ["doubles_match", "set_num"]
+
+
+@admin.register(LeagueStanding)
+class LeagueStandingAdmin(admin.ModelAdmin):
+    """
+    Read-only view of stored standings, which are maintained automatically
+    from results (use the rebuild_standings command to recalculate).
+    """
+
+    list_display = (
+        "team",
+        "division",
+        "played",
+        "won",
+        "drawn",
+        "lost",
+        "points",
+    )
+    list_filter = ("season", "division")
+    list_select_related = ("team__season", "division")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
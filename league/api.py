@@ -0,0 +1,495 @@
+"""
+Read-only JSON API (version 1) for league data.
+
+Fixture and result lists use the same season, division and club filters as
+the fixtures and results pages (see FixtureFilter) and are paginated with a
+keyset cursor on (datetime, id), so each page is a single indexed range
+query however deep into the season it is. Only the columns included in the
+response are selected.
+
+The export endpoints stream every matching fixture or result, fetching
+them in keyset batches so that whole seasons are never held in memory.
+"""
+
+import base64
+from datetime import datetime
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from .filters import FixtureFilter
+from .models import (
+    DoublesMatch,
+    Fixture,
+    LeagueStanding,
+    Season,
+    SinglesMatch,
+    Week,
+)
+from .standings import STANDING_ORDER
+
+
+# Constants
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+EXPORT_BATCH_SIZE = 1000
+
+# Response keys and the lookups they are selected from
+FIXTURE_FIELDS = {
+    "id": "id",
+    "datetime": "datetime",
+    "status": "status",
+    "season": "season__slug",
+    "division_id": "division_id",
+    "division": "division__name",
+    "week_id": "week_id",
+    "week": "week__name",
+    "home_team_id": "home_team_id",
+    "home_team": "home_team__team_name",
+    "away_team_id": "away_team_id",
+    "away_team": "away_team__team_name",
+    "venue_id": "venue_id",
+    "venue": "venue__name",
+}
+RESULT_FIELDS = {
+    **FIXTURE_FIELDS,
+    "home_score": "result__home_score",
+    "away_score": "result__away_score",
+    "winner": "result__winner",
+    "result_status": "result__status",
+}
+STANDING_FIELDS = {
+    "team_id": "team_id",
+    "team": "team__team_name",
+    "played": "played",
+    "won": "won",
+    "drawn": "drawn",
+    "lost": "lost",
+    "team_sets_won": "team_sets_won",
+    "individual_sets_won": "individual_sets_won",
+    "points": "points",
+}
+
+
+class InvalidRequest(Exception):
+    """Raised when API query parameters are invalid."""
+
+
+# Helper functions
+def error_response(message, status=400):
+    """Returns a JSON error response."""
+    return JsonResponse({"error": message}, status=status)
+
+
+def select_fields(queryset, fields):
+    """
+    Yields a dictionary for each row in the queryset containing only the
+    specified fields.
+
+    Args:
+        queryset (QuerySet): The queryset to select from.
+        fields (dict): Mapping of response keys to model lookups.
+    """
+    keys = list(fields)
+    for row in queryset.values_list(*fields.values()):
+        yield dict(zip(keys, row))
+
+
+def encode_cursor(row):
+    """Encodes the keyset position after a fixture row as a cursor."""
+    position = f"{row['datetime'].isoformat()}|{row['id']}"
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decodes a cursor into the (datetime, id) keyset position it represents.
+
+    Raises:
+        InvalidRequest: If the cursor is malformed.
+    """
+    try:
+        position = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, fixture_id = position.split("|")
+        return datetime.fromisoformat(timestamp), int(fixture_id)
+    except ValueError:
+        raise InvalidRequest("Invalid cursor.")
+
+
+def after_position(queryset, position):
+    """
+    Filters fixtures to those after a (datetime, id) keyset position, in
+    keyset order.
+    """
+    queryset = queryset.order_by("datetime", "id")
+    if position is None:
+        return queryset
+    timestamp, fixture_id = position
+    return queryset.filter(
+        Q(datetime__gt=timestamp) | Q(datetime=timestamp, id__gt=fixture_id)
+    )
+
+
+def get_page_size(request):
+    """
+    Returns the page size from the 'limit' GET parameter.
+
+    Raises:
+        InvalidRequest: If the limit is not a number between 1 and
+                        MAX_PAGE_SIZE.
+    """
+    limit = request.GET.get("limit", DEFAULT_PAGE_SIZE)
+    try:
+        limit = int(limit)
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise InvalidRequest(
+            f"limit must be a number between 1 and {MAX_PAGE_SIZE}."
+        )
+    return limit
+
+
+def get_filtered_fixtures(request, queryset):
+    """
+    Applies the fixtures page filters (season, division and club) from the
+    GET parameters.
+
+    Raises:
+        InvalidRequest: If the filter parameters are invalid.
+    """
+    fixture_filter = FixtureFilter(request.GET, queryset=queryset)
+    if not fixture_filter.is_valid():
+        raise InvalidRequest(fixture_filter.errors.get_json_data())
+    return fixture_filter.qs
+
+
+def get_api_season(request):
+    """
+    Returns the visible season for the 'season' GET parameter, defaulting to
+    the current season (or None if not found).
+    """
+    slug = request.GET.get("season")
+    seasons = Season.objects.filter(is_visible=True)
+    if slug:
+        return seasons.filter(slug=slug).first()
+    return seasons.filter(is_current=True).first()
+
+
+def get_player_name(forename, surname):
+    """Returns a player's full name (see Player.full_name)."""
+    return f"{forename} {surname}"
+
+
+def get_result_breakdowns(fixture_ids):
+    """
+    Builds the singles and doubles breakdown for the results of the
+    specified fixtures using one query per match type.
+
+    Args:
+        fixture_ids (list[int]): IDs of fixtures with results.
+
+    Returns:
+        dict: A dictionary mapping each fixture ID to a dictionary with
+              'singles' (list) and 'doubles' (dict or None) keys.
+    """
+    breakdowns = {
+        fixture_id: {"singles": [], "doubles": None}
+        for fixture_id in fixture_ids
+    }
+
+    singles_rows = (
+        SinglesMatch.objects.filter(
+            fixture_result__fixture_id__in=fixture_ids
+        )
+        .order_by("id")
+        .values_list(
+            "fixture_result__fixture_id",
+            "home_player__player__forename",
+            "home_player__player__surname",
+            "away_player__player__forename",
+            "away_player__player__surname",
+            "home_sets",
+            "away_sets",
+            "winner",
+        )
+    )
+    for row in singles_rows:
+        breakdowns[row[0]]["singles"].append(
+            {
+                "home_player": get_player_name(row[1], row[2]),
+                "away_player": get_player_name(row[3], row[4]),
+                "home_sets": row[5],
+                "away_sets": row[6],
+                "winner": row[7],
+            }
+        )
+
+    doubles_matches = {}
+    doubles_rows = DoublesMatch.objects.filter(
+        fixture_result__fixture_id__in=fixture_ids
+    ).values_list(
+        "id", "fixture_result__fixture_id", "home_sets", "away_sets", "winner"
+    )
+    for match_id, fixture_id, home_sets, away_sets, winner in doubles_rows:
+        doubles_matches[match_id] = {
+            "home_players": [],
+            "away_players": [],
+            "home_sets": home_sets,
+            "away_sets": away_sets,
+            "winner": winner,
+        }
+        breakdowns[fixture_id]["doubles"] = doubles_matches[match_id]
+
+    for side in ("home", "away"):
+        through = getattr(DoublesMatch, f"{side}_players").through
+        player_rows = (
+            through.objects.filter(doublesmatch_id__in=doubles_matches)
+            .order_by("id")
+            .values_list(
+                "doublesmatch_id",
+                "teamplayer__player__forename",
+                "teamplayer__player__surname",
+            )
+        )
+        for match_id, forename, surname in player_rows:
+            doubles_matches[match_id][f"{side}_players"].append(
+                get_player_name(forename, surname)
+            )
+
+    return breakdowns
+
+
+def build_fixture_page(request, queryset, fields, with_breakdown=False):
+    """
+    Builds one keyset-paginated page of fixtures (or results).
+
+    Args:
+        request (HttpRequest): The request with filter, cursor and limit
+                               GET parameters.
+        queryset (QuerySet[Fixture]): The fixtures to paginate.
+        fields (dict): Mapping of response keys to model lookups.
+        with_breakdown (bool): Whether to include result breakdowns.
+
+    Returns:
+        dict: The page data with 'results' and 'next' (URL or None) keys.
+
+    Raises:
+        InvalidRequest: If any GET parameters are invalid.
+    """
+    limit = get_page_size(request)
+    cursor = request.GET.get("cursor")
+    position = decode_cursor(cursor) if cursor else None
+    fixtures_qs = get_filtered_fixtures(request, queryset)
+
+    page_qs = after_position(fixtures_qs, position)[: limit + 1]
+    rows = list(select_fields(page_qs, fields))
+
+    next_url = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        params = request.GET.copy()
+        params["cursor"] = encode_cursor(rows[-1])
+        next_url = f"{request.path}?{params.urlencode()}"
+
+    if with_breakdown:
+        breakdowns = get_result_breakdowns([row["id"] for row in rows])
+        for row in rows:
+            row.update(breakdowns[row["id"]])
+
+    return {"results": rows, "next": next_url}
+
+
+def stream_fixtures(queryset, fields, key, with_breakdown=False):
+    """
+    Yields a JSON document containing every fixture in the queryset,
+    fetched in keyset batches of EXPORT_BATCH_SIZE.
+
+    Args:
+        queryset (QuerySet[Fixture]): The (filtered) fixtures to export.
+        fields (dict): Mapping of response keys to model lookups.
+        key (str): The top-level key for the list of fixtures.
+        with_breakdown (bool): Whether to include result breakdowns.
+    """
+    encoder = DjangoJSONEncoder()
+    yield f'{{"{key}": ['
+
+    position = None
+    separator = ""
+    while True:
+        batch_qs = after_position(queryset, position)[:EXPORT_BATCH_SIZE]
+        rows = list(select_fields(batch_qs, fields))
+        if not rows:
+            break
+
+        if with_breakdown:
+            breakdowns = get_result_breakdowns([row["id"] for row in rows])
+            for row in rows:
+                row.update(breakdowns[row["id"]])
+
+        yield separator + ",".join(encoder.encode(row) for row in rows)
+        separator = ","
+        position = (rows[-1]["datetime"], rows[-1]["id"])
+
+    yield "]}"
+
+
+# View functions
+@require_GET
+def seasons(request):
+    """Lists the visible seasons with the IDs of their divisions."""
+    season_rows = Season.objects.filter(is_visible=True).values_list(
+        "id",
+        "slug",
+        "name",
+        "short_name",
+        "start_date",
+        "end_date",
+        "is_current",
+    )
+    division_ids = {}
+    for season_id, division_id in Season.divisions.through.objects.filter(
+        season__is_visible=True
+    ).values_list("season_id", "division_id"):
+        division_ids.setdefault(season_id, []).append(division_id)
+
+    data = [
+        {
+            "slug": slug,
+            "name": name,
+            "short_name": short_name,
+            "start_date": start_date,
+            "end_date": end_date,
+            "is_current": is_current,
+            "division_ids": sorted(division_ids.get(season_id, [])),
+        }
+        for (
+            season_id,
+            slug,
+            name,
+            short_name,
+            start_date,
+            end_date,
+            is_current,
+        ) in season_rows
+    ]
+    return JsonResponse({"seasons": data})
+
+
+@require_GET
+def divisions(request):
+    """Lists the divisions in a season (defaults to current season)."""
+    season = get_api_season(request)
+    if season is None:
+        return error_response("Season not found.", status=404)
+
+    data = list(season.divisions.values("id", "name", "rank"))
+    return JsonResponse({"season": season.slug, "divisions": data})
+
+
+@require_GET
+def weeks(request):
+    """Lists the weeks in a season (defaults to current season)."""
+    season = get_api_season(request)
+    if season is None:
+        return error_response("Season not found.", status=404)
+
+    data = list(
+        Week.objects.filter(season=season).values(
+            "id", "name", "details", "start_date"
+        )
+    )
+    return JsonResponse({"season": season.slug, "weeks": data})
+
+
+@require_GET
+def fixtures(request):
+    """
+    Lists fixtures filtered by season (defaults to current season) and
+    optionally division and club, one page at a time.
+    """
+    try:
+        page = build_fixture_page(
+            request, Fixture.objects.all(), FIXTURE_FIELDS
+        )
+    except InvalidRequest as error:
+        return error_response(error.args[0])
+    return JsonResponse(page)
+
+
+@require_GET
+def results(request):
+    """
+    Lists results (including singles and doubles breakdowns) filtered by
+    season (defaults to current season) and optionally division and club,
+    one page at a time.
+    """
+    try:
+        page = build_fixture_page(
+            request,
+            Fixture.objects.filter(result__isnull=False),
+            RESULT_FIELDS,
+            with_breakdown=True,
+        )
+    except InvalidRequest as error:
+        return error_response(error.args[0])
+    return JsonResponse(page)
+
+
+@require_GET
+def fixtures_export(request):
+    """Streams every fixture matching the filters as one JSON document."""
+    try:
+        fixtures_qs = get_filtered_fixtures(request, Fixture.objects.all())
+    except InvalidRequest as error:
+        return error_response(error.args[0])
+    return StreamingHttpResponse(
+        stream_fixtures(fixtures_qs, FIXTURE_FIELDS, "fixtures"),
+        content_type="application/json",
+    )
+
+
+@require_GET
+def results_export(request):
+    """Streams every result matching the filters as one JSON document."""
+    try:
+        results_qs = get_filtered_fixtures(
+            request, Fixture.objects.filter(result__isnull=False)
+        )
+    except InvalidRequest as error:
+        return error_response(error.args[0])
+    return StreamingHttpResponse(
+        stream_fixtures(
+            results_qs, RESULT_FIELDS, "results", with_breakdown=True
+        ),
+        content_type="application/json",
+    )
+
+
+@require_GET
+def standings(request):
+    """
+    Lists the league table for each division in a season (defaults to
+    current season).
+    """
+    season = get_api_season(request)
+    if season is None:
+        return error_response("Season not found.", status=404)
+
+    tables = {
+        division_id: {"id": division_id, "name": name, "standings": []}
+        for division_id, name in season.divisions.values_list("id", "name")
+    }
+    standings_qs = (
+        LeagueStanding.objects.filter(season=season)
+        .order_by(*STANDING_ORDER)
+        .values_list("division_id", *STANDING_FIELDS.values())
+    )
+    keys = list(STANDING_FIELDS)
+    for division_id, *row in standings_qs:
+        if division_id in tables:
+            tables[division_id]["standings"].append(dict(zip(keys, row)))
+
+    return JsonResponse(
+        {"season": season.slug, "divisions": list(tables.values())}
+    )
@@ -0,0 +1,16 @@
+from django.urls import path
+from . import api
+
+
+urlpatterns = [
+    path("seasons/", api.seasons, name="api_seasons"),
+    path("divisions/", api.divisions, name="api_divisions"),
+    path("weeks/", api.weeks, name="api_weeks"),
+    path("fixtures/", api.fixtures, name="api_fixtures"),
+    path(
+        "fixtures/export/", api.fixtures_export, name="api_fixtures_export"
+    ),
+    path("results/", api.results, name="api_results"),
+    path("results/export/", api.results_export, name="api_results_export"),
+    path("standings/", api.standings, name="api_standings"),
+]
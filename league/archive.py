@@ -0,0 +1,554 @@
+"""
+Frozen snapshots of completed seasons.
+
+Past seasons never change, so finalizing a season (the finalize_season
+management command or the Season admin action) stores everything the
+results, tables, team summary and result breakdown pages show for it in a
+SeasonArchive record as one zlib-compressed JSON document. Pages for an
+archived season are rendered from the snapshot by the usual templates,
+without reading fixtures, results, matches or standings, and browsers may
+reuse them for an hour before revalidating them.
+
+Records in a snapshot are dictionaries using the model field names, so the
+templates read them as they read model instances. Lists of related records
+are wrapped in RelatedRecords so that ``.all`` works as it does on a
+related manager.
+
+The conditional GET check of an archived season page (see
+league/conditional.py) only reads the season's SeasonArchive row, whose
+updated_on time changes when the season is finalized again, and the
+seasons, divisions and clubs shown around the snapshot. Team summary and
+result breakdown URLs do not name a season, so their usual check also
+covers the archive of the season.
+
+Each worker process keeps the ids of the archived seasons, with the season
+of each of their teams and fixtures with results, and decodes a season's
+snapshot the first time one of its pages is requested. These are reloaded
+only when the archives tag in the league cache is bumped (a season is
+finalized or unfinalized); season slugs and visibility are read from the
+worker's season store (see league/seasons.py). A snapshot is not updated
+when the season's records change: finalize the season again after any
+correction.
+"""
+
+import json
+import threading
+import zlib
+from collections import namedtuple
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from .cache import ARCHIVES_TAG, get_tag_versions
+from .models import Fixture, SeasonArchive, Team
+from .seasons import get_season_store
+
+
+# Snapshots in an older layout are ignored until the season is finalized
+# again
+SNAPSHOT_FORMAT = 1
+
+# Browsers may reuse archived pages for an hour before revalidating them
+# (a season can be finalized again after a correction, or unfinalized)
+ARCHIVE_MAX_AGE = 60 * 60
+
+# Snapshot keys restored to related records, dates and player win counts
+RELATED_FIELDS = {
+    "week_fixtures",
+    "singles_matches",
+    "singles_games",
+    "home_players",
+    "away_players",
+    "doubles_games",
+}
+DATETIME_FIELDS = {"datetime"}
+DATE_FIELDS = {"start_date"}
+WIN_COUNT_FIELDS = {"home_player_win_counts", "away_player_win_counts"}
+
+ArchivedPlayer = namedtuple("ArchivedPlayer", ["full_name"])
+
+
+class RelatedRecords:
+    """
+    Archived related records, read in templates like a prefetched related
+    manager (e.g. ``week.week_fixtures.all``).
+    """
+
+    def __init__(self, records):
+        self.records = records
+
+    def all(self):
+        return self.records
+
+
+class SeasonSnapshot:
+    """The decoded snapshot of an archived season."""
+
+    def __init__(self, season_id, data):
+        self.season_id = season_id
+        self.data = data
+
+    def get_division_tables(self):
+        """Returns the league table of each division in the season."""
+        return self.data["tables"]
+
+    def get_result_weeks(self, division=None, club=None, before=None):
+        """
+        Returns the weeks with results (latest first), optionally limited
+        to the results of a division and/or club.
+
+        Args:
+            division (Division, optional): Only include this division.
+            club (Club, optional): Only include this club's home and away
+                                   fixtures.
+            before (date, optional): Only include weeks starting before
+                                     this date.
+
+        Returns:
+            list[dict]: The weeks containing at least one result.
+        """
+        weeks = []
+        for week in self.data["weeks"]:
+            if before and week["start_date"] >= before:
+                continue
+            fixtures = [
+                fixture
+                for fixture in week["week_fixtures"].all()
+                if (not division or fixture["division_id"] == division.id)
+                and (
+                    not club
+                    or club.id
+                    in (fixture["home_club_id"], fixture["away_club_id"])
+                )
+            ]
+            if fixtures:
+                weeks.append(
+                    {**week, "week_fixtures": RelatedRecords(fixtures)}
+                )
+        return weeks
+
+    def get_team_summary(self, team_id):
+        """Returns the team summary context of a team in the season."""
+        return self.data["teams"].get(str(team_id))
+
+    def get_breakdown(self, fixture_id):
+        """Returns the result breakdown context of a fixture."""
+        return self.data["breakdowns"].get(str(fixture_id))
+
+
+# Building snapshots
+def serialize_team(team):
+    return {"id": team.id, "team_name": team.team_name}
+
+
+def serialize_player(team_player):
+    return {"player": {"full_name": team_player.player.full_name}}
+
+
+def serialize_games(games):
+    return [
+        {"home_points": game.home_points, "away_points": game.away_points}
+        for game in games.all()
+    ]
+
+
+def serialize_result_weeks(season):
+    """
+    Serializes the fixtures with results in a season, grouped by week in
+    the order of the results page.
+    """
+    fixtures = (
+        Fixture.objects.filter(season=season, result__isnull=False)
+        .select_related("week", "home_team", "away_team", "result")
+        .order_by("-week__start_date", "week_id", "datetime")
+    )
+    weeks = []
+    for fixture in fixtures:
+        week = fixture.week
+        if not weeks or weeks[-1]["id"] != week.id:
+            weeks.append(
+                {
+                    "id": week.id,
+                    "name": week.name,
+                    "start_date": week.start_date,
+                    "details": week.details,
+                    "week_fixtures": [],
+                }
+            )
+        weeks[-1]["week_fixtures"].append(
+            {
+                "id": fixture.id,
+                "datetime": fixture.datetime,
+                "division_id": fixture.division_id,
+                "home_club_id": fixture.home_club_id,
+                "away_club_id": fixture.away_club_id,
+                "home_team": serialize_team(fixture.home_team),
+                "away_team": serialize_team(fixture.away_team),
+                "result": {
+                    "status": fixture.result.status,
+                    "home_score": fixture.result.home_score,
+                    "away_score": fixture.result.away_score,
+                },
+            }
+        )
+    return weeks
+
+
+def serialize_breakdown(context):
+    """Serializes the result breakdown context of a fixture."""
+    fixture = context["fixture"]
+    result = fixture.result
+    doubles_match = getattr(result, "doubles_match", None)
+
+    def serialize_win_counts(win_counts):
+        return [
+            [player.full_name, wins] for player, wins in win_counts.items()
+        ]
+
+    return {
+        "fixture": {
+            "id": fixture.id,
+            "season": {"name": fixture.season.name},
+            "datetime": fixture.datetime,
+            "venue": {"name": fixture.venue.name} if fixture.venue else None,
+            "home_team": serialize_team(fixture.home_team),
+            "away_team": serialize_team(fixture.away_team),
+            "result": {
+                "home_score": result.home_score,
+                "away_score": result.away_score,
+                "singles_matches": [
+                    {
+                        "home_player": serialize_player(match.home_player),
+                        "away_player": serialize_player(match.away_player),
+                        "home_sets": match.home_sets,
+                        "away_sets": match.away_sets,
+                        "singles_games": serialize_games(match.singles_games),
+                    }
+                    for match in result.singles_matches.all()
+                ],
+                "doubles_match": doubles_match
+                and {
+                    "home_players": [
+                        serialize_player(team_player)
+                        for team_player in doubles_match.home_players.all()
+                    ],
+                    "away_players": [
+                        serialize_player(team_player)
+                        for team_player in doubles_match.away_players.all()
+                    ],
+                    "home_sets": doubles_match.home_sets,
+                    "away_sets": doubles_match.away_sets,
+                    "doubles_games": serialize_games(
+                        doubles_match.doubles_games
+                    ),
+                },
+            },
+        },
+        "home_player_win_counts": serialize_win_counts(
+            context["home_player_win_counts"]
+        ),
+        "away_player_win_counts": serialize_win_counts(
+            context["away_player_win_counts"]
+        ),
+        "doubles_winning_team": context["doubles_winning_team"],
+    }
+
+
+def serialize_team_summary(context):
+    """Serializes the team summary context of a team."""
+    team = context["team"]
+
+    def serialize_fixture(data):
+        return {
+            "week": str(data["week"]),
+            "home_team": serialize_team(data["home_team"]),
+            "away_team": serialize_team(data["away_team"]),
+            "opponent": serialize_team(data["opponent"]),
+            "home_or_away": data["home_or_away"],
+            "venue": {"id": data["venue"].id} if data["venue"] else None,
+        }
+
+    return {
+        "team": {
+            "id": team.id,
+            "team_name": team.team_name,
+            "club": str(team.club),
+            "season": str(team.season),
+            "division": str(team.division),
+        },
+        "player_data": context["player_data"],
+        "results_data": [
+            {
+                **serialize_fixture(data),
+                "outcome": data["outcome"],
+                "result": {
+                    "id": data["result"].id,
+                    "home_score": data["result"].home_score,
+                    "away_score": data["result"].away_score,
+                },
+            }
+            for data in context["results_data"]
+        ],
+        "fixtures_data": [
+            {**serialize_fixture(data), "datetime": data["datetime"]}
+            for data in context["fixtures_data"]
+        ],
+        "team_stats": context["team_stats"],
+    }
+
+
+def build_season_snapshot(season):
+    """
+    Collects everything the archived pages show for a season.
+
+    Args:
+        season (Season): The season to snapshot.
+
+    Returns:
+        dict: The snapshot data (JSON serializable with DjangoJSONEncoder).
+    """
+    # Imported here as the views use this module to serve archived pages
+    from .views import (
+        build_result_breakdown_context,
+        build_team_summary_context,
+        get_breakdown_fixtures,
+        get_division_tables,
+    )
+
+    breakdown_fixtures = get_breakdown_fixtures().filter(
+        season=season, result__isnull=False
+    )
+    team_ids = Team.objects.filter(season=season).values_list("id", flat=True)
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "season_id": season.id,
+        "tables": [
+            {
+                "division": {
+                    "id": item["division"].id,
+                    "name": item["division"].name,
+                },
+                "table": item["table"],
+            }
+            for item in get_division_tables(season)
+        ],
+        "weeks": serialize_result_weeks(season),
+        "teams": {
+            str(team_id): serialize_team_summary(
+                build_team_summary_context(team_id)
+            )
+            for team_id in team_ids
+        },
+        "breakdowns": {
+            str(fixture.id): serialize_breakdown(
+                build_result_breakdown_context(fixture)
+            )
+            for fixture in breakdown_fixtures
+        },
+    }
+
+
+def encode_snapshot(data):
+    """Returns the snapshot data as compressed JSON."""
+    content = json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":"))
+    return zlib.compress(content.encode("utf-8"), 9)
+
+
+def restore_records(value, key=None):
+    """
+    Restores decoded JSON to the values used by the templates: dates,
+    related records and player win counts.
+    """
+    if isinstance(value, dict):
+        return {
+            item_key: restore_records(item, item_key)
+            for item_key, item in value.items()
+        }
+    if key in WIN_COUNT_FIELDS:
+        return {ArchivedPlayer(name): wins for name, wins in value}
+    if isinstance(value, list):
+        records = [restore_records(item) for item in value]
+        return RelatedRecords(records) if key in RELATED_FIELDS else records
+    if value and key in DATETIME_FIELDS:
+        return parse_datetime(value)
+    if value and key in DATE_FIELDS:
+        return parse_date(value)
+    return value
+
+
+def decode_snapshot(snapshot):
+    """Returns the snapshot data from compressed JSON."""
+    return restore_records(json.loads(zlib.decompress(snapshot)))
+
+
+def validate_season_finished(season):
+    """
+    Checks that a season has finished, so that its pages will not change.
+
+    Raises:
+        ValidationError: If the season is current or has not yet ended.
+    """
+    if season.is_current or season.end_date >= timezone.now().date():
+        raise ValidationError(f"{season} has not finished yet.")
+
+
+def finalize_season(season):
+    """
+    Stores a snapshot of a completed season, replacing any earlier
+    snapshot. Archived pages are served from it straight away.
+
+    Args:
+        season (Season): The season to finalize.
+
+    Returns:
+        SeasonArchive: The stored snapshot.
+
+    Raises:
+        ValidationError: If the season is current or has not yet ended.
+    """
+    validate_season_finished(season)
+    snapshot = encode_snapshot(build_season_snapshot(season))
+    archive, _ = SeasonArchive.objects.update_or_create(
+        season=season, defaults={"snapshot": snapshot}
+    )
+    return archive
+
+
+# Serving archived pages
+class ArchiveStore:
+    """
+    The archived seasons held in memory by a worker process. Snapshots are
+    decoded the first time a page of their season is requested.
+    """
+
+    def __init__(self, version=None):
+        self.version = version
+        self.season_ids = set()
+        self.teams = {}
+        self.fixtures = {}
+        self.snapshots = {}
+        self.lock = threading.Lock()
+
+    def load(self):
+        """
+        Reads the archived seasons and the seasons of their teams and
+        fixtures with results, without reading the snapshots.
+        """
+        self.season_ids = set(
+            SeasonArchive.objects.values_list("season_id", flat=True)
+        )
+        if self.season_ids:
+            self.teams = dict(
+                Team.objects.filter(season_id__in=self.season_ids)
+                .order_by()
+                .values_list("id", "season_id")
+            )
+            self.fixtures = dict(
+                Fixture.objects.filter(
+                    season_id__in=self.season_ids, result__isnull=False
+                )
+                .order_by()
+                .values_list("id", "season_id")
+            )
+        return self
+
+    def get_snapshot(self, season_id):
+        """
+        Returns the decoded snapshot of an archived season, or None if the
+        season is not archived or its snapshot is in an older layout.
+        """
+        if season_id not in self.season_ids:
+            return None
+        if season_id not in self.snapshots:
+            with self.lock:
+                if season_id not in self.snapshots:
+                    self.snapshots[season_id] = self.load_snapshot(season_id)
+        return self.snapshots[season_id]
+
+    def load_snapshot(self, season_id):
+        """Reads and decodes the snapshot of a season (one query)."""
+        snapshot = (
+            SeasonArchive.objects.filter(season_id=season_id)
+            .values_list("snapshot", flat=True)
+            .first()
+        )
+        if snapshot is None:
+            return None
+        data = decode_snapshot(snapshot)
+        if data.get("format") != SNAPSHOT_FORMAT:
+            return None
+        return SeasonSnapshot(season_id, data)
+
+
+_store = ArchiveStore()
+_store_lock = threading.Lock()
+
+
+def get_archive_store(request=None):
+    """
+    Returns this process's archive store, reloading it if a snapshot has
+    been stored or removed since it was loaded. If a request is given, the
+    store is looked up at most once per request.
+    """
+    global _store
+    if request is not None and hasattr(request, "_league_archives"):
+        return request._league_archives
+
+    (version,) = get_tag_versions([ARCHIVES_TAG])
+    if _store.version != version:
+        with _store_lock:
+            if _store.version != version:
+                _store = ArchiveStore(version).load()
+    if request is not None:
+        request._league_archives = _store
+    return _store
+
+
+def get_visible_snapshot(season_id, request=None):
+    """
+    Returns the snapshot of a visible archived season, or None. Seasons are
+    looked up in the worker's season store, so the archive store does not
+    need reloading when a season is renamed or hidden.
+    """
+    if season_id is None:
+        return None
+    visible = get_season_store(request).visible
+    if not any(season.id == season_id for season in visible):
+        return None
+    return get_archive_store(request).get_snapshot(season_id)
+
+
+def get_requested_archive(request):
+    """
+    Returns the snapshot of the season in the GET parameters, or None if
+    no season is requested or it is not archived. The snapshot is looked up
+    at most once per request.
+    """
+    if not hasattr(request, "_league_archive"):
+        slug = request.GET.get("season")
+        season = get_season_store(request).get_season(slug) if slug else None
+        request._league_archive = (
+            get_visible_snapshot(season.id, request) if season else None
+        )
+    return request._league_archive
+
+
+def get_archived_team_summary(team_id, request=None):
+    """
+    Returns the team summary context of a team in an archived season, or
+    None if the team's season is not archived.
+    """
+    season_id = get_archive_store(request).teams.get(team_id)
+    snapshot = get_visible_snapshot(season_id, request)
+    return snapshot.get_team_summary(team_id) if snapshot else None
+
+
+def get_archived_breakdown(fixture_id, request=None):
+    """
+    Returns the result breakdown context of a fixture in an archived
+    season, or None if the fixture's season is not archived.
+    """
+    season_id = get_archive_store(request).fixtures.get(fixture_id)
+    snapshot = get_visible_snapshot(season_id, request)
+    return snapshot.get_breakdown(fixture_id) if snapshot else None
+
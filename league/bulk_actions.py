@@ -0,0 +1,217 @@
+"""
+Bulk changes made by the league admin actions.
+
+Each change checks the whole selection against its rules with one query
+per rule, setting aside (and reporting) the records a rule rejects, then
+applies the change to the remaining records with a single UPDATE. Records
+already in the target state are left out, so the number updated is the
+number actually changed.
+
+update() does not call save() or clean() or send signals, so the rules
+cover the validation that applies to each change, updated_on is set
+explicitly (the conditional GET checks rely on it) and cached league pages
+are invalidated here.
+"""
+
+from collections import namedtuple
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import (
+    Case,
+    DurationField,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.utils import timezone
+from .cache import SEASONS_TAG, invalidate_tags
+from .models import Fixture, Week
+
+
+# Related records used in fixture names (see Fixture.__str__)
+FIXTURE_NAME_RELATED = ["season", "week", "home_team", "away_team"]
+
+# The number of records updated and the names of the rejected records
+# (mapped to the rule's description of the records it rejects)
+BulkUpdateResult = namedtuple("BulkUpdateResult", ["updated", "rejected"])
+
+
+# Helper functions
+def apply_bulk_update(queryset, rules, changes, name_related=()):
+    """
+    Applies a change to the selected records with one UPDATE, leaving out
+    the records rejected by any of the rules.
+
+    Args:
+        queryset (QuerySet): The selected records which need the change.
+        rules (list[tuple]): (Q matching records the change cannot apply
+                             to, description of those records) pairs.
+        changes (dict): The new field values (expressions allowed).
+        name_related (tuple, optional): The related fields used in the
+                                        records' names, selected with the
+                                        rejected records.
+
+    Returns:
+        BulkUpdateResult: The number of records updated and the names of
+                          the rejected records.
+    """
+    rejected = {}
+    with transaction.atomic():
+        for condition, description in rules:
+            rejected_records = queryset.filter(condition).select_related(
+                *name_related
+            )
+            names = [str(record) for record in rejected_records]
+            if names:
+                rejected[description] = names
+            queryset = queryset.exclude(condition)
+
+        updated = queryset.update(**changes, updated_on=timezone.now())
+        if updated:
+            invalidate_tags([SEASONS_TAG])
+    return BulkUpdateResult(updated, rejected)
+
+
+def get_next_weeks(fixtures):
+    """
+    Finds the week following each week of the fixtures in its season.
+
+    Args:
+        fixtures (QuerySet[Fixture]): The fixtures.
+
+    Returns:
+        dict: Week IDs mapped to (next week ID, days between the start of
+              the weeks), or None for the last week of a season.
+    """
+    later_weeks = Week.objects.filter(
+        season=OuterRef("season"), start_date__gt=OuterRef("start_date")
+    ).order_by("start_date")
+    weeks = Week.objects.filter(id__in=fixtures.values("week_id")).annotate(
+        next_id=Subquery(later_weeks.values("id")[:1]),
+        next_start_date=Subquery(later_weeks.values("start_date")[:1]),
+    )
+    return {
+        week.id: (
+            (week.next_id, (week.next_start_date - week.start_date).days)
+            if week.next_id
+            else None
+        )
+        for week in weeks
+    }
+
+
+# Bulk changes
+def approve_teams(teams):
+    """
+    Approves the selected teams.
+
+    Teams in seasons whose fixtures have already been generated are
+    rejected, as the fixture generator would not give them any fixtures.
+    """
+    fixtures_generated = Exists(
+        Fixture.objects.filter(season_id=OuterRef("season_id"))
+    )
+    return apply_bulk_update(
+        teams.filter(approved=False),
+        [
+            (
+                Q(fixtures_generated),
+                "teams in seasons with generated fixtures",
+            )
+        ],
+        {"approved": True},
+        name_related=["season"],
+    )
+
+
+def mark_fees_paid(team_players):
+    """Records that the selected team players have paid their fees."""
+    return apply_bulk_update(
+        team_players.filter(paid_fees=False), [], {"paid_fees": True}
+    )
+
+
+def confirm_players(players):
+    """
+    Confirms the club association of the selected pending players. Players
+    without a club and players whose association was rejected are rejected.
+    """
+    return apply_bulk_update(
+        players.exclude(club_status="confirmed"),
+        [
+            (Q(current_club__isnull=True), "players without a club"),
+            (
+                Q(club_status="rejected"),
+                "players whose club association was rejected",
+            ),
+        ],
+        {"club_status": "confirmed"},
+    )
+
+
+def postpone_fixtures(fixtures):
+    """Postpones the selected fixtures. Fixtures with results are rejected."""
+    return apply_bulk_update(
+        fixtures.exclude(status="postponed"),
+        [(Q(result__isnull=False), "fixtures with a result")],
+        {"status": "postponed"},
+        name_related=FIXTURE_NAME_RELATED,
+    )
+
+
+def reschedule_fixtures(fixtures):
+    """
+    Moves the selected fixtures to the following week of their season (on
+    the same day and at the same time) and marks them as scheduled.
+
+    Fixtures with results and fixtures in the last week of their season
+    are rejected.
+    """
+    next_weeks = get_next_weeks(fixtures)
+    last_week_ids = [
+        week_id for week_id, next_week in next_weeks.items() if not next_week
+    ]
+    moves = [
+        (week_id, next_week)
+        for week_id, next_week in next_weeks.items()
+        if next_week
+    ]
+    return apply_bulk_update(
+        fixtures,
+        [
+            (Q(result__isnull=False), "fixtures with a result"),
+            (
+                Q(week_id__in=last_week_ids),
+                "fixtures in the last week of their season",
+            ),
+        ],
+        {
+            # Every expression in UPDATE ... SET reads the row's original
+            # values, so this CASE matches the week the fixture is moving
+            # from (whatever order the fields are listed in)
+            "datetime": F("datetime")
+            + Case(
+                *[
+                    When(week_id=week_id, then=Value(timedelta(days=days)))
+                    for week_id, (_, days) in moves
+                ],
+                default=Value(timedelta()),
+                output_field=DurationField(),
+            ),
+            "week_id": Case(
+                *[
+                    When(week_id=week_id, then=Value(next_id))
+                    for week_id, (next_id, _) in moves
+                ],
+                default=F("week_id"),
+                output_field=IntegerField(),
+            ),
+            "status": "scheduled",
+        },
+        name_related=FIXTURE_NAME_RELATED,
+    )
@@ -0,0 +1,188 @@
+"""
+Versioned, tag-invalidated caching for rendered league page sections.
+
+Each cached section is stored under a key built from the page name, the
+request's GET parameters and the current version of every tag the page
+depends on (e.g. "season:24-25" or "team:12"). Changing league data bumps
+the versions of the affected tags (see league/signals.py), so stale
+sections are never looked up again and simply expire.
+
+Sections are stored in the "league" cache, which must be shared by all
+worker processes (Redis or the database cache table in settings.py).
+"""
+
+import hashlib
+import time
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.safestring import mark_safe
+from .instrumentation import record_cache_lookups
+
+
+CACHE_ALIAS = "league"
+TAG_PREFIX = "league:tag:"
+SECTION_PREFIX = "league:section:"
+
+# Sections are invalidated by tag versions, so the timeout only limits
+# how long unused entries occupy the cache
+SECTION_TIMEOUT = 60 * 60 * 24
+
+# Tags for data shared by every league page (e.g. filter dropdowns)
+SEASONS_TAG = "seasons"
+CLUBS_TAG = "clubs"
+
+# Tag for the archived season snapshots held by each worker process (see
+# league/archive.py)
+ARCHIVES_TAG = "archives"
+
+# Tag for the seasons and divisions held by each worker process (see
+# league/seasons.py)
+SEASON_LIST_TAG = "season-list"
+
+
+def get_cache():
+    """Returns the cache backend used for league pages."""
+    return caches[CACHE_ALIAS]
+
+
+def new_version():
+    """Returns a new, unique tag version."""
+    return time.time_ns()
+
+
+def season_tag(season_slug, division_id=None, club_id=None):
+    """
+    Builds the tag for league data within a season, optionally narrowed to
+    a division or a club.
+    """
+    if club_id:
+        return f"season:{season_slug}:club:{club_id}"
+    if division_id:
+        return f"season:{season_slug}:division:{division_id}"
+    return f"season:{season_slug}"
+
+
+def team_tag(team_id):
+    """Builds the tag for league data relating to a team."""
+    return f"team:{team_id}"
+
+
+def get_season_page_tags(request):
+    """
+    Returns the tags for a page listing league data for the season (and
+    optionally division or club) selected in the GET parameters, defaulting
+    to the current season.
+
+    Args:
+        request (HttpRequest): The request containing filter parameters.
+
+    Returns:
+        list[str]: The tags the page depends on.
+    """
+    season_slug = request.GET.get("season") or get_current_season_slug(
+        request
+    )
+    return [
+        SEASONS_TAG,
+        CLUBS_TAG,
+        season_tag(
+            season_slug,
+            division_id=request.GET.get("division"),
+            club_id=request.GET.get("club"),
+        ),
+    ]
+
+
+def get_tag_versions(tags):
+    """
+    Returns the current version of each tag, initialising any tags which
+    are not yet in the cache.
+
+    Args:
+        tags (list[str]): The tags to look up.
+
+    Returns:
+        list[int]: The version of each tag in the same order.
+    """
+    cache = get_cache()
+    keys = [TAG_PREFIX + tag for tag in tags]
+    versions = cache.get_many(keys)
+
+    missing = {key: new_version() for key in keys if key not in versions}
+    record_cache_lookups(hits=len(versions), misses=len(missing))
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+
+    return [versions[key] for key in keys]
+
+
+def invalidate_tags(tags):
+    """
+    Bumps the version of each tag so that cached sections depending on any
+    of them are no longer used.
+
+    Tags are bumped immediately and again when the current transaction
+    commits, so sections rendered from uncommitted data are discarded.
+
+    Args:
+        tags (Iterable[str]): The tags to invalidate.
+    """
+    tags = set(tags)
+    if not tags:
+        return
+
+    def bump():
+        get_cache().set_many(
+            {TAG_PREFIX + tag: new_version() for tag in tags}, timeout=None
+        )
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def get_current_season_slug(request=None):
+    """
+    Returns the slug of the current season (or an empty string if there is
+    no current season) from the worker's season store.
+    """
+    from .seasons import get_current_season
+
+    season = get_current_season(request)
+    return season.slug if season else ""
+
+
+def get_section_cache_key(name, request, tags):
+    """
+    Builds the cache key for a page section from the page name, the GET
+    parameters and the current versions of its tags.
+    """
+    params = sorted(request.GET.lists())
+    raw_key = repr((params, tags, get_tag_versions(tags)))
+    digest = hashlib.md5(raw_key.encode("utf-8")).hexdigest()
+    return f"{SECTION_PREFIX}{name}:{digest}"
+
+
+def get_or_render_section(name, request, tags, render_section):
+    """
+    Returns the cached HTML for a page section, rendering and caching it
+    if it is not already cached.
+
+    Args:
+        name (str): A unique name for the page section.
+        request (HttpRequest): The request (GET parameters form part of the
+                               cache key).
+        tags (list[str]): Tags whose invalidation should expire the section.
+        render_section (Callable[[], str]): Renders the section HTML.
+
+    Returns:
+        SafeString: The rendered section HTML.
+    """
+    cache = get_cache()
+    key = get_section_cache_key(name, request, tags)
+    html = cache.get(key)
+    record_cache_lookups(hits=html is not None, misses=html is None)
+    if html is None:
+        html = str(render_section())
+        cache.set(key, html, timeout=SECTION_TIMEOUT)
+    return mark_safe(html)
@@ -0,0 +1,136 @@
+"""
+Conditional GET support (ETag / Last-Modified) for public league and club
+pages.
+
+Each page declares the records it displays as a list of querysets (its
+"scope"). The latest updated_on value and the row count of every queryset
+are fetched in a single UNION ALL query; together they change whenever a
+record in the scope is created, edited or deleted. Browsers revalidating a
+page that has not changed receive a 304 response without the view running.
+
+Last-Modified only follows the updated_on values, which a deletion does
+not advance, so deleting a record updates the updated_on time of the
+record containing it (e.g. a fixture's season, see league/signals.py).
+"""
+
+import hashlib
+from functools import wraps
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.db.models import Count, Max, Value
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+
+def get_scope_state(scope):
+    """
+    Fetches the latest update time and row count of each queryset in a
+    page scope using one query.
+
+    Args:
+        scope (list[QuerySet]): Querysets of models with an updated_on field.
+
+    Returns:
+        dict: A dictionary mapping each queryset's position in the scope to
+              a (latest updated_on, row count) tuple.
+    """
+    parts = [
+        queryset.order_by()
+        .annotate(part=Value(index))
+        .values("part")
+        .annotate(latest=Max("updated_on"), total=Count("pk"))
+        .values_list("part", "latest", "total")
+        for index, queryset in enumerate(scope)
+    ]
+    rows = parts[0].union(*parts[1:], all=True)
+    return {part: (latest, total) for part, latest, total in rows}
+
+
+def get_page_state(request, get_scope, args, kwargs):
+    """
+    Returns the scope state for the current request, fetching it at most
+    once per request (the ETag and Last-Modified functions both use it).
+
+    Returns:
+        dict | None: The scope state, or None if the page has no scope
+                     (e.g. the requested record does not exist).
+    """
+    if not hasattr(request, "_league_page_state"):
+        scope = get_scope(request, *args, **kwargs)
+        request._league_page_state = get_scope_state(scope) if scope else None
+    return request._league_page_state
+
+
+def conditional_page(get_scope, get_max_age=None):
+    """
+    Decorator adding ETag and Last-Modified headers to a page and answering
+    matching If-None-Match / If-Modified-Since requests with a 304 response.
+
+    The ETag also varies with the logged in user (shown in the navbar),
+    HTMX requests (which return a partial template) and the current date
+    (used to highlight the current week). Requests with pending flash
+    messages are always rendered in full so that the messages are shown.
+
+    Args:
+        get_scope (Callable): Called with the view arguments and returns the
+                              querysets displayed on the page, or None if
+                              there is nothing to validate against.
+        get_max_age (Callable, optional): Called with the view arguments and
+                                          returns the seconds browsers may
+                                          reuse the page for without
+                                          revalidating it, or None.
+    """
+
+    def decorator(view_func):
+        def get_etag(request, *args, **kwargs):
+            state = get_page_state(request, get_scope, args, kwargs)
+            if state is None:
+                return None
+            raw_etag = repr(
+                (
+                    view_func.__name__,
+                    sorted(state.items()),
+                    request.user.pk,
+                    request.headers.get("HX-Request"),
+                    timezone.now().date(),
+                )
+            )
+            digest = hashlib.md5(raw_etag.encode("utf-8")).hexdigest()
+            # Weak as the HTML differs slightly (e.g. CSRF token masking)
+            return f'W/"{digest}"'
+
+        def get_last_modified(request, *args, **kwargs):
+            state = get_page_state(request, get_scope, args, kwargs)
+            if not state:
+                return None
+            updates = [latest for latest, _ in state.values() if latest]
+            return max(updates) if updates else None
+
+        conditional_view = condition(
+            etag_func=get_etag, last_modified_func=get_last_modified
+        )(view_func)
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if CookieStorage.cookie_name in request.COOKIES:
+                response = view_func(request, *args, **kwargs)
+            else:
+                response = conditional_view(request, *args, **kwargs)
+
+            # Browsers must revalidate rather than reuse pages unchecked,
+            # unless the page may be reused for a while (e.g. archived
+            # seasons). 304 responses get the same headers as the page.
+            if not response.has_header("Cache-Control"):
+                max_age = get_max_age and get_max_age(request, *args, **kwargs)
+                if max_age:
+                    patch_cache_control(
+                        response, private=True, max_age=max_age
+                    )
+                else:
+                    patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ["Cookie", "HX-Request"])
+            return response
+
+        return wrapper
+
+    return decorator
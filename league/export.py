@@ -0,0 +1,243 @@
+"""
+Static HTML export of a completed season.
+
+Every public page of a finished season (fixtures, results, tables, each
+team summary and each result breakdown) is rendered by its view and written
+under STATIC_ROOT/seasons/<slug>/ so that WhiteNoise can serve it as a
+static file. Links between the exported pages are rewritten to the static
+files; all other links (e.g. the navigation bar) still point at the site.
+
+Pages are rendered by a pool of worker processes, as rendering is CPU bound.
+The SHA-256 hash of each page is kept in a manifest.json file next to the
+pages, so exporting a season again only rewrites the pages which changed
+and removes pages which no longer exist.
+
+WhiteNoise only finds new static files when the site starts, so restart
+the site after the first export of a season.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import django
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import connections
+from django.templatetags.static import static
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from .archive import validate_season_finished
+from .models import Fixture, Team
+from .paging import ALL_WEEKS
+
+
+EXPORT_DIR = "seasons"
+MANIFEST_NAME = "manifest.json"
+
+# Pages sent to each worker at a time
+CHUNK_SIZE = 20
+
+# href attributes, split into path and query string
+HREF_PATTERN = re.compile(r'href="([^"?#]+)(\?[^"#]*)?"')
+
+# Links rewritten by the worker processes (see init_worker)
+_link_map = {}
+
+
+class ExportError(Exception):
+    """Raised when a page of the season cannot be rendered."""
+
+
+# Helper functions
+def get_export_dir(season):
+    """Returns the directory a season's pages are exported to."""
+    return Path(settings.STATIC_ROOT) / EXPORT_DIR / season.slug
+
+
+def get_season_pages(season):
+    """
+    Lists every public page of a season.
+
+    Args:
+        season (Season): The season to export.
+
+    Returns:
+        list[tuple]: (URL, file path relative to the export directory) for
+                     each page.
+    """
+    # The fixtures and results pages show every week rather than the first
+    # page of weeks (see league/paging.py)
+    season_query = f"?season={season.slug}"
+    all_weeks_query = f"{season_query}&weeks={ALL_WEEKS}"
+    pages = [
+        (reverse("fixtures") + all_weeks_query, "fixtures.html"),
+        (reverse("results") + all_weeks_query, "results.html"),
+        (reverse("tables") + season_query, "tables.html"),
+    ]
+    team_ids = Team.objects.filter(season=season).values_list("id", flat=True)
+    pages += [
+        (reverse("team_summary", args=[team_id]), f"teams/{team_id}.html")
+        for team_id in team_ids.order_by("id")
+    ]
+    fixture_ids = Fixture.objects.filter(
+        season=season, result__isnull=False
+    ).values_list("id", flat=True)
+    pages += [
+        (
+            reverse("result_breakdown", args=[fixture_id]),
+            f"results/{fixture_id}.html",
+        )
+        for fixture_id in fixture_ids.order_by("id")
+    ]
+    return pages
+
+
+def get_link_map(season, pages):
+    """Maps the URL of each exported page to the URL of its static file."""
+    prefix = f"{EXPORT_DIR}/{season.slug}/"
+    return {url: static(prefix + path) for url, path in pages}
+
+
+def rewrite_links(html, link_map):
+    """
+    Points links to exported pages at their static files.
+
+    Args:
+        html (str): The page HTML.
+        link_map (dict): Page URLs mapped to static file URLs.
+
+    Returns:
+        str: The page HTML with the links rewritten.
+    """
+
+    # Team summary and breakdown links may carry the filters of the page
+    # they are on, so are also matched by path alone
+    def replace(match):
+        path, query = match.group(1), match.group(2) or ""
+        static_url = link_map.get(path + query) or link_map.get(path)
+        return f'href="{static_url}"' if static_url else match.group(0)
+
+    return HREF_PATTERN.sub(replace, html)
+
+
+# Rendering (runs in the worker processes)
+def init_worker(link_map):
+    """Prepares a worker process to render pages."""
+    if not apps.ready:
+        django.setup()
+    _link_map.clear()
+    _link_map.update(link_map)
+
+
+def render_page(page):
+    """
+    Renders a page as an anonymous visitor would see it.
+
+    Args:
+        page (tuple): The page URL and export path.
+
+    Returns:
+        tuple: The export path, SHA-256 hex digest and page content (bytes).
+
+    Raises:
+        ExportError: If the page is not rendered successfully.
+    """
+    url, path = page
+    request = RequestFactory().get(url)
+    request.user = AnonymousUser()
+    match = resolve(request.path_info)
+    response = match.func(request, *match.args, **match.kwargs)
+    if response.status_code != 200:
+        raise ExportError(f"{url} returned status {response.status_code}.")
+
+    if response.streaming:
+        html = b"".join(response.streaming_content)
+    else:
+        html = response.content
+    content = rewrite_links(html.decode("utf-8"), _link_map).encode("utf-8")
+    return path, hashlib.sha256(content).hexdigest(), content
+
+
+def render_pages(pages, link_map, workers):
+    """
+    Renders the pages with a pool of worker processes (or in this process
+    if only one worker is used), yielding each page as it is rendered.
+    """
+    if workers == 1:
+        init_worker(link_map)
+        yield from map(render_page, pages)
+        return
+
+    # Workers must open their own database connections
+    connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(link_map,)
+    ) as executor:
+        yield from executor.map(render_page, pages, chunksize=CHUNK_SIZE)
+
+
+# Writing pages
+def write_file(path, content):
+    """Writes a file atomically so a partly written page is never served."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_bytes(content)
+    os.replace(temp_path, path)
+
+
+def export_season(season, workers=None):
+    """
+    Renders every public page of a finished season to static files,
+    rewriting only the pages whose content has changed since the last
+    export.
+
+    Args:
+        season (Season): The season to export.
+        workers (int, optional): The number of worker processes. Defaults
+                                 to the number of CPUs.
+
+    Returns:
+        dict: The number of pages 'written', 'unchanged' and 'removed'.
+
+    Raises:
+        ValidationError: If the season has not finished.
+        ExportError: If a page cannot be rendered.
+    """
+    validate_season_finished(season)
+    export_dir = get_export_dir(season)
+    manifest_path = export_dir / MANIFEST_NAME
+    try:
+        previous = json.loads(manifest_path.read_text())
+    except FileNotFoundError:
+        previous = {}
+
+    pages = get_season_pages(season)
+    link_map = get_link_map(season, pages)
+    manifest = {}
+    written = 0
+    for path, digest, content in render_pages(
+        pages, link_map, workers or os.cpu_count() or 1
+    ):
+        manifest[path] = digest
+        file_path = export_dir / path
+        if previous.get(path) != digest or not file_path.exists():
+            write_file(file_path, content)
+            written += 1
+
+    removed = set(previous) - set(manifest)
+    for path in removed:
+        (export_dir / path).unlink(missing_ok=True)
+
+    write_file(
+        manifest_path,
+        json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"),
+    )
+    return {
+        "written": written,
+        "unchanged": len(manifest) - written,
+        "removed": len(removed),
+    }
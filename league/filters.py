@@ -1,9 +1,18 @@
 from django.urls import reverse
 import django_filters
+from .forms import StoredModelChoiceField
+from .membership import get_club_fixtures_q
 from .models import Fixture, Season, Division
+from .seasons import get_season_store
 from clubs.models import Club
 
 
+class StoredModelChoiceFilter(django_filters.ModelChoiceFilter):
+    """A ModelChoiceFilter choosing from records held in memory."""
+
+    field_class = StoredModelChoiceField
+
+
 class FixtureFilter(django_filters.FilterSet):
     """
     A dynamic filter for the Fixture model based on season, division, and club.
@@ -14,19 +23,22 @@ class FixtureFilter(django_filters.FilterSet):
     - Division options are populated based on the selected season.
     - Club options are populated based on the selected season and division.
     - HTMX used to dynamically update filter options without full page reload.
+
+    Seasons, divisions and clubs are listed from the worker's season store
+    (see league/seasons.py), so they cost no queries.
     """
 
-    season = django_filters.ModelChoiceFilter(
+    season = StoredModelChoiceFilter(
         queryset=Season.objects.filter(is_visible=True),
         to_field_name="slug",
         label="Season",
         empty_label=None,
     )
-    division = django_filters.ModelChoiceFilter(
+    division = StoredModelChoiceFilter(
         queryset=Division.objects.none(),  # populated dynamically
         empty_label="All Divisions",
     )
-    club = django_filters.ModelChoiceFilter(
+    club = StoredModelChoiceFilter(
         queryset=Club.objects.none(),  # populated dynamically
         method="filter_by_club",
         label="Club (Home or Away)",
@@ -34,12 +46,13 @@ class FixtureFilter(django_filters.FilterSet):
     )
 
     def __init__(self, data=None, *args, **kwargs):
+        store = get_season_store(kwargs.get("request"))
+
         # Set current season as default
         if not data or not data.get("season"):
-            current_season = Season.objects.filter(is_current=True).first()
-            if current_season:
+            if store.current:
                 data = data.copy() if data else {}
-                data["season"] = current_season.slug
+                data["season"] = store.current.slug
         super().__init__(data, *args, **kwargs)
 
         # Update filter dropdowns if trigger field is changed
@@ -58,32 +71,16 @@ class FixtureFilter(django_filters.FilterSet):
                     }
                 )
 
-        # Adjust division queryset based on season
-        season = None
-        season_slug = self.data.get("season")
-
-        if season_slug:
-            try:
-                season = Season.objects.get(slug=season_slug)
-                self.form.fields["division"].queryset = season.divisions.all()
-            except Season.DoesNotExist:
-                self.form.fields["division"].queryset = Division.objects.none()
-
-        # Adjust club queryset based on division and/or season
-        division_id = self.data.get("division")
-        if season and division_id:
-            try:
-                division = Division.objects.get(id=division_id)
-                self.form.fields["club"].queryset = Club.objects.filter(
-                    club_teams__season=season, club_teams__division=division
-                ).distinct()
-            except Division.DoesNotExist:
-                self.form.fields["club"].queryset = Club.objects.none()
-        elif season:
-            # No division selected: show all clubs in the season
-            self.form.fields["club"].queryset = Club.objects.filter(
-                club_teams__season=season
-            ).distinct()
+        # Adjust division choices based on season
+        season = store.get_season(self.data.get("season"))
+        self.form.fields["season"].records = store.visible
+        self.form.fields["division"].records = store.get_divisions(season)
+
+        # Adjust club choices based on division and/or season (all clubs
+        # in the season if no division is selected)
+        self.form.fields["club"].records = store.get_clubs(
+            season, self.data.get("division")
+        )
 
     class Meta:
         model = Fixture
@@ -92,8 +89,6 @@ class FixtureFilter(django_filters.FilterSet):
     def filter_by_club(self, queryset, name, value):
         """
         Filters the queryset to include fixtures where the selected club is
-        either the home or away team.
+        either the home or away team (using the clubs stored on Fixture).
         """
-        return queryset.filter(home_team__club=value) | queryset.filter(
-            away_team__club=value
-        )
+        return queryset.filter(get_club_fixtures_q(value.id))
@@ -0,0 +1,173 @@
+"""
+Generation of a double round-robin fixture list for a season.
+
+Every approved team in a division plays every other team twice (once at
+home and once away). Rounds are scheduled in the season's weeks (in date
+order) on each home team's match day and time. Fixtures are validated with
+Fixture.clean using already loaded related objects, then inserted with a
+single bulk_create, so generating a season takes a handful of queries.
+"""
+
+from datetime import datetime, timedelta
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from .cache import SEASONS_TAG, invalidate_tags
+from .models import Fixture, Team
+
+
+# Weekday number (as returned by date.weekday) for each Team.home_day
+WEEKDAYS = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+}
+
+
+def get_round_robin_rounds(teams):
+    """
+    Pairs teams into rounds using the circle method so that every team
+    plays every other team once at home and once away.
+
+    The first half of the rounds is a single round-robin; the second half
+    repeats it with home and away teams swapped. With an odd number of
+    teams, one team has a bye in each round.
+
+    Args:
+        teams (list): The teams to pair.
+
+    Returns:
+        list[list[tuple]]: The (home_team, away_team) pairs in each round.
+    """
+    teams = list(teams)
+    if len(teams) < 2:
+        return []
+    if len(teams) % 2:
+        teams.append(None)  # Bye
+
+    num_teams = len(teams)
+    first_leg = []
+    for round_num in range(num_teams - 1):
+        pairs = []
+        for i in range(num_teams // 2):
+            team1, team2 = teams[i], teams[num_teams - 1 - i]
+            if team1 is None or team2 is None:
+                continue
+            # Alternate home and away between rounds
+            if round_num % 2:
+                team1, team2 = team2, team1
+            pairs.append((team1, team2))
+        first_leg.append(pairs)
+
+        # Rotate every team except the first
+        teams = [teams[0], teams[-1]] + teams[1:-1]
+
+    second_leg = [
+        [(away, home) for home, away in pairs] for pairs in first_leg
+    ]
+    return first_leg + second_leg
+
+
+def get_fixture_datetime(week, team):
+    """
+    Returns the (timezone aware) date and time of a team's home match in
+    the specified week.
+    """
+    offset = (WEEKDAYS[team.home_day] - week.start_date.weekday()) % 7
+    match_date = week.start_date + timedelta(days=offset)
+    return timezone.make_aware(datetime.combine(match_date, team.home_time))
+
+
+def build_season_fixtures(season):
+    """
+    Builds (but does not save) a double round-robin fixture list for every
+    division in a season.
+
+    Args:
+        season (Season): The season to build fixtures for.
+
+    Returns:
+        list[Fixture]: The unsaved, validated fixtures.
+
+    Raises:
+        ValidationError: If a division already has fixtures, the season has
+                         too few weeks or a fixture fails validation.
+    """
+    weeks = list(season.season_weeks.order_by("start_date"))
+    divisions = list(season.divisions.all())
+
+    teams_by_division = {division.id: [] for division in divisions}
+    teams_qs = Team.objects.filter(season=season, approved=True).order_by(
+        "team_name"
+    )
+    for team in teams_qs:
+        # Share loaded objects so Fixture.clean does not query for them
+        team.season = season
+        if team.division_id in teams_by_division:
+            teams_by_division[team.division_id].append(team)
+
+    scheduled = set(
+        Fixture.objects.filter(season=season)
+        .order_by()
+        .values_list("division__name", flat=True)
+        .distinct()
+    )
+    if scheduled:
+        raise ValidationError(
+            "Fixtures already exist for "
+            f"{', '.join(sorted(scheduled))} in {season}."
+        )
+
+    fixtures = []
+    for division in divisions:
+        rounds = get_round_robin_rounds(teams_by_division[division.id])
+        if len(rounds) > len(weeks):
+            raise ValidationError(
+                f"{division} needs {len(rounds)} weeks but {season} only "
+                f"has {len(weeks)}."
+            )
+
+        for week, pairs in zip(weeks, rounds):
+            for home_team, away_team in pairs:
+                home_team.division = division
+                away_team.division = division
+                fixture = Fixture(
+                    season=season,
+                    division=division,
+                    week=week,
+                    datetime=get_fixture_datetime(week, home_team),
+                    home_team=home_team,
+                    away_team=away_team,
+                    venue_id=home_team.home_venue_id,
+                    home_club_id=home_team.club_id,
+                    away_club_id=away_team.club_id,
+                )
+                fixture.clean()
+                fixtures.append(fixture)
+
+    return fixtures
+
+
+def generate_season_fixtures(season):
+    """
+    Generates and saves a double round-robin fixture list for every
+    division in a season in one transaction.
+
+    bulk_create does not send signals, so cached league pages are
+    invalidated here.
+
+    Args:
+        season (Season): The season to generate fixtures for.
+
+    Returns:
+        list[Fixture]: The created fixtures.
+
+    Raises:
+        ValidationError: See build_season_fixtures.
+    """
+    with transaction.atomic():
+        fixtures = Fixture.objects.bulk_create(build_season_fixtures(season))
+        invalidate_tags([SEASONS_TAG])
+    return fixtures
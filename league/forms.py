@@ -1,6 +1,55 @@
 from django import forms
 from django.core.exceptions import ValidationError
+from django.forms.models import ModelChoiceIterator
 from .models import DoublesMatch, Season
+from .scorecard import build_scorecard, parse_game_scores
+from .seasons import get_season_store
+
+
+class StoredChoiceIterator(ModelChoiceIterator):
+    """Iterates over a StoredModelChoiceField's records."""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for record in self.field.records:
+            yield self.choice(record)
+
+    def __len__(self):
+        return len(self.field.records) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.field.records)
+
+
+class StoredModelChoiceField(forms.ModelChoiceField):
+    """
+    A ModelChoiceField choosing from model instances already held in memory
+    (e.g. the seasons in league/seasons.py) rather than from its queryset,
+    so listing and validating the choices runs no queries. The queryset
+    only identifies the model.
+    """
+
+    iterator = StoredChoiceIterator
+
+    def __init__(self, queryset, *, records=(), **kwargs):
+        super().__init__(queryset, **kwargs)
+        self.records = list(records)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        key = self.to_field_name or "pk"
+        if isinstance(value, self.queryset.model):
+            value = getattr(value, key)
+        for record in self.records:
+            if str(getattr(record, key)) == str(value):
+                return record
+        raise ValidationError(
+            self.error_messages["invalid_choice"],
+            code="invalid_choice",
+            params={"value": value},
+        )
 
 
 class DoublesMatchAdminForm(forms.ModelForm):
@@ -66,7 +115,7 @@ class DoublesMatchAdminForm(forms.ModelForm):
 
 
 class LeagueTableForm(forms.Form):
-    season = forms.ModelChoiceField(
+    season = StoredModelChoiceField(
         queryset=Season.objects.filter(is_visible=True),
         to_field_name="slug",
         label="Season",
@@ -74,9 +123,111 @@ class LeagueTableForm(forms.Form):
         required=True,
     )
 
+    def __init__(self, *args, request=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        store = get_season_store(request)
+        self.fields["season"].records = store.visible
+        if not self.data.get("season") and store.current:
+            self.initial["season"] = store.current.slug
+
+
+class ScorecardForm(forms.Form):
+    """
+    Form for entering a complete scorecard for a fixture.
+
+    Three home and three away players are selected and each home player
+    plays each away player, followed by one doubles match. Game scores are
+    entered as text (e.g. "11-5, 9-11, 11-7"). On success, the unsaved
+    records built by build_scorecard are available as 'scorecard'.
+
+    Requires 'fixture' and 'players' keyword arguments (see
+    get_scorecard_fixtures and get_scorecard_players).
+    """
+
+    PLAYERS_PER_TEAM = 3
+    GAMES_HELP_TEXT = "Game scores, e.g. 11-5, 9-11, 11-7"
+
     def __init__(self, *args, **kwargs):
+        self.fixture = kwargs.pop("fixture")
+        self.players = kwargs.pop("players")
+        self.scorecard = None
         super().__init__(*args, **kwargs)
-        if not self.data.get("season"):
-            current_season = Season.objects.filter(is_current=True).first()
-            if current_season:
-                self.initial["season"] = current_season.slug
+
+        home_team = self.fixture.home_team.team_name
+        away_team = self.fixture.away_team.team_name
+        for side, team_name in (("home", home_team), ("away", away_team)):
+            choices = [("", "---------")] + [
+                (team_player.id, str(team_player))
+                for team_player in self.players[side].values()
+            ]
+            for num in self.get_player_numbers():
+                self.fields[f"{side}_player_{num}"] = forms.TypedChoiceField(
+                    label=f"{team_name} player {num}",
+                    choices=choices,
+                    coerce=int,
+                )
+            for num in (1, 2):
+                self.fields[f"doubles_{side}_player_{num}"] = (
+                    forms.TypedChoiceField(
+                        label=f"{team_name} doubles player {num}",
+                        choices=choices,
+                        coerce=int,
+                    )
+                )
+
+        for home_num, away_num in self.get_singles_pairings():
+            self.fields[f"singles_{home_num}_{away_num}"] = forms.CharField(
+                label=f"Home player {home_num} vs Away player {away_num}",
+                help_text=self.GAMES_HELP_TEXT,
+            )
+        self.fields["doubles_games"] = forms.CharField(
+            label="Doubles", help_text=self.GAMES_HELP_TEXT
+        )
+
+    def get_player_numbers(self):
+        return range(1, self.PLAYERS_PER_TEAM + 1)
+
+    def get_singles_pairings(self):
+        """Returns the (home, away) player numbers for each singles match."""
+        return [
+            (home_num, away_num)
+            for home_num in self.get_player_numbers()
+            for away_num in self.get_player_numbers()
+        ]
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if self.errors:
+            return cleaned_data
+
+        try:
+            singles = [
+                {
+                    "home_player": cleaned_data[f"home_player_{home_num}"],
+                    "away_player": cleaned_data[f"away_player_{away_num}"],
+                    "games": parse_game_scores(
+                        cleaned_data[f"singles_{home_num}_{away_num}"]
+                    ),
+                }
+                for home_num, away_num in self.get_singles_pairings()
+            ]
+            doubles = {
+                "home_players": [
+                    cleaned_data["doubles_home_player_1"],
+                    cleaned_data["doubles_home_player_2"],
+                ],
+                "away_players": [
+                    cleaned_data["doubles_away_player_1"],
+                    cleaned_data["doubles_away_player_2"],
+                ],
+                "games": parse_game_scores(cleaned_data["doubles_games"]),
+            }
+            self.scorecard = build_scorecard(
+                self.fixture,
+                {"singles": singles, "doubles": doubles},
+                self.players,
+            )
+        except ValidationError as error:
+            raise ValidationError(error.messages)
+
+        return cleaned_data
@@ -0,0 +1,292 @@
+"""
+iCalendar (.ics) fixture feeds for a team, a club or a division.
+
+Feeds are written directly in the iCalendar format (RFC 5545) and streamed
+one fixture at a time from a values queryset iterator, so large feeds are
+never built in memory. Feeds support conditional GET requests (see
+league/conditional.py) as calendar applications poll them regularly.
+"""
+
+from datetime import timedelta, timezone as dt_timezone
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.http import require_GET
+from clubs.models import Club, Venue
+from .conditional import conditional_page
+from .membership import get_club_fixtures_q
+from .models import Division, Fixture, Season, Team, Week
+
+
+# Constants
+MATCH_DURATION = timedelta(hours=3)
+ITERATOR_CHUNK_SIZE = 500
+MAX_LINE_OCTETS = 75
+
+# Calendar event status for each fixture status
+EVENT_STATUS = {
+    "scheduled": "CONFIRMED",
+    "completed": "CONFIRMED",
+    "postponed": "TENTATIVE",
+    "cancelled": "CANCELLED",
+}
+
+# Columns used to build each calendar event
+EVENT_FIELDS = [
+    "id",
+    "datetime",
+    "status",
+    "updated_on",
+    "home_team__team_name",
+    "away_team__team_name",
+    "venue__name",
+    "week__name",
+    "week__details",
+    "division__name",
+    "season__name",
+]
+
+
+# Helper functions
+def escape_text(value):
+    """Escapes a value for use in an iCalendar text property."""
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line):
+    """
+    Folds a content line so that no line exceeds 75 octets, as required by
+    RFC 5545 (continuation lines start with a space).
+    """
+    encoded = line.encode("utf-8")
+    if len(encoded) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+
+    lines = []
+    current = ""
+    limit = MAX_LINE_OCTETS
+    for char in line:
+        if len((current + char).encode("utf-8")) > limit:
+            lines.append(current)
+            current = ""
+            limit = MAX_LINE_OCTETS - 1  # Allow for the leading space
+        current += char
+    lines.append(current)
+    return "\r\n ".join(lines) + "\r\n"
+
+
+def format_datetime(value):
+    """Formats a datetime in UTC for an iCalendar property."""
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def build_event(fixture, host):
+    """
+    Builds the VEVENT component for a fixture.
+
+    Args:
+        fixture (dict): Fixture values (see EVENT_FIELDS).
+        host (str): The site host, used to make event UIDs globally unique.
+
+    Returns:
+        str: The folded content lines for the event.
+    """
+    summary = (
+        f"{fixture['home_team__team_name']} vs "
+        f"{fixture['away_team__team_name']}"
+    )
+    week = fixture["week__name"]
+    if fixture["week__details"]:
+        week += f" ({fixture['week__details']})"
+    description = (
+        f"{fixture['season__name']} {fixture['division__name']}\n{week}"
+    )
+    if fixture["status"] in ("postponed", "cancelled"):
+        summary += f" ({fixture['status'].title()})"
+
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:fixture-{fixture['id']}@{host}",
+        f"DTSTAMP:{format_datetime(fixture['updated_on'])}",
+        f"DTSTART:{format_datetime(fixture['datetime'])}",
+        f"DTEND:{format_datetime(fixture['datetime'] + MATCH_DURATION)}",
+        f"SUMMARY:{escape_text(summary)}",
+        f"DESCRIPTION:{escape_text(description)}",
+        f"STATUS:{EVENT_STATUS.get(fixture['status'], 'CONFIRMED')}",
+    ]
+    if fixture["venue__name"]:
+        lines.append(f"LOCATION:{escape_text(fixture['venue__name'])}")
+    lines.append("END:VEVENT")
+    return "".join(fold_line(line) for line in lines)
+
+
+def stream_calendar(name, fixtures_qs, host):
+    """
+    Yields an iCalendar document containing an event for each fixture.
+
+    Args:
+        name (str): The calendar name.
+        fixtures_qs (QuerySet[Fixture]): The fixtures to include.
+        host (str): The site host.
+    """
+    yield "".join(
+        fold_line(line)
+        for line in [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//City and District Table Tennis League//Fixtures//EN",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{escape_text(name)}",
+        ]
+    )
+
+    fixtures = (
+        fixtures_qs.order_by("datetime", "id")
+        .values(*EVENT_FIELDS)
+        .iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+    )
+    for fixture in fixtures:
+        yield build_event(fixture, host)
+
+    yield fold_line("END:VCALENDAR")
+
+
+def calendar_response(request, name, filename, fixtures_qs):
+    """Returns a streaming iCalendar response for the fixtures."""
+    response = StreamingHttpResponse(
+        stream_calendar(name, fixtures_qs, request.get_host()),
+        content_type="text/calendar; charset=utf-8",
+    )
+    response["Content-Disposition"] = f'inline; filename="{filename}.ics"'
+    return response
+
+
+def get_feed_season(request):
+    """
+    Returns the visible season for the 'season' GET parameter, defaulting to
+    the current season.
+
+    Raises:
+        Http404: If the season does not exist.
+    """
+    seasons = Season.objects.filter(is_visible=True)
+    slug = request.GET.get("season")
+    if slug:
+        return get_object_or_404(seasons, slug=slug)
+    return get_object_or_404(seasons, is_current=True)
+
+
+def get_season_filter(request):
+    """
+    Returns field lookups for the season in the 'season' GET parameter
+    (defaults to current season).
+    """
+    slug = request.GET.get("season")
+    if slug:
+        return {"season__slug": slug}
+    return {"season__is_current": True}
+
+
+# Conditional GET scopes
+def get_team_feed_scope(request, team_id):
+    """Returns the querysets included in a team's calendar feed."""
+    in_team = Q(home_team_id=team_id) | Q(away_team_id=team_id)
+    return [
+        Season.objects.all(),
+        Division.objects.all(),
+        Venue.objects.all(),
+        Team.objects.filter(season__season_teams=team_id),
+        Week.objects.filter(season__season_teams=team_id),
+        Fixture.objects.filter(in_team),
+    ]
+
+
+def get_club_feed_scope(request, club_id):
+    """Returns the querysets included in a club's calendar feed."""
+    return [
+        Season.objects.all(),
+        Club.objects.filter(id=club_id),
+        Division.objects.all(),
+        Venue.objects.all(),
+        Team.objects.filter(**get_season_filter(request)),
+        Week.objects.filter(**get_season_filter(request)),
+        Fixture.objects.filter(
+            get_club_fixtures_q(club_id), **get_season_filter(request)
+        ),
+    ]
+
+
+def get_division_feed_scope(request, division_id):
+    """Returns the querysets included in a division's calendar feed."""
+    return [
+        Season.objects.all(),
+        Division.objects.all(),
+        Venue.objects.all(),
+        Team.objects.filter(**get_season_filter(request)),
+        Week.objects.filter(**get_season_filter(request)),
+        Fixture.objects.filter(
+            division_id=division_id, **get_season_filter(request)
+        ),
+    ]
+
+
+# View functions
+@require_GET
+@conditional_page(get_team_feed_scope)
+def team_calendar(request, team_id):
+    """Streams the fixtures for a team as an iCalendar feed."""
+    team = get_object_or_404(Team.objects.select_related("season"), id=team_id)
+    fixtures_qs = Fixture.objects.filter(
+        Q(home_team=team) | Q(away_team=team)
+    )
+    return calendar_response(
+        request,
+        f"{team.team_name} ({team.season.short_name})",
+        f"team-{team.id}",
+        fixtures_qs,
+    )
+
+
+@require_GET
+@conditional_page(get_club_feed_scope)
+def club_calendar(request, club_id):
+    """
+    Streams the home and away fixtures for a club's teams in a season
+    (defaults to current season) as an iCalendar feed.
+    """
+    club = get_object_or_404(Club, id=club_id)
+    season = get_feed_season(request)
+    fixtures_qs = Fixture.objects.filter(
+        get_club_fixtures_q(club.id), season=season
+    )
+    return calendar_response(
+        request,
+        f"{club.name} ({season.short_name})",
+        f"club-{club.id}-{season.slug}",
+        fixtures_qs,
+    )
+
+
+@require_GET
+@conditional_page(get_division_feed_scope)
+def division_calendar(request, division_id):
+    """
+    Streams the fixtures for a division in a season (defaults to current
+    season) as an iCalendar feed.
+    """
+    division = get_object_or_404(Division, id=division_id)
+    season = get_feed_season(request)
+    fixtures_qs = Fixture.objects.filter(division=division, season=season)
+    return calendar_response(
+        request,
+        f"{division.name} ({season.short_name})",
+        f"division-{division.id}-{season.slug}",
+        fixtures_qs,
+    )
@@ -0,0 +1,226 @@
+"""
+Per-request metrics for finding which pages spend the most time in the
+database, templates and cache.
+
+RequestMetricsMiddleware records the number and total duration of database
+queries, the time spent rendering templates and the number of league cache
+hits and misses for every request. The metrics are written as one JSON log
+line per request (logger "league.requests") and added to the response in a
+Server-Timing header, which browser developer tools display alongside the
+request timings. The header is only added for staff users or a sampled
+fraction of requests (REQUEST_METRICS_SAMPLE_RATE in settings.py).
+
+Database queries run while a template renders (e.g. lazy related objects)
+are counted in both the database and template timings.
+
+Streamed responses (e.g. the full-season fixtures and results pages) are
+measured until the stream closes, and their log line is written then with
+"streamed" set. Headers are sent before the body, so their Server-Timing
+header only covers the time taken to start the response.
+
+The middleware is installed after AuthenticationMiddleware, so the user is
+known when deciding whether to send the header. Template timings need
+django.template.base.Template.render to be wrapped for the whole process
+(Django only sends its template_rendered signal while running tests), so
+the wrapper is only installed when REQUEST_METRICS_ENABLED is set; when it
+is not, the middleware is removed and nothing is wrapped.
+"""
+
+import json
+import logging
+import random
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.template.base import Template
+
+
+logger = logging.getLogger("league.requests")
+
+# Metrics for the request being handled in the current thread (or task)
+_current_metrics = ContextVar("league_request_metrics", default=None)
+
+
+class RequestMetrics:
+    """Totals recorded while handling a single request."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.rendering = False
+
+
+# Helper functions
+def get_current_metrics():
+    """Returns the metrics for the current request (or None)."""
+    return _current_metrics.get()
+
+
+def record_cache_lookups(hits=0, misses=0):
+    """
+    Records cache hits and misses against the current request, if its
+    metrics are being recorded.
+    """
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.cache_hits += hits
+        metrics.cache_misses += misses
+
+
+def time_query(execute, sql, params, many, context):
+    """Database execute wrapper which counts and times each query."""
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    start = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_time += perf_counter() - start
+        metrics.queries += 1
+
+
+def install_template_timer():
+    """
+    Wraps Template.render so the time spent rendering templates is added to
+    the current request's metrics. Included and extended templates render
+    within their parent, so only the outermost render is timed.
+    """
+    if getattr(Template.render, "records_request_metrics", False):
+        return
+    render = Template.render
+
+    def timed_render(self, context):
+        metrics = _current_metrics.get()
+        if metrics is None or metrics.rendering:
+            return render(self, context)
+
+        metrics.rendering = True
+        start = perf_counter()
+        try:
+            return render(self, context)
+        finally:
+            metrics.template_time += perf_counter() - start
+            metrics.rendering = False
+
+    timed_render.records_request_metrics = True
+    Template.render = timed_render
+
+
+@contextmanager
+def recording(metrics):
+    """Records the queries made within the block against the metrics."""
+    token = _current_metrics.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(time_query))
+            yield
+    finally:
+        _current_metrics.reset(token)
+
+
+def log_metrics(request, response, metrics, total_time):
+    """Writes the log line for a request's metrics."""
+    match = getattr(request, "resolver_match", None)
+    fields = {
+        "method": request.method,
+        "path": request.path,
+        "view": match.view_name if match else None,
+        "status": response.status_code,
+        "streamed": response.streaming,
+        "total_ms": round(total_time * 1000, 2),
+        "db_ms": round(metrics.db_time * 1000, 2),
+        "queries": metrics.queries,
+        "template_ms": round(metrics.template_time * 1000, 2),
+        "cache_hits": metrics.cache_hits,
+        "cache_misses": metrics.cache_misses,
+    }
+    logger.info(json.dumps(fields), extra={"request_metrics": fields})
+
+
+def get_server_timing(metrics, total_time):
+    """
+    Builds the Server-Timing header value for the request metrics.
+
+    Returns:
+        str: e.g. 'db;dur=4.20;desc="12 queries", tpl;dur=3.10, ...'
+    """
+    return ", ".join(
+        [
+            f'db;dur={metrics.db_time * 1000:.2f};'
+            f'desc="{metrics.queries} queries"',
+            f"tpl;dur={metrics.template_time * 1000:.2f}",
+            f'cache;desc="{metrics.cache_hits} hits, '
+            f'{metrics.cache_misses} misses"',
+            f"total;dur={total_time * 1000:.2f}",
+        ]
+    )
+
+
+def should_expose_metrics(request):
+    """
+    Returns True if the Server-Timing header should be added to the
+    response (for staff users or a sample of other requests).
+    """
+    sample_rate = getattr(settings, "REQUEST_METRICS_SAMPLE_RATE", 0)
+    if sample_rate and random.random() < sample_rate:
+        return True
+    user = getattr(request, "user", None)
+    return bool(user and user.is_staff)
+
+
+# Middleware
+class RequestMetricsMiddleware:
+    """
+    Records query, template and cache metrics for each request, logs them
+    and adds a Server-Timing header for staff or sampled requests.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_METRICS_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        install_template_timer()
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        start = perf_counter()
+        with recording(metrics):
+            response = self.get_response(request)
+
+        if should_expose_metrics(request):
+            response["Server-Timing"] = get_server_timing(
+                metrics, perf_counter() - start
+            )
+        if response.streaming and not response.is_async:
+            response.streaming_content = self.stream_content(
+                request, response, response.streaming_content, metrics, start
+            )
+        else:
+            log_metrics(request, response, metrics, perf_counter() - start)
+        return response
+
+    def stream_content(self, request, response, content, metrics, start):
+        """
+        Yields the chunks of a streamed response, recording the metrics
+        while each is produced, and logs the metrics once the stream closes
+        (when it is finished or the client disconnects).
+        """
+        chunks = iter(content)
+        try:
+            while True:
+                with recording(metrics):
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            log_metrics(request, response, metrics, perf_counter() - start)
@@ -0,0 +1,49 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from league.export import ExportError, export_season, get_export_dir
+from league.models import Season
+
+
+class Command(BaseCommand):
+    """
+    Renders every public page of a finished season to static files under
+    STATIC_ROOT/seasons/<slug>/ for WhiteNoise to serve (see
+    league/export.py). Only pages whose content changed are rewritten.
+
+    Usage:
+        python manage.py export_season 23-24
+        python manage.py export_season 23-24 --workers 4
+    """
+
+    help = "Export every public page of a finished season as static HTML."
+
+    def add_arguments(self, parser):
+        parser.add_argument("season", metavar="SLUG", help="Season slug.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of worker processes. Defaults to the CPU count.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            season = Season.objects.get(slug=options["season"])
+        except Season.DoesNotExist:
+            raise CommandError(f"Season not found: {options['season']}")
+        if options["workers"] is not None and options["workers"] < 1:
+            raise CommandError("--workers must be at least 1.")
+
+        try:
+            counts = export_season(season, workers=options["workers"])
+        except ValidationError as error:
+            raise CommandError(" ".join(error.messages))
+        except ExportError as error:
+            raise CommandError(str(error))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {season} to {get_export_dir(season)}: "
+                f"{counts['written']} page(s) written, "
+                f"{counts['unchanged']} unchanged, "
+                f"{counts['removed']} removed."
+            )
+        )
@@ -0,0 +1,52 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from league.archive import finalize_season
+from league.models import Season, SeasonArchive
+
+
+class Command(BaseCommand):
+    """
+    Stores a frozen snapshot of a completed season, from which its results,
+    tables, team summaries and result breakdowns are then served (see
+    league/archive.py). Run it again after correcting an archived season's
+    records, or remove the snapshot to serve the season from its records.
+
+    Usage:
+        python manage.py finalize_season 23-24
+        python manage.py finalize_season 23-24 --remove
+    """
+
+    help = "Archive a completed season as an immutable snapshot."
+
+    def add_arguments(self, parser):
+        parser.add_argument("season", metavar="SLUG", help="Season slug.")
+        parser.add_argument(
+            "--remove",
+            action="store_true",
+            help="Remove the season's snapshot instead.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            season = Season.objects.get(slug=options["season"])
+        except Season.DoesNotExist:
+            raise CommandError(f"Season not found: {options['season']}")
+
+        if options["remove"]:
+            deleted, _ = SeasonArchive.objects.filter(season=season).delete()
+            if not deleted:
+                raise CommandError(f"{season} is not archived.")
+            self.stdout.write(
+                self.style.SUCCESS(f"Removed the archive of {season}.")
+            )
+            return
+
+        try:
+            archive = finalize_season(season)
+        except ValidationError as error:
+            raise CommandError(" ".join(error.messages))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {season} ({len(archive.snapshot) / 1024:.1f} KB)."
+            )
+        )
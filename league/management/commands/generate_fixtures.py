@@ -0,0 +1,35 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from league.fixture_generator import generate_season_fixtures
+from league.models import Season
+
+
+class Command(BaseCommand):
+    """
+    Generates a double round-robin fixture list for every division in a
+    season.
+
+    Usage:
+        python manage.py generate_fixtures 24-25
+    """
+
+    help = "Generate a double round-robin fixture list for a season."
+
+    def add_arguments(self, parser):
+        parser.add_argument("season", metavar="SLUG", help="Season slug.")
+
+    def handle(self, *args, **options):
+        season = Season.objects.filter(slug=options["season"]).first()
+        if season is None:
+            raise CommandError(f"Season not found: {options['season']}")
+
+        try:
+            fixtures = generate_season_fixtures(season)
+        except ValidationError as error:
+            raise CommandError(" ".join(error.messages))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {len(fixtures)} fixture(s) for {season}."
+            )
+        )
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+from league.membership import rebuild_club_membership
+from league.models import Season
+from league.standings import rebuild_league_standings
+
+
+class Command(BaseCommand):
+    """
+    Recalculates the stored league standings from fixture results, and the
+    club membership used to filter fixtures by club from the teams.
+
+    Usage:
+        python manage.py rebuild_standings
+        python manage.py rebuild_standings --season 24-25
+    """
+
+    help = (
+        "Recalculate stored league standings and club membership from "
+        "fixture results and teams."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--season",
+            action="append",
+            dest="seasons",
+            metavar="SLUG",
+            help="Season slug to rebuild (can be repeated). Defaults to all.",
+        )
+
+    def handle(self, *args, **options):
+        seasons = Season.objects.all()
+        slugs = options["seasons"]
+        if slugs:
+            seasons = seasons.filter(slug__in=slugs)
+            missing = set(slugs) - set(seasons.values_list("slug", flat=True))
+            if missing:
+                raise CommandError(
+                    f"Season not found: {', '.join(sorted(missing))}"
+                )
+
+        rebuild_club_membership(seasons)
+        count = rebuild_league_standings(seasons)
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt standings for {count} team(s).")
+        )
@@ -0,0 +1,117 @@
+from argparse import ArgumentTypeError
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.text import slugify
+from clubs.models import Club
+from league.models import Division, Season
+from league.synthetic import DEFAULT_BATCH_SIZE, create_synthetic_league
+
+
+# Keeps generated team names within Team.team_name's 30 characters
+MAX_PREFIX_LENGTH = 12
+
+
+def positive_int(value):
+    """Argument type for integers of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError("must be at least 1")
+    return number
+
+
+class Command(BaseCommand):
+    """
+    Generates a large synthetic league (clubs, players, seasons, divisions,
+    teams, registrations, fixtures and full scorecards with game scores)
+    for load testing and capacity planning.
+
+    The same options and seed always produce the same results. Records are
+    named using the prefix so a league can be added alongside existing data.
+
+    Usage:
+        python manage.py seed_league
+        python manage.py seed_league --seasons 10 --divisions 8 --teams 20
+        python manage.py seed_league --seed 42 --prefix "Load Test"
+    """
+
+    help = "Generate a synthetic league for load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seasons",
+            type=positive_int,
+            default=3,
+            help="Number of seasons (default 3).",
+        )
+        parser.add_argument(
+            "--divisions",
+            type=positive_int,
+            default=4,
+            help="Number of divisions per season (default 4).",
+        )
+        parser.add_argument(
+            "--teams",
+            type=positive_int,
+            default=10,
+            help="Number of teams (and clubs) per division (default 10).",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed for the random results (default 0).",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="Synthetic",
+            help="Prefix for club, division and season names.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=positive_int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Rows per insert (default {DEFAULT_BATCH_SIZE}).",
+        )
+        parser.add_argument(
+            "--keep-current",
+            action="store_true",
+            help="Do not make the last synthetic season the current season.",
+        )
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"].strip()
+        if options["teams"] < 2:
+            raise CommandError("At least 2 teams per division are required.")
+        if not slugify(prefix) or len(prefix) > MAX_PREFIX_LENGTH:
+            raise CommandError(
+                "The prefix must contain letters or numbers and be at most "
+                f"{MAX_PREFIX_LENGTH} characters."
+            )
+        slug_prefix = f"{slugify(prefix)[:10]}-"
+        if (
+            Club.objects.filter(name__startswith=f"{prefix} Club ").exists()
+            or Division.objects.filter(name__startswith=prefix).exists()
+            or Season.objects.filter(slug__startswith=slug_prefix).exists()
+        ):
+            raise CommandError(
+                f"A league with the prefix '{prefix}' already exists. "
+                "Use a different --prefix."
+            )
+
+        counts = create_synthetic_league(
+            options["seasons"],
+            options["divisions"],
+            options["teams"],
+            seed=options["seed"],
+            prefix=prefix,
+            batch_size=options["batch_size"],
+            make_current=not options["keep_current"],
+            log=self.stdout.write,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {counts['seasons']} season(s) with "
+                f"{counts['fixtures']} fixture(s), {counts['results']} "
+                f"result(s) and {counts['games']} game(s)."
+            )
+        )
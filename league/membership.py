@@ -0,0 +1,130 @@
+"""
+Denormalised club membership used to filter fixtures and results by club.
+
+Fixture.home_club and Fixture.away_club copy the clubs of the fixture's
+teams, so a club filter is an indexed lookup on the fixture table rather
+than a join through both teams. SeasonClub lists the clubs with a team in
+each division of a season for the club filter dropdown, which each worker
+process keeps in memory (see league/seasons.py) until SeasonClub records
+are rebuilt or a club changes.
+
+Both are kept in sync with Team records by league/signals.py. Records
+created in bulk (or loaded with loaddata) can be brought up to date with
+the rebuild_standings management command.
+"""
+
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+from .cache import SEASON_LIST_TAG, invalidate_tags
+from .models import Fixture, Season, SeasonClub, Team
+
+
+def get_club_fixtures_q(club_id):
+    """
+    Matches fixtures where the club is the home or away team.
+
+    Args:
+        club_id (int): The ID of the club.
+
+    Returns:
+        Q: A filter for Fixture querysets.
+    """
+    return Q(home_club_id=club_id) | Q(away_club_id=club_id)
+
+
+def get_season_club_options(season):
+    """
+    Lists the clubs with a team in the season, for the club filter.
+
+    Args:
+        season (Season): The season.
+
+    Returns:
+        dict: The clubs in the whole season (under None) and in each
+              division (under the division ID as a string), each listed
+              once in name order.
+    """
+    memberships = (
+        SeasonClub.objects.filter(season=season)
+        .select_related("club")
+        .order_by("club__name")
+    )
+    options = {}
+    season_clubs = {}
+    for membership in memberships:
+        options.setdefault(str(membership.division_id), []).append(
+            membership.club
+        )
+        season_clubs.setdefault(membership.club_id, membership.club)
+    options[None] = list(season_clubs.values())
+    return options
+
+
+def refresh_season_clubs(season_ids):
+    """
+    Rebuilds the SeasonClub records for the specified seasons from their
+    teams, then has each worker reload its club filter options.
+
+    Args:
+        season_ids (Iterable[int]): IDs of the seasons to refresh.
+    """
+    season_ids = set(season_ids) - {None}
+    if not season_ids:
+        return
+    rows = (
+        Team.objects.filter(season_id__in=season_ids)
+        .values_list("season_id", "division_id", "club_id")
+        .order_by()
+        .distinct()
+    )
+    with transaction.atomic():
+        SeasonClub.objects.filter(season_id__in=season_ids).delete()
+        SeasonClub.objects.bulk_create(
+            [
+                SeasonClub(
+                    season_id=season_id,
+                    division_id=division_id,
+                    club_id=club_id,
+                )
+                for season_id, division_id, club_id in rows
+            ]
+        )
+        invalidate_tags([SEASON_LIST_TAG])
+
+
+def refresh_fixture_clubs(fixtures):
+    """
+    Copies the clubs of each fixture's teams to its home_club and
+    away_club fields in a single UPDATE.
+
+    Args:
+        fixtures (QuerySet[Fixture]): The fixtures to refresh.
+
+    Returns:
+        int: The number of fixtures updated.
+    """
+
+    def team_club(field):
+        return Subquery(
+            Team.objects.filter(pk=OuterRef(field)).values("club_id")[:1]
+        )
+
+    return fixtures.update(
+        home_club_id=team_club("home_team"),
+        away_club_id=team_club("away_team"),
+    )
+
+
+def rebuild_club_membership(seasons=None):
+    """
+    Rebuilds the fixture clubs and SeasonClub records from scratch.
+
+    Args:
+        seasons (QuerySet[Season], optional): Limits the rebuild to these
+                                              seasons. Defaults to all.
+    """
+    if seasons is None:
+        seasons = Season.objects.all()
+    season_ids = list(seasons.values_list("id", flat=True))
+    refresh_fixture_clubs(Fixture.objects.filter(season_id__in=season_ids))
+    refresh_season_clubs(season_ids)
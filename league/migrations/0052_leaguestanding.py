@@ -0,0 +1,121 @@
+# Generated by Django 4.2.20 on 2026-10-17 01:04
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+BATCH_SIZE = 1000
+POINTS_FOR_WIN = 2
+POINTS_FOR_DRAW = 1
+
+
+def backfill_standings(apps, schema_editor):
+    """
+    Builds the standing of every existing team from its results, as
+    standings.rebuild_league_standings does. The individual sets are
+    totalled from the singles and doubles matches, as they are not yet
+    stored on the results.
+    """
+    DoublesMatch = apps.get_model("league", "DoublesMatch")
+    FixtureResult = apps.get_model("league", "FixtureResult")
+    LeagueStanding = apps.get_model("league", "LeagueStanding")
+    SinglesMatch = apps.get_model("league", "SinglesMatch")
+    Team = apps.get_model("league", "Team")
+
+    def get_individual_sets(side):
+        singles_sets = (
+            SinglesMatch.objects.filter(fixture_result=OuterRef("pk"))
+            .values("fixture_result")
+            .annotate(total=Sum(f"{side}_sets"))
+            .values("total")
+        )
+        doubles_sets = DoublesMatch.objects.filter(
+            fixture_result=OuterRef("pk")
+        ).values(f"{side}_sets")
+        return Coalesce(Subquery(singles_sets), 0) + Coalesce(
+            Subquery(doubles_sets), 0
+        )
+
+    standings = {
+        team_id: LeagueStanding(
+            team_id=team_id, season_id=season_id, division_id=division_id
+        )
+        for team_id, season_id, division_id in Team.objects.values_list(
+            "id", "season_id", "division_id"
+        )
+    }
+
+    results = (
+        FixtureResult.objects.annotate(
+            home_sets=get_individual_sets("home"),
+            away_sets=get_individual_sets("away"),
+        )
+        .order_by()
+        .values_list(
+            "fixture__home_team_id",
+            "fixture__away_team_id",
+            "winner",
+            "home_score",
+            "away_score",
+            "home_sets",
+            "away_sets",
+        )
+    )
+    for home_id, away_id, winner, *totals in results.iterator(
+        chunk_size=BATCH_SIZE
+    ):
+        home_score, away_score, home_sets, away_sets = totals
+        for side, opponent, team_id, score, sets in (
+            ("home", "away", home_id, home_score, home_sets),
+            ("away", "home", away_id, away_score, away_sets),
+        ):
+            standing = standings.get(team_id)
+            if standing is None:
+                continue
+            standing.played += 1
+            standing.team_sets_won += score or 0
+            standing.individual_sets_won += sets or 0
+            if winner == side:
+                standing.won += 1
+                standing.points += POINTS_FOR_WIN
+            elif winner == "draw":
+                standing.drawn += 1
+                standing.points += POINTS_FOR_DRAW
+            elif winner == opponent:
+                standing.lost += 1
+
+    LeagueStanding.objects.bulk_create(
+        standings.values(), batch_size=BATCH_SIZE
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('league', '0051_alter_doublesgame_doubles_match'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeagueStanding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('played', models.PositiveSmallIntegerField(default=0)),
+                ('won', models.PositiveSmallIntegerField(default=0)),
+                ('drawn', models.PositiveSmallIntegerField(default=0)),
+                ('lost', models.PositiveSmallIntegerField(default=0)),
+                ('team_sets_won', models.PositiveIntegerField(default=0)),
+                ('individual_sets_won', models.PositiveIntegerField(default=0)),
+                ('points', models.PositiveIntegerField(default=0)),
+                ('division', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='division_standings', to='league.division')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='season_standings', to='league.season')),
+                ('team', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='standing', to='league.team')),
+            ],
+            options={
+                'ordering': ['-points', '-won', '-team_sets_won', '-individual_sets_won', 'team__team_name'],
+                'indexes': [models.Index(fields=['season', 'division', '-points', '-won', '-team_sets_won', '-individual_sets_won'], name='standing_table_order_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_standings, migrations.RunPython.noop),
+    ]
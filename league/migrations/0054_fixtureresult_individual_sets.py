@@ -0,0 +1,64 @@
+# Generated by Django 4.2.20 on 2026-10-17 01:55
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+BATCH_SIZE = 1000
+
+
+def backfill_individual_sets(apps, schema_editor):
+    """
+    Stores the individual set totals of existing results, updating the
+    results in batches of ids to keep each UPDATE short.
+    """
+    FixtureResult = apps.get_model("league", "FixtureResult")
+    SinglesMatch = apps.get_model("league", "SinglesMatch")
+    DoublesMatch = apps.get_model("league", "DoublesMatch")
+
+    def get_individual_sets(side):
+        singles_sets = (
+            SinglesMatch.objects.filter(fixture_result=OuterRef("pk"))
+            .values("fixture_result")
+            .annotate(total=Sum(f"{side}_sets"))
+            .values("total")
+        )
+        doubles_sets = DoublesMatch.objects.filter(
+            fixture_result=OuterRef("pk")
+        ).values(f"{side}_sets")
+        return Coalesce(Subquery(singles_sets), 0) + Coalesce(
+            Subquery(doubles_sets), 0
+        )
+
+    result_ids = list(
+        FixtureResult.objects.order_by("id").values_list("id", flat=True)
+    )
+    for start in range(0, len(result_ids), BATCH_SIZE):
+        batch = result_ids[start:start + BATCH_SIZE]
+        FixtureResult.objects.filter(id__in=batch).update(
+            home_individual_sets=get_individual_sets("home"),
+            away_individual_sets=get_individual_sets("away"),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('league', '0053_updated_on'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fixtureresult',
+            name='away_individual_sets',
+            field=models.PositiveSmallIntegerField(default=0, help_text='This field is auto-assigned'),
+        ),
+        migrations.AddField(
+            model_name='fixtureresult',
+            name='home_individual_sets',
+            field=models.PositiveSmallIntegerField(default=0, help_text='This field is auto-assigned'),
+        ),
+        migrations.RunPython(
+            backfill_individual_sets, migrations.RunPython.noop
+        ),
+    ]
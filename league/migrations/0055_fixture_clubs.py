@@ -0,0 +1,104 @@
+# Generated by Django 4.2.20 on 2026-10-17 01:59
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+BATCH_SIZE = 1000
+
+
+def backfill_club_membership(apps, schema_editor):
+    """
+    Copies the team clubs to existing fixtures (in batches of ids) and
+    lists the clubs with teams in each division of every season.
+    """
+    Fixture = apps.get_model("league", "Fixture")
+    SeasonClub = apps.get_model("league", "SeasonClub")
+    Team = apps.get_model("league", "Team")
+
+    def team_club(field):
+        return Subquery(
+            Team.objects.filter(pk=OuterRef(field)).values("club_id")[:1]
+        )
+
+    fixture_ids = list(
+        Fixture.objects.order_by("id").values_list("id", flat=True)
+    )
+    for start in range(0, len(fixture_ids), BATCH_SIZE):
+        batch = fixture_ids[start:start + BATCH_SIZE]
+        Fixture.objects.filter(id__in=batch).update(
+            home_club_id=team_club("home_team"),
+            away_club_id=team_club("away_team"),
+        )
+
+    rows = (
+        Team.objects.values_list("season_id", "division_id", "club_id")
+        .order_by()
+        .distinct()
+    )
+    SeasonClub.objects.bulk_create(
+        [
+            SeasonClub(
+                season_id=season_id, division_id=division_id, club_id=club_id
+            )
+            for season_id, division_id, club_id in rows
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0055_club_updated_on'),
+        ('league', '0054_fixtureresult_individual_sets'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeasonClub',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='fixture',
+            name='away_club',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='away_club_fixtures', to='clubs.club'),
+        ),
+        migrations.AddField(
+            model_name='fixture',
+            name='home_club',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='home_club_fixtures', to='clubs.club'),
+        ),
+        migrations.AddIndex(
+            model_name='fixture',
+            index=models.Index(fields=['season', 'home_club'], name='fixture_season_home_club_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fixture',
+            index=models.Index(fields=['season', 'away_club'], name='fixture_season_away_club_idx'),
+        ),
+        migrations.AddField(
+            model_name='seasonclub',
+            name='club',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='club_seasons', to='clubs.club'),
+        ),
+        migrations.AddField(
+            model_name='seasonclub',
+            name='division',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='division_clubs', to='league.division'),
+        ),
+        migrations.AddField(
+            model_name='seasonclub',
+            name='season',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='season_clubs', to='league.season'),
+        ),
+        migrations.AddConstraint(
+            model_name='seasonclub',
+            constraint=models.UniqueConstraint(fields=('season', 'division', 'club'), name='unique_season_division_club'),
+        ),
+        migrations.RunPython(
+            backfill_club_membership, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.20 on 2026-10-17 02:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('league', '0055_fixture_clubs'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='fixture',
+            index=models.Index(fields=['season', 'division', 'week', 'datetime'], name='fixture_season_division_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='week',
+            index=models.Index(fields=['season', 'start_date'], name='week_season_date_idx'),
+        ),
+    ]
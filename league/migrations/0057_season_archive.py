@@ -0,0 +1,23 @@
+# Generated by Django 4.2.20 on 2026-10-17 02:14
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('league', '0056_league_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeasonArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('snapshot', models.BinaryField()),
+                ('created_on', models.DateTimeField(auto_now_add=True)),
+                ('season', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='archive', to='league.season')),
+            ],
+        ),
+    ]
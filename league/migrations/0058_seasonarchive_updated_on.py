@@ -0,0 +1,20 @@
+# Generated by Django 4.2.20 on 2026-10-17 09:12
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('league', '0057_season_archive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seasonarchive',
+            name='updated_on',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -15,6 +15,7 @@ class Division(models.Model):
 
     name = models.CharField(max_length=50, unique=True)
     rank = models.PositiveSmallIntegerField(unique=True)
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["rank"]
@@ -47,6 +48,7 @@ class Season(models.Model):
     registration_closes = models.DateTimeField()
     is_visible = models.BooleanField(default=True)
     is_current = models.BooleanField(default=False)
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-start_date"]
@@ -125,6 +127,7 @@ class Week(models.Model):
     name = models.CharField(max_length=50)
     details = models.CharField(max_length=100, null=True, blank=True)
     start_date = models.DateField()
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["start_date"]
@@ -134,6 +137,12 @@ class Week(models.Model):
                 fields=["season", "name"], name="unique_season_and_name"
             )
         ]
+        # Weeks are listed by season in date order
+        indexes = [
+            models.Index(
+                fields=["season", "start_date"], name="week_season_date_idx"
+            )
+        ]
 
     def __str__(self):
         return self.name
@@ -165,6 +174,7 @@ class Player(models.Model):
     club_status = models.CharField(
         max_length=10, choices=STATUS_CHOICES, default="pending"
     )
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["surname", "forename"]
@@ -240,6 +250,7 @@ class Team(models.Model):
         verbose_name="Home match start time",
     )
     approved = models.BooleanField(default=False)
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["team_name"]
@@ -296,6 +307,7 @@ class TeamPlayer(models.Model):
         related_name="team_players",
     )
     paid_fees = models.BooleanField(default=False)
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Team players"
@@ -390,6 +402,24 @@ class Fixture(models.Model):
     status = models.CharField(
         max_length=10, choices=STATUS_CHOICES, default="scheduled"
     )
+    # Clubs of the home and away teams, copied when the fixture is saved
+    # and kept in sync by league/signals.py, so fixtures can be filtered by
+    # club without joining the teams
+    home_club = models.ForeignKey(
+        Club,
+        on_delete=models.PROTECT,
+        related_name="home_club_fixtures",
+        null=True,
+        editable=False,
+    )
+    away_club = models.ForeignKey(
+        Club,
+        on_delete=models.PROTECT,
+        related_name="away_club_fixtures",
+        null=True,
+        editable=False,
+    )
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["datetime"]
@@ -399,6 +429,21 @@ class Fixture(models.Model):
                 name="season_with_home_and_away_team_unique",
             )
         ]
+        indexes = [
+            # Fixture and result lists filtered by season and division
+            models.Index(
+                fields=["season", "division", "week", "datetime"],
+                name="fixture_season_division_idx",
+            ),
+            models.Index(
+                fields=["season", "home_club"],
+                name="fixture_season_home_club_idx",
+            ),
+            models.Index(
+                fields=["season", "away_club"],
+                name="fixture_season_away_club_idx",
+            ),
+        ]
 
     def __str__(self):
         return (
@@ -473,8 +518,42 @@ class Fixture(models.Model):
         if not self.venue and self.home_team:
             self.venue = self.home_team.home_venue
 
+        # Copy the team clubs used when filtering fixtures by club
+        clubs = self.get_team_clubs()
+        self.home_club_id = clubs.get(self.home_team_id)
+        self.away_club_id = clubs.get(self.away_team_id)
+
         super().save(*args, **kwargs)
 
+    def get_team_clubs(self):
+        """
+        Returns the club ID of each team set on the fixture, reusing teams
+        already loaded and reading the others with a single query.
+
+        Returns:
+            dict: Team IDs mapped to club IDs.
+        """
+        clubs = {}
+        team_ids = set()
+        for field_name in ["home_team", "away_team"]:
+            field = self._meta.get_field(field_name)
+            team_id = getattr(self, field.attname)
+            if team_id is None:
+                continue
+            if field.is_cached(self):
+                clubs[team_id] = getattr(self, field_name).club_id
+            else:
+                team_ids.add(team_id)
+
+        team_ids -= clubs.keys()
+        if team_ids:
+            clubs.update(
+                Team.objects.filter(id__in=team_ids).values_list(
+                    "id", "club_id"
+                )
+            )
+        return clubs
+
 
 class FixtureResult(models.Model):
     """
@@ -509,6 +588,15 @@ class FixtureResult(models.Model):
     status = models.CharField(
         max_length=10, choices=STATUS_CHOICES, default="played"
     )
+    # Totals of the singles and doubles match sets, kept in sync by
+    # league/signals.py so standings do not need to read every match
+    home_individual_sets = models.PositiveSmallIntegerField(
+        default=0, help_text="This field is auto-assigned"
+    )
+    away_individual_sets = models.PositiveSmallIntegerField(
+        default=0, help_text="This field is auto-assigned"
+    )
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-fixture__datetime"]
@@ -524,6 +612,14 @@ class FixtureResult(models.Model):
         if self.home_score + self.away_score != 10:
             raise ValidationError("Total score must add up to 10.")
 
+    def set_individual_sets(self, matches):
+        """
+        Sets the individual set totals from unsaved singles and doubles
+        matches (used when the matches are created in bulk).
+        """
+        self.home_individual_sets = sum(match.home_sets for match in matches)
+        self.away_individual_sets = sum(match.away_sets for match in matches)
+
     def save(self, *args, **kwargs):
         if self.home_score > self.away_score:
             self.winner = "home"
@@ -570,6 +666,7 @@ class SinglesMatch(models.Model):
         blank=True,
         help_text="This field is auto-assigned",
     )
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Singles matches"
@@ -719,6 +816,7 @@ class DoublesMatch(models.Model):
         blank=True,
         help_text="This field is auto-assigned",
     )
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Doubles matches"
@@ -808,6 +906,7 @@ class SinglesGame(models.Model):
         blank=True,
         help_text="This field is auto-assigned",
     )
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["singles_match", "set_num"]
@@ -905,6 +1004,7 @@ class DoublesGame(models.Model):
         blank=True,
         help_text="This field is auto-assigned",
     )
+    updated_on = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["doubles_match", "set_num"]
@@ -973,3 +1073,108 @@ class DoublesGame(models.Model):
                 "home" if self.home_points > self.away_points else "away"
             )
         super().save(*args, **kwargs)
+
+
+class LeagueStanding(models.Model):
+    """
+    Stores the league table data for a team in a season.
+
+    Each Team has exactly one LeagueStanding record, kept up to date by the
+    signal handlers in league/signals.py whenever results are saved or
+    deleted. The records can be recomputed from scratch using the
+    rebuild_standings management command.
+    """
+
+    team = models.OneToOneField(
+        Team, on_delete=models.CASCADE, related_name="standing"
+    )
+    season = models.ForeignKey(
+        Season, on_delete=models.CASCADE, related_name="season_standings"
+    )
+    division = models.ForeignKey(
+        Division, on_delete=models.CASCADE, related_name="division_standings"
+    )
+    played = models.PositiveSmallIntegerField(default=0)
+    won = models.PositiveSmallIntegerField(default=0)
+    drawn = models.PositiveSmallIntegerField(default=0)
+    lost = models.PositiveSmallIntegerField(default=0)
+    team_sets_won = models.PositiveIntegerField(default=0)
+    individual_sets_won = models.PositiveIntegerField(default=0)
+    points = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = [
+            "-points",
+            "-won",
+            "-team_sets_won",
+            "-individual_sets_won",
+            "team__team_name",
+        ]
+        indexes = [
+            models.Index(
+                fields=[
+                    "season",
+                    "division",
+                    "-points",
+                    "-won",
+                    "-team_sets_won",
+                    "-individual_sets_won",
+                ],
+                name="standing_table_order_idx",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.team} - {self.points} pts"
+
+
+class SeasonClub(models.Model):
+    """
+    Records which clubs have teams in each division of a season.
+
+    Used to list the clubs in a season (or division) for the club filter
+    without joining and de-duplicating every team. The records are rebuilt
+    from Team records whenever teams change (see league/membership.py).
+    """
+
+    season = models.ForeignKey(
+        Season, on_delete=models.CASCADE, related_name="season_clubs"
+    )
+    division = models.ForeignKey(
+        Division, on_delete=models.CASCADE, related_name="division_clubs"
+    )
+    club = models.ForeignKey(
+        Club, on_delete=models.CASCADE, related_name="club_seasons"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["season", "division", "club"],
+                name="unique_season_division_club",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.club} ({self.season} {self.division})"
+
+
+class SeasonArchive(models.Model):
+    """
+    An immutable snapshot of everything the results, tables, team summary
+    and result breakdown pages show for a completed season.
+
+    The snapshot is zlib-compressed JSON built when the season is finalized
+    (see league/archive.py). Pages for archived seasons are served from it
+    instead of the fixture, result and match records.
+    """
+
+    season = models.OneToOneField(
+        Season, on_delete=models.CASCADE, related_name="archive"
+    )
+    snapshot = models.BinaryField()
+    created_on = models.DateTimeField(auto_now_add=True)
+    updated_on = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.season} archive"
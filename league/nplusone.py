@@ -0,0 +1,258 @@
+"""
+Detection of repeated ("N+1") queries, such as a template following a
+foreign key for every row of a queryset that the view did not prefetch.
+
+Each SELECT query is reduced to its shape by replacing parameters, numbers,
+strings and IN lists with placeholders, so queries differing only in the
+ids they look up share a shape. When one shape runs more times than the
+threshold while a request (or a test block) is handled, the detector logs a
+warning (logger "league.queries") or raises RepeatedQueriesError with the
+query and the template line or code running it. The stack is only
+inspected once a shape has repeated too often, so counting is cheap.
+Queries run while a streamed response is sent (e.g. the iCal feed or a
+full-season page) count towards the request.
+
+In settings.py, N_PLUS_ONE_MODE ("log", "raise" or "" to disable) switches
+on NPlusOneMiddleware, N_PLUS_ONE_THRESHOLD sets the number of repeats
+allowed and N_PLUS_ONE_ALLOWLIST lists regular expressions matching query
+shapes or locations which are expected to repeat. Tests can also check a
+block of code directly:
+
+    with detect_repeated_queries():
+        self.client.get(url)
+"""
+
+import logging
+import re
+import sys
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from pathlib import Path
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+logger = logging.getLogger("league.queries")
+
+DEFAULT_THRESHOLD = 5
+MODES = ("log", "raise")
+
+# Patterns used to reduce SQL to its shape (applied in order)
+SHAPE_PATTERNS = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"%s|\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),
+    (re.compile(r"\s+"), " "),
+]
+
+PROJECT_DIR = str(Path(settings.BASE_DIR).resolve())
+
+# Modules which wrap query execution and are never the cause of a query
+WRAPPER_FILES = {
+    str(Path(__file__).resolve()),
+    str(Path(__file__).with_name("instrumentation.py").resolve()),
+}
+
+
+class RepeatedQueriesError(Exception):
+    """Raised when a query shape repeats more times than allowed."""
+
+
+# Helper functions
+@lru_cache(maxsize=None)
+def resolve_filename(filename):
+    """Returns the absolute path of a code file (cached)."""
+    return str(Path(filename).resolve())
+
+
+def get_query_shape(sql):
+    """
+    Reduces SQL to its shape so that queries differing only in their
+    parameters can be grouped.
+
+    Args:
+        sql (str): The SQL (with or without parameter placeholders).
+
+    Returns:
+        str: The normalised SQL.
+    """
+    shape = sql
+    for pattern, replacement in SHAPE_PATTERNS:
+        shape = pattern.sub(replacement, shape)
+    return shape.strip()
+
+
+def get_query_location(frame=None):
+    """
+    Finds where a query was triggered from: the template line being
+    rendered if a template is rendering, otherwise the innermost line of
+    project code (excluding query wrappers and installed packages).
+
+    Returns:
+        str: e.g. "league/partials/fixture_week.html:26" or
+             "league/views.py:412 in get_fixture_data", or "unknown".
+    """
+    frame = frame or sys._getframe(1)
+    code_location = None
+    while frame:
+        code = frame.f_code
+        if code.co_name == "render_annotated":
+            node = frame.f_locals.get("self")
+            origin = getattr(node, "origin", None)
+            if origin and hasattr(node, "token"):
+                name = getattr(origin, "template_name", None) or origin.name
+                return f"{name}:{node.token.lineno}"
+
+        filename = resolve_filename(code.co_filename)
+        if (
+            code_location is None
+            and filename.startswith(PROJECT_DIR)
+            and filename not in WRAPPER_FILES
+            and "site-packages" not in filename
+        ):
+            relative_name = Path(filename).relative_to(PROJECT_DIR)
+            code_location = (
+                f"{relative_name}:{frame.f_lineno} in {code.co_name}"
+            )
+        frame = frame.f_back
+    return code_location or "unknown"
+
+
+class QueryShapeCounter:
+    """
+    Database execute wrapper which counts SELECT queries by shape and
+    reports shapes which repeat more than the threshold.
+    """
+
+    def __init__(self, threshold, allowlist=(), mode="raise", label=""):
+        self.threshold = threshold
+        self.allowlist = [re.compile(pattern) for pattern in allowlist]
+        self.mode = mode
+        self.label = label
+        self.counts = {}
+        self.repeated = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip()[:6].upper() == "SELECT":
+            self.count(sql)
+        return execute(sql, params, many, context)
+
+    def is_allowed(self, shape, location):
+        """Returns True if the shape or location is in the allowlist."""
+        return any(
+            pattern.search(shape) or pattern.search(location)
+            for pattern in self.allowlist
+        )
+
+    def count(self, sql):
+        """Counts a query and reports its shape if it repeats too often."""
+        shape = get_query_shape(sql)
+        count = self.counts.get(shape, 0) + 1
+        self.counts[shape] = count
+        if count != self.threshold + 1:
+            return
+
+        location = get_query_location()
+        if self.is_allowed(shape, location):
+            return
+        self.repeated.append((shape, location))
+
+        message = (
+            f"Query repeated more than {self.threshold} times"
+            f"{f' in {self.label}' if self.label else ''} "
+            f"(at {location}): {shape}"
+        )
+        if self.mode == "raise":
+            raise RepeatedQueriesError(message)
+        logger.warning(message)
+
+
+def get_counter(threshold=None, allowlist=None, mode="raise", label=""):
+    """
+    Returns a query shape counter.
+
+    Args:
+        threshold (int): Repeats of a shape allowed (defaults to the
+                         N_PLUS_ONE_THRESHOLD setting).
+        allowlist (list[str]): Patterns for shapes or locations to ignore
+                               (defaults to the N_PLUS_ONE_ALLOWLIST
+                               setting).
+        mode (str): "raise" to raise RepeatedQueriesError or "log".
+        label (str): Included in messages (e.g. the request path).
+
+    Returns:
+        QueryShapeCounter: The counter.
+    """
+    if threshold is None:
+        threshold = getattr(
+            settings, "N_PLUS_ONE_THRESHOLD", DEFAULT_THRESHOLD
+        )
+    if allowlist is None:
+        allowlist = getattr(settings, "N_PLUS_ONE_ALLOWLIST", [])
+    return QueryShapeCounter(threshold, allowlist, mode, label)
+
+
+@contextmanager
+def counting(counter):
+    """Counts query shapes on every database connection within the block."""
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        yield counter
+
+
+@contextmanager
+def detect_repeated_queries(
+    threshold=None, allowlist=None, mode="raise", label=""
+):
+    """
+    Counts query shapes on every database connection within the block
+    (see get_counter for the arguments).
+
+    Yields:
+        QueryShapeCounter: The counter, whose repeated attribute lists the
+                           (shape, location) of each repeated query.
+    """
+    with counting(get_counter(threshold, allowlist, mode, label)) as counter:
+        yield counter
+
+
+# Middleware
+class NPlusOneMiddleware:
+    """
+    Logs or raises an error for query shapes repeated too often within a
+    request, when N_PLUS_ONE_MODE is set (e.g. in tests or on staging).
+    """
+
+    def __init__(self, get_response):
+        self.mode = getattr(settings, "N_PLUS_ONE_MODE", "")
+        if self.mode not in MODES:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = get_counter(
+            mode=self.mode, label=f"{request.method} {request.path}"
+        )
+        with counting(counter):
+            response = self.get_response(request)
+
+        if response.streaming and not response.is_async:
+            response.streaming_content = self.stream_content(
+                response.streaming_content, counter
+            )
+        return response
+
+    def stream_content(self, content, counter):
+        """
+        Yields the chunks of a streamed response, counting the queries made
+        while each is produced along with those made by the view.
+        """
+        chunks = iter(content)
+        while True:
+            with counting(counter):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            yield chunk
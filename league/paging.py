@@ -0,0 +1,167 @@
+"""
+Week-by-week paging of the fixtures and results pages.
+
+Rendering every week of a season (with all of its fixtures) made the
+fixtures and results pages grow with the length of the season. Instead,
+each page opens on a page of weeks: the fixtures page shows the current
+week (or the next week to be played, or the last weeks of a finished
+season) with the week before it, and the results page shows the latest
+weeks with results. Buttons at either end load the neighbouring pages of
+weeks through HTMX, using the start date of the first or last week shown
+as the cursor.
+
+The weeks of a season are held in date order in the worker's season index
+(see league/season_index.py), so the weeks on a page are found with a
+binary search on their start dates and only the fixtures of those weeks
+are then grouped for display.
+
+Requesting weeks=all renders every week of the season on one page (used by
+the static season export).
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from datetime import date, timedelta
+from itertools import islice
+from django.urls import reverse
+
+
+# Weeks rendered on each page
+WEEKS_PER_PAGE = 5
+
+# Weeks shown before the current week when the fixtures page opens
+WEEKS_BEFORE_CURRENT = 1
+
+# GET parameters used for paging (rather than filtering) and the value of
+# the weeks parameter which shows the whole season
+PAGING_PARAMS = ["weeks", "before", "after"]
+ALL_WEEKS = "all"
+
+# The weeks on a page, oldest first on the fixtures page and latest first
+# on the results page, and whether earlier or later weeks remain
+WeekPage = namedtuple("WeekPage", ["weeks", "has_earlier", "has_later"])
+
+
+# Helper functions
+def get_cursor(request, name):
+    """
+    Returns the date in a paging GET parameter (before or after), or None
+    if it is missing or not a valid ISO date.
+    """
+    try:
+        return date.fromisoformat(request.GET.get(name, ""))
+    except ValueError:
+        return None
+
+
+def shows_all_weeks(request):
+    """Returns whether the request asks for every week of the season."""
+    return request.GET.get("weeks") == ALL_WEEKS
+
+
+def take_page(weeks, size=WEEKS_PER_PAGE):
+    """
+    Takes up to a page of weeks from the start of a list or iterator (an
+    iterator is read no further than one week past the page).
+
+    Returns:
+        tuple: The weeks on the page (list) and whether more weeks follow.
+    """
+    weeks = list(islice(weeks, size + 1))
+    return weeks[:size], len(weeks) > size
+
+
+def get_start_date(week):
+    """Returns the start date of a week (archived weeks are dictionaries)."""
+    return week["start_date"] if isinstance(week, dict) else week.start_date
+
+
+def get_more_weeks_url(name, request, season, **cursor):
+    """
+    Builds the URL of the next page of weeks in one direction, keeping the
+    filters of the current request.
+
+    Args:
+        name (str): The URL name of the view rendering the page of weeks.
+        request (HttpRequest): The current request.
+        season (Season): The season shown (named in the URL so later pages
+                         stay on it if the current season changes).
+        **cursor (date): before or after, the start date to page from.
+
+    Returns:
+        str: The URL including its query string.
+    """
+    params = request.GET.copy()
+    for param in PAGING_PARAMS:
+        params.pop(param, None)
+    params["season"] = season.slug
+    for param, start_date in cursor.items():
+        params[param] = start_date.isoformat()
+    return f"{reverse(name)}?{params.urlencode()}"
+
+
+# Pages of weeks
+def get_fixture_week_page(weeks, request, today):
+    """
+    Returns the page of weeks to show on the fixtures page, oldest first.
+
+    Without a cursor this is the opening page: the week containing today
+    (or the next week to start) with WEEKS_BEFORE_CURRENT weeks before it,
+    filled with earlier weeks if too few weeks remain in the season.
+
+    Args:
+        weeks (Sequence[WeekRow]): The weeks of the season, oldest first.
+        request (HttpRequest): The request, with any paging parameters.
+        today (date): Today's date.
+
+    Returns:
+        WeekPage: The weeks on the page.
+    """
+    if shows_all_weeks(request):
+        return WeekPage(list(weeks), False, False)
+
+    before = get_cursor(request, "before")
+    after = get_cursor(request, "after")
+    if before:
+        end = bisect_left(weeks, before, key=get_start_date)
+        start = max(end - WEEKS_PER_PAGE, 0)
+    elif after:
+        start = bisect_right(weeks, after, key=get_start_date)
+        end = start + WEEKS_PER_PAGE
+    else:
+        # Weeks run for seven days, so the current week is the first week
+        # to start no more than six days ago
+        current = bisect_left(
+            weeks, today - timedelta(days=6), key=get_start_date
+        )
+        start = max(
+            min(current - WEEKS_BEFORE_CURRENT, len(weeks) - WEEKS_PER_PAGE),
+            0,
+        )
+        end = start + WEEKS_PER_PAGE
+
+    # A cursor only pages in one direction
+    return WeekPage(
+        list(weeks[start:end]),
+        start > 0 and not after,
+        end < len(weeks) and not before,
+    )
+
+
+def get_result_week_page(weeks, request):
+    """
+    Returns the page of weeks to show on the results page, latest first.
+
+    Args:
+        weeks (Iterable[ShownWeek | dict]): The weeks with results, latest
+                                            first, already limited to
+                                            weeks before the cursor.
+        request (HttpRequest): The request, with any paging parameters.
+
+    Returns:
+        WeekPage: The weeks on the page.
+    """
+    if shows_all_weeks(request):
+        return WeekPage(list(weeks), False, False)
+    page, has_earlier = take_page(weeks)
+    return WeekPage(page, has_earlier, False)
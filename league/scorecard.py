@@ -0,0 +1,408 @@
+"""
+Validation and saving of a complete match scorecard for a fixture.
+
+A scorecard holds the games of every singles match and the doubles match
+played in a fixture. The whole card is validated in memory (using the
+model clean methods against pre-fetched fixture and team player records)
+and then written with bulk_create inside one transaction. Set counts, team
+scores and winners are derived from the game points rather than taken from
+the submitted data.
+
+Scorecard data has the following structure (team player IDs and game
+points as [home, away] pairs):
+
+    {
+        "singles": [
+            {"home_player": 1, "away_player": 4, "games": [[11, 5], ...]},
+            ...
+        ],
+        "doubles": {
+            "home_players": [1, 2],
+            "away_players": [4, 5],
+            "games": [[11, 9], ...],
+        },
+    }
+"""
+
+import re
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from .cache import invalidate_tags
+from .models import (
+    DoublesGame,
+    DoublesMatch,
+    Fixture,
+    FixtureResult,
+    SinglesGame,
+    SinglesMatch,
+    TeamPlayer,
+)
+from .signals import get_fixture_tags
+from .standings import refresh_team_standings
+
+
+# Matches game scores entered as text (e.g. "11-5, 9-11, 11-7")
+GAME_SCORE_PATTERN = re.compile(r"^(\d+)\s*-\s*(\d+)$")
+
+
+# Helper functions
+def parse_game_scores(text):
+    """
+    Parses game scores entered as text into a list of [home, away] points.
+
+    Args:
+        text (str): Comma separated game scores (e.g. "11-5, 9-11, 11-7").
+
+    Returns:
+        list[list[int]]: The points scored in each game.
+
+    Raises:
+        ValidationError: If a game score is not in the expected format.
+    """
+    games = []
+    for score in text.split(","):
+        match = GAME_SCORE_PATTERN.match(score.strip())
+        if not match:
+            raise ValidationError(
+                f"'{score.strip()}' is not a valid game score (e.g. 11-5)."
+            )
+        games.append([int(match.group(1)), int(match.group(2))])
+    return games
+
+
+def get_scorecard_fixtures():
+    """
+    Returns a fixture queryset with the related records needed to validate
+    a scorecard without further queries.
+    """
+    return Fixture.objects.select_related(
+        "season",
+        "division",
+        "week",
+        "home_team__club",
+        "away_team__club",
+        "result",
+    )
+
+
+def get_scorecard_players(fixture):
+    """
+    Fetches the team players eligible to play in a fixture (players in any
+    of the home or away club's teams in the fixture's season, allowing for
+    reserves) in one query.
+
+    Args:
+        fixture (Fixture): A fixture from get_scorecard_fixtures.
+
+    Returns:
+        dict: Team players keyed by ID for each side ("home" and "away").
+    """
+    club_ids = [fixture.home_team.club_id, fixture.away_team.club_id]
+    team_players = TeamPlayer.objects.filter(
+        team__season_id=fixture.season_id, team__club_id__in=club_ids
+    ).select_related("player", "team__season", "team__club")
+
+    players = {"home": {}, "away": {}}
+    for team_player in team_players:
+        if team_player.team.club_id == fixture.home_team.club_id:
+            players["home"][team_player.id] = team_player
+        if team_player.team.club_id == fixture.away_team.club_id:
+            players["away"][team_player.id] = team_player
+    return players
+
+
+def get_player(players, side, player_id):
+    """
+    Returns the eligible team player with the specified ID for one side.
+
+    Raises:
+        ValidationError: If the player is not eligible for that side.
+    """
+    try:
+        return players[side][int(player_id)]
+    except (KeyError, TypeError, ValueError):
+        raise ValidationError(
+            f"{player_id} is not a {side} club player in this season."
+        )
+
+
+def build_games(games_data, game_model, match):
+    """
+    Builds and validates the games in a match.
+
+    Args:
+        games_data (list): The [home, away] points for each game.
+        game_model (type): SinglesGame or DoublesGame.
+        match (SinglesMatch | DoublesMatch): The (unsaved) match.
+
+    Returns:
+        list: The unsaved games with winners assigned.
+
+    Raises:
+        ValidationError: If a game is invalid or is played after the match
+                         has already been won.
+    """
+    if not isinstance(games_data, list) or not games_data:
+        raise ValidationError("Game scores must be entered.")
+
+    match_field = (
+        "singles_match" if game_model is SinglesGame else "doubles_match"
+    )
+    games = []
+    sets = {"home": 0, "away": 0}
+    for set_num, points in enumerate(games_data, start=1):
+        if max(sets.values()) == match.TARGET_SETS:
+            raise ValidationError(
+                f"Set {set_num} was played after the match was won."
+            )
+        try:
+            home_points, away_points = (int(value) for value in points)
+            if home_points < 0 or away_points < 0:
+                raise ValueError
+        except (TypeError, ValueError, OverflowError):
+            raise ValidationError(f"Set {set_num} score is invalid.")
+
+        game = game_model(
+            set_num=set_num,
+            home_points=home_points,
+            away_points=away_points,
+            **{match_field: match},
+        )
+        try:
+            game.clean()
+        except ValidationError as error:
+            raise ValidationError(
+                [f"Set {set_num}: {message}" for message in error.messages]
+            )
+        game.winner = "home" if home_points > away_points else "away"
+        sets[game.winner] += 1
+        games.append(game)
+
+    match.home_sets = sets["home"]
+    match.away_sets = sets["away"]
+    match.winner = "home" if match.home_sets > match.away_sets else "away"
+    return games
+
+
+def build_singles(result, singles_data, players):
+    """
+    Builds and validates the singles matches (and their games) in a
+    scorecard.
+
+    Returns:
+        tuple: The unsaved singles matches and a list of their games.
+
+    Raises:
+        ValidationError: Containing every error found, prefixed with the
+                         match number.
+    """
+    matches = []
+    games = []
+    errors = []
+    pairings = set()
+    for num, match_data in enumerate(singles_data, start=1):
+        if not isinstance(match_data, dict):
+            errors.append(f"Singles match {num}: Invalid match data.")
+            continue
+        try:
+            match = SinglesMatch(
+                fixture_result=result,
+                home_player=get_player(
+                    players, "home", match_data.get("home_player")
+                ),
+                away_player=get_player(
+                    players, "away", match_data.get("away_player")
+                ),
+            )
+            pairing = (match.home_player.id, match.away_player.id)
+            if pairing in pairings:
+                raise ValidationError(
+                    "These players have already played each other."
+                )
+            pairings.add(pairing)
+
+            match_games = build_games(
+                match_data.get("games"), SinglesGame, match
+            )
+            match.clean()
+        except ValidationError as error:
+            errors.extend(
+                f"Singles match {num}: {message}" for message in error.messages
+            )
+            continue
+        matches.append(match)
+        games.extend(match_games)
+
+    if errors:
+        raise ValidationError(errors)
+    return matches, games
+
+
+def build_doubles(result, doubles_data, players):
+    """
+    Builds and validates the doubles match (and its games) in a scorecard.
+
+    Returns:
+        tuple: The unsaved doubles match, its home and away team players and
+               a list of its games.
+
+    Raises:
+        ValidationError: If the doubles match is invalid (see also
+                         DoublesMatchAdminForm).
+    """
+    try:
+        player_ids = {}
+        for side in ["home", "away"]:
+            player_ids[side] = doubles_data.get(f"{side}_players") or []
+            if not isinstance(player_ids[side], list):
+                raise ValidationError(
+                    f"The {side} players must be a list of player IDs."
+                )
+        home_players = [
+            get_player(players, "home", player_id)
+            for player_id in player_ids["home"]
+        ]
+        away_players = [
+            get_player(players, "away", player_id)
+            for player_id in player_ids["away"]
+        ]
+        if len(set(home_players)) != 2:
+            raise ValidationError("Exactly 2 home players must be selected.")
+        if len(set(away_players)) != 2:
+            raise ValidationError("Exactly 2 away players must be selected.")
+        if set(home_players) & set(away_players):
+            raise ValidationError("A player cannot be on both teams.")
+
+        match = DoublesMatch(fixture_result=result)
+        games = build_games(doubles_data.get("games"), DoublesGame, match)
+        match.clean()
+    except ValidationError as error:
+        raise ValidationError(
+            [f"Doubles match: {message}" for message in error.messages]
+        )
+    return match, home_players, away_players, games
+
+
+def build_scorecard(fixture, data, players):
+    """
+    Builds and validates all records for a scorecard without saving them.
+
+    The team scores and winners are derived from the game points.
+
+    Args:
+        fixture (Fixture): A fixture from get_scorecard_fixtures.
+        data (dict): The scorecard data (see module docstring).
+        players (dict): Eligible team players from get_scorecard_players.
+
+    Returns:
+        dict: The unsaved records, keyed by 'result', 'singles',
+              'singles_games', 'doubles', 'doubles_home_players',
+              'doubles_away_players' and 'doubles_games'.
+
+    Raises:
+        ValidationError: Containing every error found in the scorecard.
+    """
+    if hasattr(fixture, "result"):
+        raise ValidationError("A result has already been entered.")
+    if not isinstance(data, dict):
+        raise ValidationError("Scorecard data must be an object.")
+
+    result = FixtureResult(fixture=fixture)
+    scorecard = {"result": result}
+    errors = []
+
+    singles_data = data.get("singles")
+    if not isinstance(singles_data, list) or not singles_data:
+        errors.append("Singles matches must be entered.")
+    else:
+        try:
+            scorecard["singles"], scorecard["singles_games"] = build_singles(
+                result, singles_data, players
+            )
+        except ValidationError as error:
+            errors.extend(error.messages)
+
+    doubles_data = data.get("doubles")
+    if not isinstance(doubles_data, dict):
+        errors.append("The doubles match must be entered.")
+    else:
+        try:
+            (
+                scorecard["doubles"],
+                scorecard["doubles_home_players"],
+                scorecard["doubles_away_players"],
+                scorecard["doubles_games"],
+            ) = build_doubles(result, doubles_data, players)
+        except ValidationError as error:
+            errors.extend(error.messages)
+
+    if errors:
+        raise ValidationError(errors)
+
+    matches = scorecard["singles"] + [scorecard["doubles"]]
+    result.home_score = sum(match.winner == "home" for match in matches)
+    result.away_score = sum(match.winner == "away" for match in matches)
+    if result.home_score > result.away_score:
+        result.winner = "home"
+    elif result.home_score < result.away_score:
+        result.winner = "away"
+    else:
+        result.winner = "draw"
+    result.set_individual_sets(matches)
+    result.clean()
+    return scorecard
+
+
+def save_scorecard(scorecard):
+    """
+    Saves the records built by build_scorecard in one transaction and marks
+    the fixture as completed.
+
+    bulk_create does not send signals, so the standings of both teams are
+    refreshed and cached league pages are invalidated here.
+
+    The fixture row is updated first, so a concurrent submission for the
+    same fixture waits for this transaction and then finds its result.
+
+    Args:
+        scorecard (dict): The unsaved records from build_scorecard.
+
+    Returns:
+        FixtureResult: The saved fixture result.
+
+    Raises:
+        ValidationError: If a result was entered for the fixture since the
+                         scorecard was built.
+    """
+    result = scorecard["result"]
+    fixture = result.fixture
+    doubles = scorecard["doubles"]
+    home_through = DoublesMatch.home_players.through
+    away_through = DoublesMatch.away_players.through
+
+    with transaction.atomic():
+        Fixture.objects.filter(id=fixture.id).update(
+            status="completed", updated_on=timezone.now()
+        )
+        if FixtureResult.objects.filter(fixture_id=fixture.id).exists():
+            raise ValidationError("A result has already been entered.")
+
+        FixtureResult.objects.bulk_create([result])
+        SinglesMatch.objects.bulk_create(scorecard["singles"])
+        DoublesMatch.objects.bulk_create([doubles])
+        home_through.objects.bulk_create(
+            home_through(doublesmatch=doubles, teamplayer=player)
+            for player in scorecard["doubles_home_players"]
+        )
+        away_through.objects.bulk_create(
+            away_through(doublesmatch=doubles, teamplayer=player)
+            for player in scorecard["doubles_away_players"]
+        )
+        SinglesGame.objects.bulk_create(scorecard["singles_games"])
+        DoublesGame.objects.bulk_create(scorecard["doubles_games"])
+        fixture.status = "completed"
+        refresh_team_standings([fixture.home_team_id, fixture.away_team_id])
+        invalidate_tags(get_fixture_tags({"id": fixture.id}))
+
+    return result
@@ -0,0 +1,296 @@
+"""
+Compact per-season fixture index held in memory by each worker process.
+
+The fixtures and results pages (with their pages of weeks and streamed
+full-season pages, see league/paging.py and league/streaming.py) group a
+season's fixtures by week and filter them by division and club. Instead of
+reading fixtures from the database for each page, each worker loads a
+season's weeks, teams and fixtures (with their results) into a SeasonIndex
+the first time the season is shown, using three queries that read plain
+values rather than model instances. The index is reused until one of the
+tags of the season's league pages is bumped (see league/cache.py and
+league/signals.py), which happens whenever a fixture, result, week, team,
+club or venue changes.
+
+Rows are small __slots__ objects, and the index only holds tuples of rows
+built once at load time and looked up by week, so pages filter and group
+fixtures without building model instances. An index is shared by every
+request the worker handles, so it must be treated as read-only. Each
+worker keeps the indexes of the seasons it showed most recently, up to
+MAX_SEASON_INDEXES.
+
+The results of archived seasons are served from their snapshot instead
+(see league/archive.py).
+"""
+
+import threading
+import time
+from itertools import dropwhile
+from .archive import RelatedRecords
+from .cache import CLUBS_TAG, SEASONS_TAG, get_tag_versions, season_tag
+from .models import Fixture, Team, Week
+
+
+# The number of season indexes each worker keeps (the least recently used
+# is dropped when another season is loaded)
+MAX_SEASON_INDEXES = 4
+
+
+class Row:
+    """A read-only record with a fixed set of fields (set in order)."""
+
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.id}>"
+
+
+class WeekRow(Row):
+    __slots__ = ("id", "name", "start_date", "details")
+
+
+class TeamRow(Row):
+    __slots__ = ("id", "team_name", "division_id", "club_id")
+
+
+class ResultRow(Row):
+    __slots__ = ("id", "home_score", "away_score", "winner", "status")
+
+
+class FixtureRow(Row):
+    __slots__ = (
+        "id",
+        "week_id",
+        "division_id",
+        "datetime",
+        "status",
+        "venue_id",
+        "home_club_id",
+        "away_club_id",
+        "home_team",
+        "away_team",
+        "result",
+    )
+
+
+class ShownWeek(Row):
+    """
+    A week with the fixtures shown in it, read in templates like a week
+    with its fixtures prefetched (``week.week_fixtures.all``).
+    """
+
+    __slots__ = ("id", "name", "start_date", "details", "week_fixtures")
+
+
+# Columns read for each row
+WEEK_FIELDS = ["id", "name", "start_date", "details"]
+TEAM_FIELDS = ["id", "team_name", "division_id", "club_id"]
+FIXTURE_FIELDS = [
+    "id",
+    "week_id",
+    "division_id",
+    "datetime",
+    "status",
+    "venue_id",
+    "home_club_id",
+    "away_club_id",
+    "home_team_id",
+    "away_team_id",
+]
+RESULT_FIELDS = [
+    "result__id",
+    "result__home_score",
+    "result__away_score",
+    "result__winner",
+    "result__status",
+]
+
+
+# Helper functions
+def show_week(week, fixtures):
+    """Returns a week with the fixtures to show in it."""
+    return ShownWeek(
+        week.id,
+        week.name,
+        week.start_date,
+        week.details,
+        RelatedRecords(fixtures),
+    )
+
+
+def freeze_lookup(lookup):
+    """Returns a lookup with its lists of fixtures made into tuples."""
+    return {key: tuple(fixtures) for key, fixtures in lookup.items()}
+
+
+def matches_filters(fixture, division_id, club_id):
+    """Returns whether a fixture is in the division and club (if given)."""
+    return (not division_id or fixture.division_id == division_id) and (
+        not club_id or club_id in (fixture.home_club_id, fixture.away_club_id)
+    )
+
+
+class SeasonIndex:
+    """The weeks, teams and fixtures of a season held by a worker."""
+
+    def __init__(self, season_id, version=None):
+        self.season_id = season_id
+        self.version = version
+        self.weeks = ()
+        self.teams = {}
+        self.fixtures = ()
+        self.by_week = {}
+        self.result_weeks = ()
+        self.last_used = time.monotonic()
+
+    def load(self):
+        """Reads the season's weeks, teams and fixtures (three queries)."""
+        season_id = self.season_id
+        self.weeks = tuple(
+            WeekRow(*values)
+            for values in Week.objects.filter(season_id=season_id)
+            .order_by("start_date", "id")
+            .values_list(*WEEK_FIELDS)
+        )
+        self.teams = {
+            values[0]: TeamRow(*values)
+            for values in Team.objects.filter(season_id=season_id)
+            .order_by()
+            .values_list(*TEAM_FIELDS)
+        }
+
+        # The home and away team ids are the last fixture fields
+        fields = len(FIXTURE_FIELDS)
+        self.fixtures = tuple(
+            FixtureRow(
+                *values[: fields - 2],
+                self.teams[values[fields - 2]],
+                self.teams[values[fields - 1]],
+                ResultRow(*values[fields:]) if values[fields] else None,
+            )
+            for values in Fixture.objects.filter(season_id=season_id)
+            .order_by("datetime", "id")
+            .values_list(*FIXTURE_FIELDS, *RESULT_FIELDS)
+        )
+
+        # The fixtures of each week in date order
+        by_week = {}
+        for fixture in self.fixtures:
+            by_week.setdefault(fixture.week_id, []).append(fixture)
+        self.by_week = freeze_lookup(by_week)
+
+        # Weeks with results (latest first) and their results
+        self.result_weeks = tuple(
+            (week, results)
+            for week in reversed(self.weeks)
+            if (
+                results := tuple(
+                    fixture
+                    for fixture in self.by_week.get(week.id, ())
+                    if fixture.result
+                )
+            )
+        )
+        return self
+
+    def get_week_fixtures(self, week, division_id=None, club_id=None):
+        """Returns the fixtures in a week, in the division and club."""
+        return [
+            fixture
+            for fixture in self.by_week.get(week.id, ())
+            if matches_filters(fixture, division_id, club_id)
+        ]
+
+    def iter_weeks(self, weeks, division_id=None, club_id=None):
+        """
+        Yields each of the weeks with its fixtures in the division and club
+        (if given), ready to show.
+        """
+        for week in weeks:
+            yield show_week(
+                week, self.get_week_fixtures(week, division_id, club_id)
+            )
+
+    def iter_result_weeks(self, division_id=None, club_id=None, before=None):
+        """
+        Yields the weeks with results in the division and club (if given),
+        latest first, ready to show.
+
+        Args:
+            division_id (int, optional): Only include this division.
+            club_id (int, optional): Only include this club's home and away
+                                     fixtures.
+            before (date, optional): Only include weeks starting before
+                                     this date.
+        """
+        result_weeks = self.result_weeks
+        if before:
+            result_weeks = dropwhile(
+                lambda result_week: result_week[0].start_date >= before,
+                result_weeks,
+            )
+        for week, results in result_weeks:
+            if division_id or club_id:
+                results = [
+                    fixture
+                    for fixture in results
+                    if matches_filters(fixture, division_id, club_id)
+                ]
+            if results:
+                yield show_week(week, results)
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def drop_unused_indexes():
+    """
+    Drops the least recently used indexes beyond MAX_SEASON_INDEXES (called
+    with the lock held).
+    """
+    while len(_indexes) > MAX_SEASON_INDEXES:
+        season_id = min(_indexes, key=lambda key: _indexes[key].last_used)
+        del _indexes[season_id]
+
+
+def get_season_index(season, request=None):
+    """
+    Returns this process's index of a season, loading it again if the
+    season's fixtures, results, weeks, teams or clubs have changed since it
+    was loaded. If a request is given, the index is looked up at most once
+    per request.
+
+    Args:
+        season (Season): The season.
+        request (HttpRequest, optional): The current request.
+
+    Returns:
+        SeasonIndex: The season's index.
+    """
+    request_indexes = getattr(request, "_league_season_indexes", None)
+    if request_indexes and season.id in request_indexes:
+        return request_indexes[season.id]
+
+    version = tuple(
+        get_tag_versions([SEASONS_TAG, CLUBS_TAG, season_tag(season.slug)])
+    )
+    index = _indexes.get(season.id)
+    if index is None or index.version != version:
+        with _indexes_lock:
+            index = _indexes.get(season.id)
+            if index is None or index.version != version:
+                index = SeasonIndex(season.id, version).load()
+                _indexes[season.id] = index
+                drop_unused_indexes()
+    index.last_used = time.monotonic()
+
+    if request is not None:
+        if request_indexes is None:
+            request_indexes = request._league_season_indexes = {}
+        request_indexes[season.id] = index
+    return index
@@ -0,0 +1,94 @@
+"""
+Seasons, divisions and club filter options held in memory by each worker
+process.
+
+Nearly every league page needs the current season, the visible seasons
+(for the season dropdowns) and the selected season's divisions and clubs
+(for the fixture filters), but these rarely change. Each worker process
+loads the seasons and divisions once into a SeasonStore (two queries),
+adds each season's club options the first time they are needed (one
+query) and reuses the store until the season list tag in the league cache
+is bumped. That happens whenever a season, division or club is saved or
+deleted, a season's divisions change (see league/signals.py) or the clubs
+with teams in a season are rebuilt (see league/membership.py).
+
+The stored Season and Division instances are shared by every request the
+worker handles, so they must be treated as read-only.
+"""
+
+import threading
+from .cache import SEASON_LIST_TAG, get_tag_versions
+from .membership import get_season_club_options
+from .models import Season
+
+
+class SeasonStore:
+    """The seasons, divisions and club options held by a worker process."""
+
+    def __init__(self, version=None):
+        self.version = version
+        self.current = None
+        self.visible = []
+        self.by_slug = {}
+        self.club_options = {}
+
+    def load(self):
+        """Loads every season with its divisions prefetched."""
+        for season in Season.objects.prefetch_related("divisions"):
+            self.by_slug[season.slug] = season
+            if season.is_visible:
+                self.visible.append(season)
+            if season.is_current and self.current is None:
+                self.current = season
+        return self
+
+    def get_season(self, slug):
+        """Returns the season with the slug, or None if there is none."""
+        return self.by_slug.get(slug)
+
+    def get_divisions(self, season):
+        """Returns the divisions of a stored season in rank order."""
+        stored = self.by_slug.get(season.slug) if season else None
+        return list(stored.divisions.all()) if stored else []
+
+    def get_clubs(self, season, division_id=None):
+        """
+        Returns the clubs with a team in a season (and optionally division)
+        in name order, loading the season's club options if needed.
+        """
+        if season is None:
+            return []
+        options = self.club_options.get(season.id)
+        if options is None:
+            options = get_season_club_options(season)
+            self.club_options[season.id] = options
+        return options.get(str(division_id) if division_id else None, [])
+
+
+_store = SeasonStore()
+_store_lock = threading.Lock()
+
+
+def get_season_store(request=None):
+    """
+    Returns this process's season store, reloading it if the seasons or
+    divisions have changed since it was loaded. If a request is given, the
+    store is looked up at most once per request.
+    """
+    global _store
+    if request is not None and hasattr(request, "_league_seasons"):
+        return request._league_seasons
+
+    (version,) = get_tag_versions([SEASON_LIST_TAG])
+    if _store.version != version:
+        with _store_lock:
+            if _store.version != version:
+                _store = SeasonStore(version).load()
+    if request is not None:
+        request._league_seasons = _store
+    return _store
+
+
+def get_current_season(request=None):
+    """Returns the current season, or None if no season is current."""
+    return get_season_store(request).current
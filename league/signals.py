@@ -0,0 +1,462 @@
+"""
+Signal handlers keeping derived league data (stored standings, club
+membership, cached league pages and the seasons and archived seasons
+loaded by each worker) in sync with league records.
+
+Handlers ignore raw saves (e.g. when running loaddata) because related
+records may not exist yet. Run the rebuild_standings management command
+after loading fixture data. The standings of existing results are built
+by the migration creating LeagueStanding.
+"""
+
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.db.models import Q
+from django.dispatch import receiver
+from django.utils import timezone
+from clubs.models import (
+    Club,
+    ClubInfo,
+    ClubReview,
+    ClubVenue,
+    Venue,
+    VenueInfo,
+)
+from .cache import (
+    ARCHIVES_TAG,
+    CLUBS_TAG,
+    SEASON_LIST_TAG,
+    SEASONS_TAG,
+    invalidate_tags,
+    season_tag,
+    team_tag,
+)
+from .models import (
+    Division,
+    DoublesGame,
+    DoublesMatch,
+    Fixture,
+    FixtureResult,
+    LeagueStanding,
+    Player,
+    Season,
+    SeasonArchive,
+    SinglesGame,
+    SinglesMatch,
+    Team,
+    TeamPlayer,
+    Week,
+)
+from .membership import refresh_fixture_clubs, refresh_season_clubs
+from .standings import refresh_individual_sets, refresh_team_standings
+
+
+# Deletes of these records remove the matches of their results too, so
+# the match handlers leave the standings and cached pages to the result's
+# own handlers rather than refreshing them once per match
+RESULT_DELETE_ORIGINS = (Fixture, FixtureResult)
+
+
+def get_fixture_team_ids(fixture_id):
+    """
+    Returns the home and away team IDs for a fixture as a list
+    (empty if the fixture no longer exists).
+    """
+    teams = (
+        Fixture.objects.filter(id=fixture_id)
+        .values_list("home_team_id", "away_team_id")
+        .first()
+    )
+    return list(teams) if teams else []
+
+
+def get_fixture_result_team_ids(fixture_result_id):
+    """
+    Returns the home and away team IDs for a fixture result as a list
+    (empty if the fixture result no longer exists).
+    """
+    teams = (
+        FixtureResult.objects.filter(id=fixture_result_id)
+        .values_list("fixture__home_team_id", "fixture__away_team_id")
+        .first()
+    )
+    return list(teams) if teams else []
+
+
+def is_result_delete(origin):
+    """
+    Returns whether a delete started from a fixture or fixture result (or
+    a queryset of them), given the origin sent with the post_delete signal.
+    """
+    return getattr(origin, "model", type(origin)) in RESULT_DELETE_ORIGINS
+
+
+def get_fixture_tags(fixture_filter):
+    """
+    Returns the cache tags for the league pages showing a fixture: the
+    season, the season's division and both clubs, and both teams (empty if
+    the fixture no longer exists).
+
+    Args:
+        fixture_filter (dict): Field lookups identifying the fixture.
+    """
+    fixture = (
+        Fixture.objects.filter(**fixture_filter)
+        .values(
+            "season__slug",
+            "division_id",
+            "home_team_id",
+            "away_team_id",
+            "home_team__club_id",
+            "away_team__club_id",
+        )
+        .first()
+    )
+    if fixture is None:
+        return []
+    slug = fixture["season__slug"]
+    return [
+        season_tag(slug),
+        season_tag(slug, division_id=fixture["division_id"]),
+        season_tag(slug, club_id=fixture["home_team__club_id"]),
+        season_tag(slug, club_id=fixture["away_team__club_id"]),
+        team_tag(fixture["home_team_id"]),
+        team_tag(fixture["away_team_id"]),
+    ]
+
+
+# Standings
+@receiver(post_save, sender=Team)
+def create_team_standing(sender, instance, raw, **kwargs):
+    """Ensure every team has a standing record in the correct division."""
+    if raw:
+        return
+    LeagueStanding.objects.update_or_create(
+        team=instance,
+        defaults={
+            "season_id": instance.season_id,
+            "division_id": instance.division_id,
+        },
+    )
+
+
+@receiver(pre_save, sender=Fixture)
+def store_previous_fixture_teams(sender, instance, raw, **kwargs):
+    """Remember the original teams so both old and new can be refreshed."""
+    if raw or not instance.pk:
+        instance._previous_team_ids = []
+        return
+    instance._previous_team_ids = get_fixture_team_ids(instance.pk)
+
+
+@receiver(post_save, sender=Fixture)
+def refresh_fixture_standings(sender, instance, created, raw, **kwargs):
+    """Refresh standings if the teams of a fixture with a result change."""
+    if raw or created:
+        return
+    previous_team_ids = getattr(instance, "_previous_team_ids", [])
+    team_ids = [instance.home_team_id, instance.away_team_id]
+    if set(previous_team_ids) == set(team_ids):
+        return
+    if FixtureResult.objects.filter(fixture=instance).exists():
+        refresh_team_standings(team_ids + previous_team_ids)
+
+
+@receiver(post_save, sender=FixtureResult)
+@receiver(post_delete, sender=FixtureResult)
+def refresh_fixture_result_standings(sender, instance, **kwargs):
+    """Refresh standings for both teams when a result changes."""
+    if kwargs.get("raw"):
+        return
+    refresh_team_standings(get_fixture_team_ids(instance.fixture_id))
+
+
+@receiver(pre_save, sender=SinglesMatch)
+@receiver(pre_save, sender=DoublesMatch)
+def store_previous_fixture_result(sender, instance, raw, **kwargs):
+    """Remember the original result so both old and new can be refreshed."""
+    if raw or not instance.pk:
+        instance._previous_fixture_result_id = None
+        return
+    instance._previous_fixture_result_id = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list("fixture_result_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=SinglesMatch)
+@receiver(post_delete, sender=SinglesMatch)
+@receiver(post_save, sender=DoublesMatch)
+@receiver(post_delete, sender=DoublesMatch)
+def refresh_match_standings(sender, instance, **kwargs):
+    """
+    Refresh the individual set totals of the match's result, then the
+    standings for both teams, when an individual match changes (unless the
+    result is being deleted with it).
+    """
+    if kwargs.get("raw") or is_result_delete(kwargs.get("origin")):
+        return
+    result_ids = {
+        instance.fixture_result_id,
+        getattr(instance, "_previous_fixture_result_id", None),
+    } - {None}
+    refresh_individual_sets(result_ids)
+
+    team_ids = []
+    for result_id in result_ids:
+        team_ids += get_fixture_result_team_ids(result_id)
+    refresh_team_standings(team_ids)
+
+
+# Club membership
+@receiver(pre_save, sender=Team)
+def store_previous_team_membership(sender, instance, raw, **kwargs):
+    """Remember the original season, division and club of a team."""
+    if raw or not instance.pk:
+        instance._previous_membership = None
+        return
+    instance._previous_membership = (
+        Team.objects.filter(pk=instance.pk)
+        .values_list("season_id", "division_id", "club_id")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Team)
+def refresh_team_membership(sender, instance, raw, **kwargs):
+    """
+    Update the clubs stored on the team's fixtures and the season's club
+    list when a team is added or its season, division or club changes.
+    """
+    if raw:
+        return
+    previous = getattr(instance, "_previous_membership", None)
+    current = (instance.season_id, instance.division_id, instance.club_id)
+    if previous == current:
+        return
+    if previous and previous[2] != instance.club_id:
+        refresh_fixture_clubs(
+            Fixture.objects.filter(
+                Q(home_team=instance) | Q(away_team=instance)
+            )
+        )
+    refresh_season_clubs([instance.season_id, previous and previous[0]])
+
+
+@receiver(post_delete, sender=Team)
+def remove_team_membership(sender, instance, **kwargs):
+    """Update the season's club list when a team is deleted."""
+    refresh_season_clubs([instance.season_id])
+
+
+# Last updated times
+@receiver(m2m_changed, sender=Season.divisions.through)
+def touch_season_divisions(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """
+    Update a season's updated_on time when its divisions change, as the
+    many-to-many table has no timestamp of its own.
+    """
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        seasons = Season.objects.filter(pk=instance.pk)
+    elif pk_set:
+        seasons = Season.objects.filter(pk__in=pk_set)
+    else:
+        seasons = Season.objects.all()
+    seasons.update(updated_on=timezone.now())
+
+
+# Records containing each kind of record shown on the conditional pages
+# (see league/conditional.py), whose updated_on time is advanced when a
+# record is deleted so that the pages' Last-Modified time changes
+DELETED_RECORD_PARENTS = {
+    Season: lambda instance: Season.objects.all(),
+    Division: lambda instance: Season.objects.all(),
+    Week: lambda instance: Season.objects.filter(pk=instance.season_id),
+    Team: lambda instance: Season.objects.filter(pk=instance.season_id),
+    TeamPlayer: lambda instance: Season.objects.filter(
+        season_teams=instance.team_id
+    ),
+    Fixture: lambda instance: Season.objects.filter(pk=instance.season_id),
+    FixtureResult: lambda instance: Fixture.objects.filter(
+        pk=instance.fixture_id
+    ),
+    SinglesMatch: lambda instance: Fixture.objects.filter(
+        result=instance.fixture_result_id
+    ),
+    DoublesMatch: lambda instance: Fixture.objects.filter(
+        result=instance.fixture_result_id
+    ),
+    SinglesGame: lambda instance: Fixture.objects.filter(
+        result__singles_matches=instance.singles_match_id
+    ),
+    DoublesGame: lambda instance: Fixture.objects.filter(
+        result__doubles_match=instance.doubles_match_id
+    ),
+    ClubInfo: lambda instance: Club.objects.filter(pk=instance.club_id),
+    ClubVenue: lambda instance: Club.objects.filter(pk=instance.club_id),
+    ClubReview: lambda instance: Club.objects.filter(pk=instance.club_id),
+    VenueInfo: lambda instance: Venue.objects.filter(pk=instance.venue_id),
+}
+
+
+@receiver(post_delete, sender=Season)
+@receiver(post_delete, sender=Division)
+@receiver(post_delete, sender=Week)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=TeamPlayer)
+@receiver(post_delete, sender=Fixture)
+@receiver(post_delete, sender=FixtureResult)
+@receiver(post_delete, sender=SinglesMatch)
+@receiver(post_delete, sender=DoublesMatch)
+@receiver(post_delete, sender=SinglesGame)
+@receiver(post_delete, sender=DoublesGame)
+@receiver(post_delete, sender=ClubInfo)
+@receiver(post_delete, sender=ClubVenue)
+@receiver(post_delete, sender=ClubReview)
+@receiver(post_delete, sender=VenueInfo)
+def touch_deleted_record_parent(sender, instance, origin=None, **kwargs):
+    """
+    Update the updated_on time of the record containing a deleted record.
+    Deleting a record lowers (or leaves) the latest updated_on time of the
+    records a page shows, so without this a page's Last-Modified time
+    would not change.
+
+    Records deleted because a record in DELETED_RECORD_PARENTS was deleted
+    are skipped, as that record's own deletion updates its parent.
+    """
+    origin_model = getattr(origin, "model", type(origin))
+    if origin_model is not sender and origin_model in DELETED_RECORD_PARENTS:
+        return
+    DELETED_RECORD_PARENTS[sender](instance).update(updated_on=timezone.now())
+
+
+# Cached league pages
+@receiver(pre_save, sender=Fixture)
+@receiver(pre_delete, sender=Fixture)
+def store_previous_fixture_tags(sender, instance, **kwargs):
+    """
+    Remember the cache tags for the fixture before it changes so that pages
+    showing it in its old season, division or teams are also invalidated.
+    """
+    if kwargs.get("raw") or not instance.pk:
+        instance._previous_tags = []
+        return
+    instance._previous_tags = get_fixture_tags({"id": instance.pk})
+
+
+@receiver(post_save, sender=Fixture)
+@receiver(post_delete, sender=Fixture)
+def invalidate_fixture_pages(sender, instance, **kwargs):
+    """Invalidate cached pages showing a fixture when it changes."""
+    if kwargs.get("raw"):
+        return
+    tags = getattr(instance, "_previous_tags", [])
+    if kwargs.get("signal") is post_save:
+        tags = tags + get_fixture_tags({"id": instance.pk})
+    invalidate_tags(tags)
+
+
+@receiver(post_save, sender=FixtureResult)
+@receiver(post_delete, sender=FixtureResult)
+def invalidate_fixture_result_pages(sender, instance, **kwargs):
+    """Invalidate cached pages showing a fixture when its result changes."""
+    if kwargs.get("raw"):
+        return
+    invalidate_tags(get_fixture_tags({"id": instance.fixture_id}))
+
+
+@receiver(post_save, sender=SinglesMatch)
+@receiver(post_delete, sender=SinglesMatch)
+@receiver(post_save, sender=DoublesMatch)
+@receiver(post_delete, sender=DoublesMatch)
+def invalidate_match_pages(sender, instance, **kwargs):
+    """
+    Invalidate cached pages showing a fixture when a match changes (unless
+    its result is being deleted with it).
+    """
+    if kwargs.get("raw") or is_result_delete(kwargs.get("origin")):
+        return
+    invalidate_tags(
+        get_fixture_tags({"result__id": instance.fixture_result_id})
+    )
+
+
+@receiver(post_save, sender=Season)
+@receiver(post_delete, sender=Season)
+@receiver(m2m_changed, sender=Season.divisions.through)
+def invalidate_season_pages(sender, **kwargs):
+    """
+    Invalidate every cached league page when a season changes (e.g. the
+    current season, visible seasons or season divisions), along with the
+    seasons held by each worker.
+    """
+    if kwargs.get("raw"):
+        return
+    invalidate_tags([SEASONS_TAG, SEASON_LIST_TAG])
+
+
+@receiver(post_save, sender=Division)
+@receiver(post_delete, sender=Division)
+@receiver(post_save, sender=Week)
+@receiver(post_delete, sender=Week)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+@receiver(post_save, sender=TeamPlayer)
+@receiver(post_delete, sender=TeamPlayer)
+@receiver(post_save, sender=Player)
+@receiver(post_delete, sender=Player)
+def invalidate_league_pages(sender, **kwargs):
+    """
+    Invalidate every cached league page when league reference data changes.
+
+    These records are shown throughout the league pages (e.g. team and
+    player names) but rarely change, so all pages are invalidated.
+    """
+    if kwargs.get("raw"):
+        return
+    invalidate_tags([SEASONS_TAG])
+
+
+@receiver(post_save, sender=Division)
+@receiver(post_delete, sender=Division)
+@receiver(post_save, sender=Club)
+@receiver(post_delete, sender=Club)
+def invalidate_season_list(sender, **kwargs):
+    """
+    Reload the seasons and club filter options held by each worker when a
+    division or club changes.
+    """
+    if kwargs.get("raw"):
+        return
+    invalidate_tags([SEASON_LIST_TAG])
+
+
+@receiver(post_save, sender=Club)
+@receiver(post_delete, sender=Club)
+@receiver(post_save, sender=Venue)
+@receiver(post_delete, sender=Venue)
+def invalidate_club_pages(sender, **kwargs):
+    """Invalidate every cached league page when a club or venue changes."""
+    if kwargs.get("raw"):
+        return
+    invalidate_tags([CLUBS_TAG])
+
+
+# Archived seasons
+@receiver(post_save, sender=SeasonArchive)
+@receiver(post_delete, sender=SeasonArchive)
+def invalidate_season_archives(sender, **kwargs):
+    """Reload the archived season snapshots when one is stored or removed."""
+    if kwargs.get("raw"):
+        return
+    invalidate_tags([ARCHIVES_TAG])
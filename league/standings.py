@@ -0,0 +1,277 @@
+"""
+Calculation and storage of league table standings.
+
+League tables are read from the LeagueStanding model rather than being
+calculated from results on every request. The helpers in this module
+recalculate the stored standings for the teams affected by a change in
+results (see league/signals.py) and rebuild them from scratch.
+
+Standings are calculated from FixtureResult alone: the individual sets
+won in each result's singles and doubles matches are stored on the result
+(see refresh_individual_sets) when the matches change.
+"""
+
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from .models import (
+    DoublesMatch,
+    FixtureResult,
+    LeagueStanding,
+    Season,
+    SinglesMatch,
+    Team,
+)
+
+
+# Constants
+POINTS_FOR_WIN = 2
+POINTS_FOR_DRAW = 1
+
+# Order of teams in a league table
+STANDING_ORDER = [
+    "-points",
+    "-won",
+    "-team_sets_won",
+    "-individual_sets_won",
+    "team__team_name",
+]
+
+# Fields updated when saving recalculated standings
+STANDING_FIELDS = [
+    "season",
+    "division",
+    "played",
+    "won",
+    "drawn",
+    "lost",
+    "team_sets_won",
+    "individual_sets_won",
+    "points",
+]
+
+
+def get_default_standing_data():
+    """
+    Defines the default standing data for a team with no results.
+
+    Returns:
+        dict: A dictionary with a zero value for each stat stored in the
+              LeagueStanding model (played, won, drawn, lost, team_sets_won,
+              individual_sets_won and points).
+    """
+    return {
+        "played": 0,
+        "won": 0,
+        "drawn": 0,
+        "lost": 0,
+        "team_sets_won": 0,
+        "individual_sets_won": 0,
+        "points": 0,
+    }
+
+
+def get_side_totals(fixture_results, side):
+    """
+    Aggregates fixture results from the perspective of the home or away team.
+
+    Produces one row per team with conditional counts of wins, draws and
+    losses, plus sums of team sets and individual (singles and doubles)
+    sets, all grouped in the database.
+
+    Args:
+        fixture_results (QuerySet[FixtureResult]): The results to aggregate.
+        side (str): Either "home" or "away".
+
+    Returns:
+        QuerySet: A values queryset with keys 'team_id' and each stat stored
+                  in the LeagueStanding model.
+    """
+    opponent = "away" if side == "home" else "home"
+
+    return (
+        fixture_results.values(team_id=F(f"fixture__{side}_team"))
+        .annotate(
+            played=Count("id"),
+            won=Count("id", filter=Q(winner=side)),
+            drawn=Count("id", filter=Q(winner="draw")),
+            lost=Count("id", filter=Q(winner=opponent)),
+            team_sets_won=Sum(f"{side}_score"),
+            individual_sets_won=Sum(f"{side}_individual_sets"),
+            points=(
+                Count("id", filter=Q(winner=side)) * POINTS_FOR_WIN
+                + Count("id", filter=Q(winner="draw")) * POINTS_FOR_DRAW
+            ),
+        )
+        .order_by()
+    )
+
+
+def get_individual_sets(side):
+    """
+    Builds an expression totalling the sets won by the home or away side
+    in a fixture result's singles and doubles matches.
+
+    Args:
+        side (str): Either "home" or "away".
+
+    Returns:
+        Expression: For use in an update or annotation of FixtureResult.
+    """
+    singles_sets = (
+        SinglesMatch.objects.filter(fixture_result=OuterRef("pk"))
+        .values("fixture_result")
+        .annotate(total=Sum(f"{side}_sets"))
+        .values("total")
+    )
+    doubles_sets = DoublesMatch.objects.filter(
+        fixture_result=OuterRef("pk")
+    ).values(f"{side}_sets")
+    return Coalesce(Subquery(singles_sets), 0) + Coalesce(
+        Subquery(doubles_sets), 0
+    )
+
+
+def refresh_individual_sets(fixture_result_ids):
+    """
+    Recalculates the stored individual set totals of the specified fixture
+    results from their singles and doubles matches in a single UPDATE.
+
+    Called by signal handlers whenever a match is saved or deleted.
+
+    Args:
+        fixture_result_ids (Iterable[int]): IDs of the results to refresh.
+    """
+    FixtureResult.objects.filter(id__in=set(fixture_result_ids)).update(
+        home_individual_sets=get_individual_sets("home"),
+        away_individual_sets=get_individual_sets("away"),
+    )
+
+
+def calculate_team_standings(teams, season=None):
+    """
+    Calculates the league standing data for the specified teams from their
+    fixture results.
+
+    Home and away totals for every team are produced by a single SQL query
+    (see get_side_totals) and combined here.
+
+    Args:
+        teams (Iterable[Team]): The teams to calculate standings for.
+        season (Season, optional): If given, all results in the season are
+                                   aggregated at once (use when calculating
+                                   standings for every team in a season).
+
+    Returns:
+        dict: A dictionary mapping each team ID to its standing data
+              (see get_default_standing_data for keys).
+    """
+    teams_data = {team.id: get_default_standing_data() for team in teams}
+    if not teams_data:
+        return teams_data
+
+    if season is not None:
+        home_results = FixtureResult.objects.filter(fixture__season=season)
+        away_results = home_results
+    else:
+        team_ids = list(teams_data)
+        home_results = FixtureResult.objects.filter(
+            fixture__home_team_id__in=team_ids
+        )
+        away_results = FixtureResult.objects.filter(
+            fixture__away_team_id__in=team_ids
+        )
+
+    totals = get_side_totals(home_results, "home").union(
+        get_side_totals(away_results, "away"), all=True
+    )
+
+    for row in totals:
+        data = teams_data.get(row["team_id"])
+        if data is None:
+            continue
+        for field in data:
+            data[field] += row[field] or 0
+
+    return teams_data
+
+
+def save_team_standings(teams, teams_data):
+    """
+    Creates or updates the LeagueStanding records for the specified teams.
+
+    Args:
+        teams (Iterable[Team]): The teams whose standings are being saved.
+        teams_data (dict): A dictionary mapping team IDs to standing data
+                           as returned by calculate_team_standings.
+    """
+    teams = list(teams)
+    existing = {
+        standing.team_id: standing
+        for standing in LeagueStanding.objects.filter(team__in=teams)
+    }
+
+    to_create = []
+    to_update = []
+    for team in teams:
+        values = teams_data[team.id]
+        standing = existing.get(team.id)
+        if standing is None:
+            to_create.append(
+                LeagueStanding(
+                    team=team,
+                    season_id=team.season_id,
+                    division_id=team.division_id,
+                    **values,
+                )
+            )
+            continue
+
+        standing.season_id = team.season_id
+        standing.division_id = team.division_id
+        for field, value in values.items():
+            setattr(standing, field, value)
+        to_update.append(standing)
+
+    with transaction.atomic():
+        LeagueStanding.objects.bulk_create(to_create)
+        LeagueStanding.objects.bulk_update(to_update, STANDING_FIELDS)
+
+
+def refresh_team_standings(team_ids):
+    """
+    Recalculates and saves the stored standings for the specified teams.
+
+    Called by signal handlers whenever a result affecting these teams is
+    saved or deleted.
+
+    Args:
+        team_ids (Iterable[int]): IDs of the teams to refresh.
+    """
+    teams = list(Team.objects.filter(id__in=set(team_ids)))
+    if teams:
+        save_team_standings(teams, calculate_team_standings(teams))
+
+
+def rebuild_league_standings(seasons=None):
+    """
+    Recalculates the stored standings for every team from scratch.
+
+    Args:
+        seasons (QuerySet[Season], optional): Limits the rebuild to these
+                                              seasons. Defaults to all seasons.
+
+    Returns:
+        int: The number of teams whose standings were rebuilt.
+    """
+    if seasons is None:
+        seasons = Season.objects.all()
+
+    count = 0
+    for season in seasons:
+        teams = list(Team.objects.filter(season=season))
+        save_team_standings(
+            teams, calculate_team_standings(teams, season=season)
+        )
+        count += len(teams)
+    return count
@@ -0,0 +1,71 @@
+"""
+Streamed rendering of the full-season fixtures and results pages.
+
+A page showing every week of a season (weeks=all, see league/paging.py) is
+not built in memory before it is sent. The page is first rendered with a
+marker where its weeks go and everything before the marker (the navbar,
+title and filters) is sent straight away. Each week is then rendered and
+sent in turn, followed by the rest of the page, so the rendered page is
+never held in memory as a whole. The weeks and their fixtures come from
+the worker's season index (see league/season_index.py), so no queries are
+made once the page has started.
+
+Streamed pages skip the section cache (see league/cache.py), but still
+answer conditional GET requests (see league/conditional.py).
+"""
+
+from django.http import StreamingHttpResponse
+from django.template.loader import get_template, render_to_string
+from django.utils.safestring import mark_safe
+
+
+# Rendered by the section templates in place of the weeks
+WEEKS_MARKER = mark_safe("<!-- streamed weeks -->")
+
+
+# Helper functions
+def stream_weeks(head, tail, week_template, context, weeks, request):
+    """Yields the start of a page, each of its weeks and then the rest."""
+    yield head
+    for week in weeks:
+        yield week_template.render({**context, "week": week}, request)
+    yield tail
+
+
+# Streamed pages
+def stream_weeks_page(
+    request, page_template, section_template, week_template, context
+):
+    """
+    Returns a streaming response for a page whose section lists weeks.
+
+    Args:
+        request (HttpRequest): The request.
+        page_template (str): The page template (renders the section).
+        section_template (str): The section template (renders
+                                WEEKS_MARKER in place of the weeks).
+        week_template (str): The template rendering each week.
+        context (dict): The section context, with the weeks (and their
+                        fixtures) to stream as "streamed_weeks".
+
+    Returns:
+        StreamingHttpResponse: The page.
+    """
+    context = dict(context)
+    weeks = context.pop("streamed_weeks")
+    section = render_to_string(
+        section_template, {**context, "weeks_marker": WEEKS_MARKER}, request
+    )
+    page = render_to_string(page_template, {"section": section}, request)
+    head, _, tail = page.partition(WEEKS_MARKER)
+    return StreamingHttpResponse(
+        stream_weeks(
+            head,
+            tail,
+            get_template(week_template),
+            context,
+            weeks,
+            request,
+        ),
+        content_type="text/html; charset=utf-8",
+    )
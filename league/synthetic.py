@@ -0,0 +1,589 @@
+"""
+Generation of a large synthetic league for benchmarks and load testing
+(see the seed_league management command).
+
+Creates clubs (with approved club and venue information and reviews),
+divisions, seasons, weeks, teams, players, team registrations, a double
+round-robin fixture list (see league/fixture_generator.py) and complete
+scorecards with game-level scores. Every record is created with
+bulk_create and all random choices come from one seeded generator, so the
+same arguments always produce the same league.
+
+bulk_create does not send signals, so stored standings are rebuilt and
+cached league pages are invalidated once the league has been created.
+"""
+
+import random
+from datetime import date, datetime, time, timedelta
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.text import slugify
+from clubs.models import (
+    Club,
+    ClubInfo,
+    ClubReview,
+    ClubVenue,
+    Venue,
+    VenueInfo,
+)
+from .cache import (
+    CLUBS_TAG,
+    SEASON_LIST_TAG,
+    SEASONS_TAG,
+    invalidate_tags,
+)
+from .fixture_generator import build_season_fixtures
+from .membership import refresh_season_clubs
+from .models import (
+    Division,
+    DoublesGame,
+    DoublesMatch,
+    Fixture,
+    FixtureResult,
+    Player,
+    Season,
+    SinglesGame,
+    SinglesMatch,
+    Team,
+    TeamPlayer,
+    Week,
+)
+from .standings import rebuild_league_standings
+
+
+# Constants
+DEFAULT_BATCH_SIZE = 1000
+PLAYERS_PER_TEAM = 4
+REVIEWS_PER_CLUB = 3
+HOME_TIMES = [time(19, 0), time(19, 30), time(19, 45)]
+
+FORENAMES = (
+    "Alex Ben Chloe Dan Emma Finn Grace Harry Isla Jack Kate Liam Mia Noah "
+    "Olivia Priya Raj Sara Tom Zoe"
+).split()
+SURNAMES = (
+    "Ahmed Brown Clarke Davies Evans Fisher Green Hughes Jones Khan Lewis "
+    "Morgan Patel Roberts Smith Taylor Walker Wilson Wood Wright"
+).split()
+
+
+# Game and match scores
+def get_game_points(rng, winner):
+    """
+    Returns random (home, away) points for a game won by the specified side.
+
+    Most games are won with 11 points; some go to extended play, which must
+    be won by exactly 2 points (see SinglesGame.clean).
+    """
+    if rng.random() < 0.15:
+        losing_points = rng.randint(10, 14)
+        winning_points = losing_points + 2
+    else:
+        losing_points = rng.randint(0, 9)
+        winning_points = SinglesGame.MIN_WINNING_SCORE
+    if winner == "home":
+        return winning_points, losing_points
+    return losing_points, winning_points
+
+
+def get_match_games(rng, winner, target_sets=SinglesMatch.TARGET_SETS):
+    """
+    Returns random (home, away) points for each game in a best-of-5 match
+    won by the specified side (the winner always wins the last game).
+    """
+    loser = "away" if winner == "home" else "home"
+    set_winners = [winner] * (target_sets - 1)
+    set_winners += [loser] * rng.randint(0, target_sets - 1)
+    rng.shuffle(set_winners)
+    set_winners.append(winner)
+    return [get_game_points(rng, set_winner) for set_winner in set_winners]
+
+
+def get_match_winner(rng, home_strength, away_strength):
+    """Returns the random winner of a match between two strengths."""
+    home_chance = home_strength / (home_strength + away_strength)
+    return "home" if rng.random() < home_chance else "away"
+
+
+# Reference data
+def create_clubs(rng, prefix, num_clubs, batch_size):
+    """
+    Creates clubs, each with one venue and approved club and venue
+    information, plus approved reviews from synthetic users.
+
+    Returns:
+        list[Club]: The created clubs (with a 'venue' attribute).
+    """
+    clubs = Club.objects.bulk_create(
+        [Club(name=f"{prefix} Club {num}") for num in range(1, num_clubs + 1)],
+        batch_size=batch_size,
+    )
+    venues = Venue.objects.bulk_create(
+        [Venue(name=f"{club.name} Venue") for club in clubs],
+        batch_size=batch_size,
+    )
+    ClubVenue.objects.bulk_create(
+        [
+            ClubVenue(club=club, venue=venue)
+            for club, venue in zip(clubs, venues)
+        ],
+        batch_size=batch_size,
+    )
+    ClubInfo.objects.bulk_create(
+        [
+            ClubInfo(
+                club=club,
+                contact_name=f"{club.name} Secretary",
+                contact_email=f"club{club.id}@example.com",
+                description=f"{club.name} is a synthetic benchmark club.",
+                session_info="Weekday evenings.",
+                beginners=rng.random() < 0.5,
+                intermediates=True,
+                advanced=rng.random() < 0.5,
+                adults=True,
+                league=True,
+                approved=True,
+            )
+            for club in clubs
+        ],
+        batch_size=batch_size,
+    )
+    VenueInfo.objects.bulk_create(
+        [
+            VenueInfo(
+                venue=venue,
+                street_address=f"{num} High Street",
+                city="Synthetic City",
+                county="Synthetic County",
+                postcode="AB1 2CD",
+                num_tables=rng.randint(2, 12),
+                parking_info="On-site parking.",
+                meets_league_standards=True,
+                approved=True,
+                latitude=53.4 + rng.uniform(-0.2, 0.2),
+                longitude=-2.2 + rng.uniform(-0.2, 0.2),
+            )
+            for num, venue in enumerate(venues, start=1)
+        ],
+        batch_size=batch_size,
+    )
+
+    users = User.objects.bulk_create(
+        [
+            User(
+                username=f"{slugify(prefix)}-reviewer-{num}",
+                password="!",  # Unusable password
+            )
+            for num in range(1, REVIEWS_PER_CLUB + 1)
+        ],
+        batch_size=batch_size,
+    )
+    ClubReview.objects.bulk_create(
+        [
+            ClubReview(
+                club=club,
+                user=user,
+                score=rng.randint(1, 5),
+                headline=f"Review of {club.name}",
+                review_text="A synthetic review.",
+                approved=True,
+            )
+            for club in clubs
+            for user in users
+        ],
+        batch_size=batch_size,
+    )
+
+    for club, venue in zip(clubs, venues):
+        club.venue = venue
+    return clubs
+
+
+def create_players(clubs, num_players, batch_size):
+    """
+    Creates confirmed players for each club.
+
+    Names repeat, so dates of birth are made unique per player (following
+    on from any existing players) to satisfy the unique name and date of
+    birth constraint.
+
+    Returns:
+        dict: A list of created players for each club ID.
+    """
+    first_num = Player.objects.count()
+    players = []
+    for club in clubs:
+        for _ in range(num_players):
+            num = first_num + len(players)
+            players.append(
+                Player(
+                    forename=FORENAMES[num % len(FORENAMES)],
+                    surname=SURNAMES[num // len(FORENAMES) % len(SURNAMES)],
+                    date_of_birth=date(1960, 1, 1) + timedelta(days=num),
+                    current_club=club,
+                    club_status="confirmed",
+                )
+            )
+    Player.objects.bulk_create(players, batch_size=batch_size)
+
+    club_players = {club.id: [] for club in clubs}
+    for player in players:
+        club_players[player.current_club_id].append(player)
+    return club_players
+
+
+def create_season(prefix, start_date, divisions, is_current):
+    """Creates a season (with its divisions) starting on a date."""
+    start_year = start_date.year
+    years = f"{start_year % 100:02d}-{(start_year + 1) % 100:02d}"
+    season = Season.objects.create(
+        name=f"{prefix} {start_year}/{(start_year + 1) % 100:02d}",
+        short_name=f"{prefix[:10]} {years}",
+        slug=f"{slugify(prefix)[:10]}-{years}",
+        start_date=start_date,
+        end_date=start_date + timedelta(weeks=40),
+        registration_opens=timezone.make_aware(
+            datetime.combine(start_date - timedelta(weeks=12), time(9, 0))
+        ),
+        registration_closes=timezone.make_aware(
+            datetime.combine(start_date - timedelta(weeks=2), time(9, 0))
+        ),
+        is_visible=True,
+        is_current=is_current,
+    )
+    Season.divisions.through.objects.bulk_create(
+        [
+            Season.divisions.through(season=season, division=division)
+            for division in divisions
+        ]
+    )
+    return season
+
+
+# Results
+def build_scorecard_records(rng, result, home_players, away_players, teams):
+    """
+    Builds the unsaved singles and doubles matches (and games) for a fixture
+    result, where each of three home players plays each of three away
+    players. The result's scores and winner are derived from the matches.
+
+    Returns:
+        tuple: Lists of singles matches, (match, games) pairs for singles
+               and the doubles match, its games and its players.
+    """
+    fixture = result.fixture
+    home_strength = teams[fixture.home_team_id].strength
+    away_strength = teams[fixture.away_team_id].strength
+
+    singles = []
+    singles_games = []
+    for home_player in home_players:
+        for away_player in away_players:
+            winner = get_match_winner(rng, home_strength, away_strength)
+            match = SinglesMatch(
+                fixture_result=result,
+                home_player=home_player,
+                away_player=away_player,
+                winner=winner,
+            )
+            games = get_match_games(rng, winner)
+            match.home_sets = sum(home > away for home, away in games)
+            match.away_sets = len(games) - match.home_sets
+            singles.append(match)
+            singles_games.append((match, games))
+
+    winner = get_match_winner(rng, home_strength, away_strength)
+    doubles = DoublesMatch(fixture_result=result, winner=winner)
+    doubles_games = get_match_games(rng, winner)
+    doubles.home_sets = sum(home > away for home, away in doubles_games)
+    doubles.away_sets = len(doubles_games) - doubles.home_sets
+    doubles_players = (
+        rng.sample(home_players, 2),
+        rng.sample(away_players, 2),
+    )
+
+    matches = singles + [doubles]
+    result.home_score = sum(match.winner == "home" for match in matches)
+    result.away_score = len(matches) - result.home_score
+    if result.home_score > result.away_score:
+        result.winner = "home"
+    elif result.home_score < result.away_score:
+        result.winner = "away"
+    else:
+        result.winner = "draw"
+    result.set_individual_sets(matches)
+
+    return singles, singles_games, (doubles, doubles_games, doubles_players)
+
+
+def create_results(rng, fixtures, teams, team_players, batch_size):
+    """
+    Creates a complete scorecard (fixture result, 9 singles matches and one
+    doubles match, each with its games) for each fixture.
+
+    Returns:
+        int: The number of games created.
+    """
+    results = []
+    all_singles = []
+    singles_games = []
+    doubles_records = []
+    for fixture in fixtures:
+        result = FixtureResult(fixture=fixture, status="played")
+        home_players = rng.sample(team_players[fixture.home_team_id], 3)
+        away_players = rng.sample(team_players[fixture.away_team_id], 3)
+        singles, games, doubles = build_scorecard_records(
+            rng, result, home_players, away_players, teams
+        )
+        results.append(result)
+        all_singles.extend(singles)
+        singles_games.extend(games)
+        doubles_records.append(doubles)
+
+    FixtureResult.objects.bulk_create(results, batch_size=batch_size)
+    SinglesMatch.objects.bulk_create(all_singles, batch_size=batch_size)
+    DoublesMatch.objects.bulk_create(
+        [doubles for doubles, _, _ in doubles_records], batch_size=batch_size
+    )
+
+    home_through = DoublesMatch.home_players.through
+    away_through = DoublesMatch.away_players.through
+    home_through.objects.bulk_create(
+        [
+            home_through(doublesmatch=doubles, teamplayer=player)
+            for doubles, _, (home_players, _) in doubles_records
+            for player in home_players
+        ],
+        batch_size=batch_size,
+    )
+    away_through.objects.bulk_create(
+        [
+            away_through(doublesmatch=doubles, teamplayer=player)
+            for doubles, _, (_, away_players) in doubles_records
+            for player in away_players
+        ],
+        batch_size=batch_size,
+    )
+
+    games = SinglesGame.objects.bulk_create(
+        [
+            SinglesGame(
+                singles_match=match,
+                set_num=set_num,
+                home_points=home,
+                away_points=away,
+                winner="home" if home > away else "away",
+            )
+            for match, match_games in singles_games
+            for set_num, (home, away) in enumerate(match_games, start=1)
+        ],
+        batch_size=batch_size,
+    )
+    games += DoublesGame.objects.bulk_create(
+        [
+            DoublesGame(
+                doubles_match=doubles,
+                set_num=set_num,
+                home_points=home,
+                away_points=away,
+                winner="home" if home > away else "away",
+            )
+            for doubles, doubles_games, _ in doubles_records
+            for set_num, (home, away) in enumerate(doubles_games, start=1)
+        ],
+        batch_size=batch_size,
+    )
+    return len(games)
+
+
+# League
+def create_teams(rng, season, divisions, clubs, club_players, batch_size):
+    """
+    Creates one team per club in each division of a season and registers
+    a different group of each club's players with each of its teams.
+
+    Returns:
+        tuple: The created teams keyed by ID (each with a random 'strength'
+               attribute) and their team players keyed by team ID.
+    """
+    teams = []
+    registrations = []
+    for division_num, division in enumerate(divisions):
+        for club in clubs:
+            team = Team(
+                season=season,
+                division=division,
+                club=club,
+                home_venue=club.venue,
+                team_name=f"{club.name} {division_num + 1}".title(),
+                home_day=rng.choice(Team.DAY_CHOICES)[0],
+                home_time=rng.choice(HOME_TIMES),
+                approved=True,
+            )
+            team.strength = rng.uniform(0.5, 1.5)
+            start = division_num * PLAYERS_PER_TEAM
+            players = club_players[club.id][start : start + PLAYERS_PER_TEAM]
+            registrations.append(
+                [
+                    TeamPlayer(player=player, team=team, paid_fees=True)
+                    for player in players
+                ]
+            )
+            teams.append(team)
+
+    Team.objects.bulk_create(teams, batch_size=batch_size)
+    TeamPlayer.objects.bulk_create(
+        [
+            team_player
+            for team_registrations in registrations
+            for team_player in team_registrations
+        ],
+        batch_size=batch_size,
+    )
+    refresh_season_clubs([season.id])
+    team_players = {
+        team.id: team_registrations
+        for team, team_registrations in zip(teams, registrations)
+    }
+    return {team.id: team for team in teams}, team_players
+
+
+def create_season_league(rng, season, divisions, clubs, club_players, options):
+    """
+    Creates the weeks, teams, fixtures and (for fixtures before today)
+    results for a season, then rebuilds its standings.
+
+    Results are created for batch_size fixtures at a time so that memory
+    use does not grow with the size of the season.
+
+    Args:
+        options (dict): 'num_weeks' and 'batch_size'.
+
+    Returns:
+        dict: The number of fixtures, results and games created.
+    """
+    batch_size = options["batch_size"]
+    now = timezone.now()
+    games = 0
+
+    Week.objects.bulk_create(
+        [
+            Week(
+                season=season,
+                name=f"Week {num + 1}",
+                details="",
+                start_date=season.start_date + timedelta(weeks=num),
+            )
+            for num in range(options["num_weeks"])
+        ]
+    )
+    teams, team_players = create_teams(
+        rng, season, divisions, clubs, club_players, batch_size
+    )
+
+    # Fixtures before today have been played
+    fixtures = build_season_fixtures(season)
+    for fixture in fixtures:
+        if fixture.datetime < now:
+            fixture.status = "completed"
+    Fixture.objects.bulk_create(fixtures, batch_size=batch_size)
+    played = [
+        fixture for fixture in fixtures if fixture.status == "completed"
+    ]
+    for start in range(0, len(played), batch_size):
+        games += create_results(
+            rng,
+            played[start : start + batch_size],
+            teams,
+            team_players,
+            batch_size,
+        )
+
+    rebuild_league_standings(Season.objects.filter(id=season.id))
+    return {"fixtures": len(fixtures), "results": len(played), "games": games}
+
+
+def create_synthetic_league(
+    num_seasons,
+    num_divisions,
+    teams_per_division,
+    seed=0,
+    prefix="Synthetic",
+    batch_size=DEFAULT_BATCH_SIZE,
+    make_current=True,
+    log=None,
+):
+    """
+    Creates a synthetic league.
+
+    Each club enters one team per division in every season. The last season
+    is half played (it started half a season ago), while earlier seasons
+    are complete. The clubs, players and divisions are created in one
+    transaction and then each season in its own transaction.
+
+    Args:
+        num_seasons (int): Number of seasons.
+        num_divisions (int): Number of divisions in each season.
+        teams_per_division (int): Number of teams (and clubs) per division.
+        seed (int): Seed for the random generator.
+        prefix (str): Prefix for club, division and season names.
+        batch_size (int): Maximum number of rows per insert.
+        make_current (bool): Whether the last season becomes the current
+                             season.
+        log (callable, optional): Called with a message as each season is
+                                  created.
+
+    Returns:
+        dict: The number of seasons, fixtures, results and games created.
+    """
+    rng = random.Random(seed)
+    counts = {"seasons": num_seasons, "fixtures": 0, "results": 0, "games": 0}
+    num_weeks = 2 * (teams_per_division - 1 + teams_per_division % 2)
+    options = {"num_weeks": num_weeks, "batch_size": batch_size}
+
+    # Current season started half way through its weeks
+    today = timezone.localdate()
+    current_start = today - timedelta(
+        weeks=num_weeks // 2, days=today.weekday()
+    )
+
+    with transaction.atomic():
+        clubs = create_clubs(rng, prefix, teams_per_division, batch_size)
+        club_players = create_players(
+            clubs, PLAYERS_PER_TEAM * num_divisions, batch_size
+        )
+        max_rank = Division.objects.aggregate(Max("rank"))["rank__max"] or 0
+        divisions = Division.objects.bulk_create(
+            [
+                Division(name=f"{prefix} Division {num}", rank=max_rank + num)
+                for num in range(1, num_divisions + 1)
+            ]
+        )
+
+    for season_num in range(num_seasons):
+        is_current = make_current and season_num == num_seasons - 1
+        start_date = current_start - timedelta(
+            weeks=52 * (num_seasons - 1 - season_num)
+        )
+        with transaction.atomic():
+            if is_current:
+                Season.objects.filter(is_current=True).update(
+                    is_current=False
+                )
+            season = create_season(prefix, start_date, divisions, is_current)
+            season_counts = create_season_league(
+                rng, season, divisions, clubs, club_players, options
+            )
+        for key, value in season_counts.items():
+            counts[key] += value
+        if log:
+            log(
+                f"{season}: {season_counts['fixtures']} fixtures, "
+                f"{season_counts['results']} results, "
+                f"{season_counts['games']} games"
+            )
+
+    invalidate_tags([SEASONS_TAG, SEASON_LIST_TAG, CLUBS_TAG])
+    return counts
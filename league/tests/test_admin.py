@@ -0,0 +1,207 @@
+from datetime import time
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from test_utils.helpers import (
+    create_division,
+    create_doubles_game,
+    create_doubles_match,
+    create_fixture,
+    create_fixture_result,
+    create_fixture_result_setup,
+    create_player,
+    create_season,
+    create_singles_game,
+    create_singles_match,
+    create_team,
+    create_team_player,
+    create_week,
+)
+
+# Models whose changelists show related records in each row
+CHANGELIST_MODELS = [
+    "week",
+    "player",
+    "teamplayer",
+    "team",
+    "fixture",
+    "fixtureresult",
+    "singlesmatch",
+    "doublesmatch",
+    "singlesgame",
+    "doublesgame",
+]
+
+
+class LeagueAdminQueryTests(TestCase):
+    """
+    Tests that the league admin changelists and autocomplete results run a
+    fixed number of queries however many rows they show.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = create_fixture_result_setup()
+        cls.user = User.objects.create_superuser(
+            username="admin", password="password"
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.week_num = 1
+
+    def add_fixture_with_matches(self):
+        """
+        Adds a fixture between two new teams, with a result, matches and
+        games for new players.
+        """
+        data = self.data
+        self.week_num += 1
+        teams = [
+            create_team(
+                data["season"],
+                data["division"],
+                data["club"],
+                data["venue"],
+                f"Team {self.week_num}{side}",
+                "monday",
+                time(19, 0),
+            )
+            for side in ["H", "A"]
+        ]
+        fixture = create_fixture(
+            data["season"],
+            data["division"],
+            create_week(data["season"], self.week_num),
+            *teams,
+        )
+        result = create_fixture_result(fixture, 6, 4)
+        players = [
+            create_team_player(
+                create_player(f"Player{self.week_num}", surname, data["club"]),
+                teams[num // 2],
+            )
+            for num, surname in enumerate(["Alpha", "Bravo", "Cat", "Dee"])
+        ]
+        match = create_singles_match(result, players[0], players[2], 3, 0)
+        create_singles_game(match, 1, 11, 5)
+        doubles = create_doubles_match(result, players[:2], players[2:], 0, 3)
+        create_doubles_game(doubles, 1, 5, 11)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def get_counts(self, urls):
+        return {url: self.count_queries(url) for url in urls}
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        urls = [
+            reverse(f"admin:league_{model}_changelist")
+            for model in CHANGELIST_MODELS
+        ]
+        self.add_fixture_with_matches()
+        counts = self.get_counts(urls)
+        for _ in range(3):
+            self.add_fixture_with_matches()
+        self.assertEqual(self.get_counts(urls), counts)
+
+    def test_change_forms_render_autocomplete_widgets(self):
+        for model in CHANGELIST_MODELS:
+            with self.subTest(model=model):
+                response = self.client.get(
+                    reverse(f"admin:league_{model}_add")
+                )
+                self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "admin-autocomplete")
+
+    def test_autocomplete_queries_do_not_grow_with_results(self):
+        """Verify autocomplete results showing related records."""
+        autocomplete_url = reverse("admin:autocomplete")
+        urls = [
+            f"{autocomplete_url}?app_label=league&model_name={model}"
+            f"&field_name={field}"
+            for model, field in [
+                ("fixtureresult", "fixture"),
+                ("singlesmatch", "fixture_result"),
+                ("singlesmatch", "home_player"),
+                ("singlesgame", "singles_match"),
+                ("doublesgame", "doubles_match"),
+            ]
+        ]
+        self.add_fixture_with_matches()
+        counts = self.get_counts(urls)
+        for _ in range(3):
+            self.add_fixture_with_matches()
+        self.assertEqual(self.get_counts(urls), counts)
+
+
+class SeasonScopedListFilterTests(TestCase):
+    """Tests for team and week filters limited to a single season."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = create_fixture_result_setup()
+        cls.user = User.objects.create_superuser(
+            username="admin", password="password"
+        )
+        division = create_division("Division 2", 2)
+        cls.old_season = create_season(
+            "2023/24", "23-24", "23-24", 2023, 2024, False, [division]
+        )
+        create_team(
+            cls.old_season,
+            division,
+            cls.data["club"],
+            cls.data["venue"],
+            "Old Team",
+            "monday",
+            time(19, 0),
+        )
+        create_week(cls.old_season, 1)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_team_filter_lists_current_season_teams(self):
+        url = reverse("admin:league_teamplayer_changelist")
+        response = self.client.get(url)
+        self.assertContains(response, "Team A")
+        self.assertNotContains(response, "Old Team")
+
+        response = self.client.get(
+            f"{url}?team__season__id__exact={self.old_season.id}"
+        )
+        self.assertContains(response, "Old Team")
+        self.assertNotContains(response, "Team A")
+
+    def test_week_filter_lists_selected_season_weeks(self):
+        url = reverse("admin:league_fixture_changelist")
+        response = self.client.get(url)
+        self.assertContains(response, "Week 1 24-25")
+        self.assertNotContains(response, "Week 1 23-24")
+
+        response = self.client.get(
+            f"{url}?season__id__exact={self.old_season.id}"
+        )
+        self.assertContains(response, "Week 1 23-24")
+        self.assertNotContains(response, "Week 1 24-25")
+
+    def test_team_filter_filters_changelist(self):
+        team_player = create_team_player(
+            create_player("Ann", "Home", self.data["club"]), self.data["team1"]
+        )
+        create_team_player(
+            create_player("Bea", "Away", self.data["club"]), self.data["team2"]
+        )
+        response = self.client.get(
+            reverse("admin:league_teamplayer_changelist")
+            + f"?team={self.data['team1'].id}"
+        )
+        self.assertEqual(
+            list(response.context["cl"].result_list), [team_player]
+        )
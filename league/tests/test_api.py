@@ -0,0 +1,244 @@
+import json
+from datetime import time
+from unittest.mock import patch
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from test_utils.helpers import (
+    create_club,
+    create_division,
+    create_doubles_match,
+    create_fixture,
+    create_fixture_result,
+    create_player,
+    create_season,
+    create_singles_match,
+    create_team,
+    create_team_player,
+    create_venue,
+    create_week,
+)
+from league.api import encode_cursor
+
+
+class LeagueApiTests(TestCase):
+    """Tests for the read-only JSON API."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club1 = create_club("Club 1")
+        cls.club2 = create_club("Club 2")
+        cls.venue = create_venue("Venue 1")
+        cls.division1 = create_division("Division 1", 1)
+        cls.division2 = create_division("Division 2", 2)
+        cls.season = create_season(
+            "2024/25",
+            "24-25",
+            "24-25",
+            2024,
+            2025,
+            True,
+            [cls.division1, cls.division2],
+        )
+        cls.week = create_week(cls.season, 1)
+
+        # 4 teams per division (one per club pair) with a full fixture list
+        cls.fixtures = []
+        for division in (cls.division1, cls.division2):
+            teams = [
+                create_team(
+                    cls.season,
+                    division,
+                    club,
+                    cls.venue,
+                    f"{division.name} {club.name} {num}",
+                    "monday",
+                    time(19, 0),
+                )
+                for club in (cls.club1, cls.club2)
+                for num in (1, 2)
+            ]
+            for home_team in teams:
+                for away_team in teams:
+                    if home_team != away_team:
+                        cls.fixtures.append(
+                            create_fixture(
+                                cls.season,
+                                division,
+                                cls.week,
+                                home_team,
+                                away_team,
+                            )
+                        )
+
+        # One result with a singles and doubles breakdown
+        cls.fixture = cls.fixtures[0]
+        home_player = create_team_player(
+            create_player("Home", "Player", cls.club1), cls.fixture.home_team
+        )
+        away_player = create_team_player(
+            create_player("Away", "Player", cls.club1), cls.fixture.away_team
+        )
+        result = create_fixture_result(cls.fixture, 7, 3)
+        create_singles_match(result, home_player, away_player, 3, 1)
+        create_doubles_match(result, [home_player], [away_player], 1, 3)
+
+    def get_all_pages(self, url, params):
+        """Follows 'next' links and returns every item and the page count."""
+        items = []
+        pages = 0
+        response = self.client.get(url, params)
+        while True:
+            data = response.json()
+            items.extend(data["results"])
+            pages += 1
+            if not data["next"]:
+                return items, pages
+            response = self.client.get(data["next"])
+
+    def test_fixtures_pages_cover_every_fixture_once(self):
+        """Verify keyset pages return each fixture once in keyset order."""
+        items, pages = self.get_all_pages(
+            reverse("api_fixtures"), {"limit": 5}
+        )
+        ids = [item["id"] for item in items]
+        self.assertEqual(len(ids), len(self.fixtures))
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(pages, 5)
+        keys = [(item["datetime"], item["id"]) for item in items]
+        self.assertEqual(keys, sorted(keys))
+
+    def test_fixtures_page_query_count_is_constant(self):
+        """Verify a later page uses the same number of queries."""
+        url = reverse("api_fixtures")
+        with CaptureQueriesContext(connection) as first_page:
+            data = self.client.get(url, {"limit": 2}).json()
+        for _ in range(3):
+            with self.assertNumQueries(len(first_page)):
+                data = self.client.get(data["next"]).json()
+
+    def test_fixtures_use_fixture_filter(self):
+        """Verify division and club filters match the fixtures page."""
+        items, _ = self.get_all_pages(
+            reverse("api_fixtures"), {"division": self.division2.id}
+        )
+        self.assertEqual(len(items), 12)
+        self.assertTrue(
+            all(item["division_id"] == self.division2.id for item in items)
+        )
+
+        items, _ = self.get_all_pages(
+            reverse("api_fixtures"),
+            {"division": self.division1.id, "club": self.club1.id},
+        )
+        # Every fixture except those between the two club 2 teams
+        self.assertEqual(len(items), 10)
+
+    def test_invalid_parameters_return_bad_request(self):
+        """Verify invalid filters, cursors and limits return errors."""
+        url = reverse("api_fixtures")
+        for params in (
+            {"season": "missing"},
+            {"cursor": "not-a-cursor"},
+            {"limit": 0},
+            {"limit": "all"},
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.json())
+
+    def test_cursor_continues_after_position(self):
+        """Verify a cursor returns fixtures after the encoded fixture."""
+        items, _ = self.get_all_pages(reverse("api_fixtures"), {})
+        cursor = encode_cursor(
+            {"datetime": self.fixtures[3].datetime, "id": items[3]["id"]}
+        )
+        data = self.client.get(
+            reverse("api_fixtures"), {"cursor": cursor}
+        ).json()
+        self.assertEqual(data["results"][0]["id"], items[4]["id"])
+
+    def test_results_include_breakdown(self):
+        """Verify results include singles and doubles breakdowns."""
+        data = self.client.get(reverse("api_results")).json()
+        self.assertEqual(len(data["results"]), 1)
+        result = data["results"][0]
+        self.assertEqual(result["id"], self.fixture.id)
+        self.assertEqual(result["home_score"], 7)
+        self.assertEqual(result["winner"], "home")
+        self.assertEqual(
+            result["singles"],
+            [
+                {
+                    "home_player": "Home Player",
+                    "away_player": "Away Player",
+                    "home_sets": 3,
+                    "away_sets": 1,
+                    "winner": "home",
+                }
+            ],
+        )
+        self.assertEqual(result["doubles"]["home_players"], ["Home Player"])
+        self.assertEqual(result["doubles"]["winner"], "away")
+
+    def test_export_streams_every_fixture(self):
+        """
+        Verify the export streams the same fixtures as the pages, across
+        several batches.
+        """
+        with patch("league.api.EXPORT_BATCH_SIZE", 5):
+            response = self.client.get(reverse("api_fixtures_export"))
+            self.assertTrue(response.streaming)
+            data = json.loads(b"".join(response.streaming_content))
+        items, _ = self.get_all_pages(reverse("api_fixtures"), {})
+        self.assertEqual(data["fixtures"], items)
+
+    def test_results_export_includes_breakdown(self):
+        """Verify the results export includes breakdowns."""
+        response = self.client.get(reverse("api_results_export"))
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(data["results"]), 1)
+        self.assertEqual(len(data["results"][0]["singles"]), 1)
+
+    def test_standings_are_grouped_by_division(self):
+        """Verify standings are listed per division in table order."""
+        data = self.client.get(reverse("api_standings")).json()
+        self.assertEqual(data["season"], "24-25")
+        self.assertEqual(
+            [division["id"] for division in data["divisions"]],
+            [self.division1.id, self.division2.id],
+        )
+        leader = data["divisions"][0]["standings"][0]
+        self.assertEqual(leader["team_id"], self.fixture.home_team_id)
+        self.assertEqual(leader["points"], 2)
+
+    def test_season_lists(self):
+        """Verify seasons, divisions and weeks are listed."""
+        seasons = self.client.get(reverse("api_seasons")).json()["seasons"]
+        self.assertEqual(seasons[0]["slug"], "24-25")
+        self.assertEqual(
+            seasons[0]["division_ids"],
+            [self.division1.id, self.division2.id],
+        )
+
+        divisions = self.client.get(reverse("api_divisions")).json()
+        self.assertEqual(len(divisions["divisions"]), 2)
+
+        weeks = self.client.get(reverse("api_weeks")).json()
+        self.assertEqual(weeks["weeks"][0]["id"], self.week.id)
+
+    def test_unknown_season_returns_not_found(self):
+        """Verify season endpoints return 404 for unknown seasons."""
+        for name in ("api_divisions", "api_weeks", "api_standings"):
+            with self.subTest(name=name):
+                response = self.client.get(
+                    reverse(name), {"season": "missing"}
+                )
+                self.assertEqual(response.status_code, 404)
+
+    def test_post_is_not_allowed(self):
+        """Verify the API is read-only."""
+        response = self.client.post(reverse("api_fixtures"))
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,245 @@
+from datetime import time
+from io import StringIO
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from test_utils.helpers import (
+    create_club,
+    create_division,
+    create_doubles_game,
+    create_doubles_match,
+    create_fixture,
+    create_fixture_result,
+    create_fixture_result_setup,
+    create_player,
+    create_singles_game,
+    create_singles_match,
+    create_team,
+    create_team_player,
+    create_venue,
+    create_week,
+)
+from league.archive import (
+    ARCHIVE_MAX_AGE,
+    finalize_season,
+    get_archive_store,
+)
+from league.cache import CACHE_ALIAS
+from league.models import SeasonArchive
+from league.tests.test_cache import LOCMEM_CACHES
+
+# Tables holding the records an archived season is served without
+RECORD_TABLES = [
+    '"league_fixture"',
+    '"league_fixtureresult"',
+    '"league_singlesmatch"',
+    '"league_doublesmatch"',
+    '"league_leaguestanding"',
+]
+MAX_AGE = f"max-age={ARCHIVE_MAX_AGE}"
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SeasonArchiveTests(TestCase):
+    """
+    Tests for finalizing a season and serving its pages from the stored
+    snapshot.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        data = create_fixture_result_setup()
+        cls.season = data["season"]
+        cls.season.is_current = False
+        cls.season.save()
+        cls.club = data["club"]
+        cls.team = data["team1"]
+        cls.fixture = data["fixture"]
+        result = data["fixture_result"]
+
+        # Singles and doubles matches with game scores
+        home_players = [
+            create_team_player(
+                create_player(name, "Home", cls.club), cls.team
+            )
+            for name in ["Ann", "Bea"]
+        ]
+        away_players = [
+            create_team_player(
+                create_player(name, "Away", cls.club), data["team2"]
+            )
+            for name in ["Cat", "Dee"]
+        ]
+        match = create_singles_match(
+            result, home_players[0], away_players[0], 3, 1
+        )
+        create_singles_game(match, 1, 11, 5)
+        doubles = create_doubles_match(
+            result, home_players, away_players, 1, 3
+        )
+        create_doubles_game(doubles, 1, 9, 11)
+
+        # A fixture without a result and a second division and club
+        week = create_week(cls.season, 2)
+        create_fixture(
+            cls.season, data["division"], week, data["team2"], cls.team
+        )
+        cls.division = create_division("Division 2", 2)
+        cls.season.divisions.add(cls.division)
+        cls.other_club = create_club("Other Club")
+        teams = [
+            create_team(
+                cls.season,
+                cls.division,
+                cls.other_club,
+                create_venue(f"Venue {name}"),
+                f"Team {name}",
+                "wednesday",
+                time(19, 0),
+            )
+            for name in ["C", "D"]
+        ]
+        create_fixture_result(
+            create_fixture(cls.season, cls.division, week, *teams), 6, 4
+        )
+
+        season_query = f"?season={cls.season.slug}"
+        cls.urls = [
+            reverse("results") + season_query,
+            f"{reverse('results')}{season_query}&division={cls.division.id}",
+            f"{reverse('results')}{season_query}&club={cls.club.id}",
+            reverse("tables") + season_query,
+            reverse("team_summary", args=[cls.team.id]),
+            reverse("result_breakdown", args=[cls.fixture.id]),
+        ]
+
+    def setUp(self):
+        caches[CACHE_ALIAS].clear()
+
+    def test_archived_pages_match_live_pages(self):
+        """Verify pages served from the snapshot are unchanged."""
+        live_pages = {url: self.client.get(url).content for url in self.urls}
+        finalize_season(self.season)
+
+        for url in self.urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    response.content.decode(), live_pages[url].decode()
+                )
+
+    def test_archived_pages_do_not_read_season_records(self):
+        """
+        Verify archived pages only query reference data, apart from the
+        conditional GET check of pages without a season in the URL.
+        """
+        finalize_season(self.season)
+
+        # Each worker reads the seasons of archived teams and fixtures once
+        get_archive_store()
+        for url in self.urls:
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as queries:
+                    self.client.get(url)
+                sql = [
+                    query["sql"]
+                    for query in queries.captured_queries
+                    if "?season=" in url or ' AS "part"' not in query["sql"]
+                ]
+                for table in RECORD_TABLES:
+                    self.assertFalse(any(table in query for query in sql))
+
+    def test_snapshots_are_decoded_when_first_needed(self):
+        finalize_season(self.season)
+        store = get_archive_store()
+        self.assertEqual(store.teams[self.team.id], self.season.id)
+        self.assertEqual(store.fixtures[self.fixture.id], self.season.id)
+        self.assertEqual(store.snapshots, {})
+
+        self.client.get(reverse("team_summary", args=[self.team.id]))
+        snapshot = store.snapshots[self.season.id]
+        with self.assertNumQueries(0):
+            self.assertIs(
+                get_archive_store().get_snapshot(self.season.id), snapshot
+            )
+
+    def test_season_changes_do_not_reload_archives(self):
+        """
+        Verify editing a season keeps the decoded snapshots, while hiding
+        it stops its pages being served from the snapshot.
+        """
+        finalize_season(self.season)
+        store = get_archive_store()
+        url = reverse("tables") + f"?season={self.season.slug}"
+        self.assertIn(MAX_AGE, self.client.get(url)["Cache-Control"])
+
+        self.season.is_visible = False
+        self.season.save()
+        self.assertIs(get_archive_store(), store)
+        self.assertNotIn(MAX_AGE, self.client.get(url)["Cache-Control"])
+
+    def test_archived_pages_are_reused_then_revalidated(self):
+        """
+        Verify browsers may reuse archived pages for a while, then find out
+        whether the season has been finalized again with one request.
+        """
+        finalize_season(self.season)
+        for url in self.urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertIn(MAX_AGE, response["Cache-Control"])
+                self.assertNotIn("immutable", response["Cache-Control"])
+
+                response = self.client.get(
+                    url, HTTP_IF_NONE_MATCH=response["ETag"]
+                )
+                self.assertEqual(response.status_code, 304)
+                self.assertIn(MAX_AGE, response["Cache-Control"])
+
+        etags = {url: self.client.get(url)["ETag"] for url in self.urls}
+        finalize_season(self.season)
+        for url in self.urls:
+            with self.subTest(url=url):
+                response = self.client.get(
+                    url, HTTP_IF_NONE_MATCH=etags[url]
+                )
+                self.assertEqual(response.status_code, 200)
+
+    def test_snapshot_is_not_changed_by_later_edits(self):
+        """Verify a snapshot is only replaced by finalizing again."""
+        url = reverse("team_summary", args=[self.team.id])
+        finalize_season(self.season)
+        self.team.team_name = "Renamed Team"
+        self.team.save()
+        self.assertNotContains(self.client.get(url), "Renamed Team")
+
+        finalize_season(self.season)
+        self.assertContains(self.client.get(url), "Renamed Team")
+
+    def test_current_season_cannot_be_finalized(self):
+        self.season.is_current = True
+        self.season.save()
+        with self.assertRaises(ValidationError):
+            finalize_season(self.season)
+        self.assertFalse(SeasonArchive.objects.exists())
+
+    def test_command_finalizes_and_removes_archive(self):
+        url = reverse("tables") + f"?season={self.season.slug}"
+        out = StringIO()
+        call_command("finalize_season", self.season.slug, stdout=out)
+        self.assertIn("Archived", out.getvalue())
+        self.assertIn(MAX_AGE, self.client.get(url)["Cache-Control"])
+
+        call_command(
+            "finalize_season", self.season.slug, "--remove", stdout=out
+        )
+        self.assertFalse(SeasonArchive.objects.exists())
+        self.assertNotIn(MAX_AGE, self.client.get(url)["Cache-Control"])
+
+        with self.assertRaises(CommandError):
+            call_command("finalize_season", "missing", stdout=out)
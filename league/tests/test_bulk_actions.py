@@ -0,0 +1,201 @@
+from datetime import time, timedelta
+from django.contrib.auth.models import User
+from django.contrib.messages import get_messages
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from test_utils.helpers import (
+    create_fixture,
+    create_fixture_result,
+    create_fixture_result_setup,
+    create_player,
+    create_team,
+    create_team_player,
+    create_week,
+)
+from league.bulk_actions import (
+    approve_teams,
+    confirm_players,
+    mark_fees_paid,
+    postpone_fixtures,
+    reschedule_fixtures,
+)
+from league.models import Fixture, Player, Team, TeamPlayer
+from league.tests.test_cache import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class BulkActionTests(TestCase):
+    """Tests for bulk changes applied with a single UPDATE."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = create_fixture_result_setup()
+        cls.season = cls.data["season"]
+        cls.week2 = create_week(cls.season, 2)
+        cls.week3 = create_week(cls.season, 3)
+        cls.teams = [
+            create_team(
+                cls.season,
+                cls.data["division"],
+                cls.data["club"],
+                cls.data["venue"],
+                name,
+                "wednesday",
+                time(19, 0),
+            )
+            for name in ["Team C", "Team D"]
+        ]
+        cls.fixture2 = create_fixture(
+            cls.season, cls.data["division"], cls.week2, *cls.teams
+        )
+        cls.fixture3 = create_fixture(
+            cls.season,
+            cls.data["division"],
+            cls.week3,
+            cls.data["team2"],
+            cls.data["team1"],
+        )
+
+    def test_reschedule_moves_fixtures_to_the_following_week(self):
+        original = self.fixture2.datetime
+        result = reschedule_fixtures(Fixture.objects.all())
+
+        self.assertEqual(result.updated, 1)
+        self.assertEqual(
+            result.rejected,
+            {
+                "fixtures with a result": [str(self.data["fixture"])],
+                "fixtures in the last week of their season": [
+                    str(self.fixture3)
+                ],
+            },
+        )
+        self.fixture2.refresh_from_db()
+        self.assertEqual(self.fixture2.week, self.week3)
+        self.assertEqual(self.fixture2.datetime, original + timedelta(days=7))
+        self.assertEqual(self.fixture2.status, "scheduled")
+        self.fixture2.full_clean()
+
+    def test_postpone_skips_fixtures_with_results(self):
+        result = postpone_fixtures(Fixture.objects.all())
+        self.assertEqual(result.updated, 2)
+        self.assertEqual(list(result.rejected), ["fixtures with a result"])
+        self.assertEqual(Fixture.objects.filter(status="postponed").count(), 2)
+
+        # Postponed fixtures are not changed (or counted) again
+        self.assertEqual(postpone_fixtures(Fixture.objects.all()).updated, 0)
+
+    def test_rejected_names_do_not_query_each_record(self):
+        """
+        Verify the names of rejected fixtures are read with their rule's
+        query, however many fixtures are rejected.
+        """
+        create_fixture_result(self.fixture2, 6, 4)
+        with self.assertNumQueries(4):
+            result = postpone_fixtures(Fixture.objects.all())
+        self.assertEqual(len(result.rejected["fixtures with a result"]), 2)
+
+    def test_updated_on_is_set(self):
+        before = self.fixture2.updated_on
+        postpone_fixtures(Fixture.objects.filter(id=self.fixture2.id))
+        self.fixture2.refresh_from_db()
+        self.assertGreater(self.fixture2.updated_on, before)
+
+    def test_approve_rejects_seasons_with_fixtures(self):
+        Team.objects.update(approved=False)
+        result = approve_teams(Team.objects.all())
+        self.assertEqual(result.updated, 0)
+        self.assertEqual(
+            len(result.rejected["teams in seasons with generated fixtures"]),
+            4,
+        )
+
+        Fixture.objects.all().delete()
+        self.assertEqual(approve_teams(Team.objects.all()).updated, 4)
+        self.assertFalse(Team.objects.filter(approved=False).exists())
+
+    def test_confirm_rejects_players_without_a_club(self):
+        club = self.data["club"]
+        create_player("Ann", "Pending", club, club_status="pending")
+        clubless = create_player("Bea", "Pending", None, club_status="pending")
+
+        # The rules' queries and the UPDATE, within a savepoint
+        with self.assertNumQueries(5):
+            result = confirm_players(Player.objects.all())
+
+        self.assertEqual(result.updated, 1)
+        self.assertEqual(
+            result.rejected, {"players without a club": [str(clubless)]}
+        )
+        self.assertEqual(
+            Player.objects.get(surname="Pending", forename="Bea").club_status,
+            "pending",
+        )
+
+    def test_confirm_rejects_rejected_players(self):
+        club = self.data["club"]
+        rejected = create_player(
+            "Cal", "Rejected", club, club_status="rejected"
+        )
+
+        result = confirm_players(Player.objects.filter(surname="Rejected"))
+        self.assertEqual(result.updated, 0)
+        self.assertEqual(
+            result.rejected,
+            {"players whose club association was rejected": [str(rejected)]},
+        )
+        rejected.refresh_from_db()
+        self.assertEqual(rejected.club_status, "rejected")
+
+    def test_mark_fees_paid(self):
+        for name, team in [("Ann", self.teams[0]), ("Bea", self.teams[1])]:
+            create_team_player(
+                create_player(name, "Player", self.data["club"]),
+                team,
+                paid_fees=False,
+            )
+        result = mark_fees_paid(TeamPlayer.objects.all())
+        self.assertEqual(result, (2, {}))
+        self.assertFalse(TeamPlayer.objects.filter(paid_fees=False).exists())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class BulkAdminActionTests(TestCase):
+    """Tests for the admin actions reporting bulk changes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = create_fixture_result_setup()
+        cls.fixture = create_fixture(
+            cls.data["season"],
+            cls.data["division"],
+            create_week(cls.data["season"], 2),
+            cls.data["team2"],
+            cls.data["team1"],
+        )
+        cls.user = User.objects.create_superuser(
+            username="admin", password="password"
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_action_reports_updated_and_rejected_fixtures(self):
+        response = self.client.post(
+            reverse("admin:league_fixture_changelist"),
+            {
+                "action": "postpone_fixtures",
+                "_selected_action": [self.fixture.id, self.data["fixture"].id],
+            },
+            follow=True,
+        )
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            [
+                "Postponed 1 fixture(s).",
+                "Could not postpone fixtures with a result: "
+                f"{self.data['fixture']}.",
+            ],
+        )
+        self.fixture.refresh_from_db()
+        self.assertEqual(self.fixture.status, "postponed")
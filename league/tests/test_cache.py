@@ -0,0 +1,137 @@
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from test_utils.helpers import create_fixture_result_setup, create_club
+from league.cache import (
+    CACHE_ALIAS,
+    SEASONS_TAG,
+    get_current_season_slug,
+    get_tag_versions,
+    invalidate_tags,
+    season_tag,
+    team_tag,
+)
+
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    CACHE_ALIAS: {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "league-tests",
+    },
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class LeaguePageCacheTests(TestCase):
+    """Tests for caching and invalidation of rendered league pages."""
+
+    def setUp(self):
+        caches[CACHE_ALIAS].clear()
+        self.data = create_fixture_result_setup()
+        self.season = self.data["season"]
+        self.fixture = self.data["fixture"]
+        self.fixture_result = self.data["fixture_result"]
+        self.team1 = self.data["team1"]
+
+    def tearDown(self):
+        caches[CACHE_ALIAS].clear()
+
+    def test_invalidate_tags_changes_versions(self):
+        """Verify invalidating a tag changes only that tag's version."""
+        before = get_tag_versions(["a", "b"])
+        invalidate_tags(["a"])
+        after = get_tag_versions(["a", "b"])
+        self.assertNotEqual(before[0], after[0])
+        self.assertEqual(before[1], after[1])
+
+    def test_cached_pages_use_one_query(self):
+        """
+        Verify a repeated page request only runs the conditional GET lookup
+        (see league/conditional.py).
+        """
+        urls = [
+            reverse("fixtures"),
+            reverse("results"),
+            reverse("tables"),
+            reverse("team_summary", args=[self.team1.id]),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                first = self.client.get(url)
+                with self.assertNumQueries(1):
+                    second = self.client.get(url)
+                self.assertEqual(first.content, second.content)
+
+    def test_htmx_request_returns_cached_section(self):
+        """Verify HTMX requests are served from the same cached section."""
+        self.client.get(reverse("tables"))
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("tables"), HTTP_HX_REQUEST="true"
+            )
+        self.assertNotContains(response, "<html")
+        self.assertContains(response, "Team A")
+
+    def test_result_change_invalidates_tables(self):
+        """Verify the league table is re-rendered when a result changes."""
+        response = self.client.get(reverse("tables"))
+        table = response.context["division_tables"][0]["table"]
+        self.assertEqual(table[0]["name"], "Team A")
+
+        self.fixture_result.home_score = 3
+        self.fixture_result.away_score = 7
+        self.fixture_result.save()
+
+        response = self.client.get(reverse("tables"))
+        table = response.context["division_tables"][0]["table"]
+        self.assertEqual(table[0]["name"], "Team B")
+
+    def test_result_change_invalidates_related_tags(self):
+        """
+        Verify saving a result bumps the season, division, club and team
+        tags for its fixture.
+        """
+        slug = self.season.slug
+        tags = [
+            season_tag(slug),
+            season_tag(slug, division_id=self.data["division"].id),
+            season_tag(slug, club_id=self.data["club"].id),
+            team_tag(self.team1.id),
+            team_tag(self.data["team2"].id),
+        ]
+        before = get_tag_versions(tags)
+        self.fixture_result.save()
+        after = get_tag_versions(tags)
+        for tag, old, new in zip(tags, before, after):
+            with self.subTest(tag=tag):
+                self.assertNotEqual(old, new)
+
+    def test_unrelated_club_page_stays_cached(self):
+        """Verify a result does not invalidate another club's pages."""
+        other_club = create_club("Other Club")
+        other_tag = season_tag(self.season.slug, club_id=other_club.id)
+        before = get_tag_versions([other_tag, SEASONS_TAG])
+        self.fixture_result.save()
+        self.assertEqual(get_tag_versions([other_tag, SEASONS_TAG]), before)
+
+    def test_current_season_change_clears_cached_slug(self):
+        """Verify the cached current season is cleared on season save."""
+        self.assertEqual(get_current_season_slug(), "24-25")
+        self.season.is_current = False
+        self.season.save()
+        self.assertEqual(get_current_season_slug(), "")
+
+    def test_team_rename_invalidates_team_summary(self):
+        """Verify renaming a team re-renders its cached summary."""
+        url = reverse("team_summary", args=[self.team1.id])
+        self.client.get(url)
+        self.team1.team_name = "Renamed Team"
+        self.team1.save()
+        self.assertContains(self.client.get(url), "Renamed Team")
+
+    def test_missing_team_is_not_cached(self):
+        """Verify a missing team still returns a 404 response."""
+        url = reverse("team_summary", args=[9999])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.get(url).status_code, 404)
@@ -0,0 +1,141 @@
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from test_utils.helpers import create_fixture_result_setup, create_week
+from league.models import Fixture, LeagueStanding, Season, SinglesGame
+
+
+class RebuildStandingsCommandTests(TestCase):
+    """
+    Tests for the rebuild_standings management command.
+    """
+
+    def setUp(self):
+        setup_data = create_fixture_result_setup()
+        for key, value in setup_data.items():
+            setattr(self, key, value)
+
+    def test_rebuild_recreates_missing_standings(self):
+        """Verify standings are recalculated after being deleted."""
+        LeagueStanding.objects.all().delete()
+
+        out = StringIO()
+        call_command("rebuild_standings", stdout=out)
+
+        self.assertIn("Rebuilt standings for 2 team(s).", out.getvalue())
+        home = LeagueStanding.objects.get(team=self.team1)
+        self.assertEqual(home.played, 1)
+        self.assertEqual(home.points, 2)
+        self.assertEqual(home.team_sets_won, 7)
+
+    def test_rebuild_corrects_stale_standings(self):
+        """Verify out-of-date values are overwritten."""
+        LeagueStanding.objects.update(points=99)
+        call_command("rebuild_standings", stdout=StringIO())
+
+        away = LeagueStanding.objects.get(team=self.team2)
+        self.assertEqual(away.points, 0)
+
+    def test_rebuild_limited_to_season(self):
+        """Verify --season option rebuilds only the given season."""
+        out = StringIO()
+        call_command(
+            "rebuild_standings", season=[self.season.slug], stdout=out
+        )
+        self.assertIn("2 team(s)", out.getvalue())
+
+    def test_unknown_season_raises_error(self):
+        """Verify an unknown season slug raises CommandError."""
+        with self.assertRaises(CommandError):
+            call_command("rebuild_standings", season=["missing"])
+
+
+class GenerateFixturesCommandTests(TestCase):
+    """
+    Tests for the generate_fixtures management command.
+    """
+
+    def setUp(self):
+        setup_data = create_fixture_result_setup()
+        for key, value in setup_data.items():
+            setattr(self, key, value)
+
+    def test_generates_fixtures_for_season(self):
+        """Verify a home and away fixture is created for each pairing."""
+        Fixture.objects.all().delete()
+        create_week(self.season, 2)
+
+        out = StringIO()
+        call_command("generate_fixtures", self.season.slug, stdout=out)
+
+        self.assertIn("Generated 2 fixture(s) for 2024/25.", out.getvalue())
+        self.assertEqual(Fixture.objects.count(), 2)
+
+    def test_existing_fixtures_raise_error(self):
+        """Verify a season with fixtures is not scheduled again."""
+        with self.assertRaises(CommandError):
+            call_command("generate_fixtures", self.season.slug)
+        self.assertEqual(Fixture.objects.count(), 1)
+
+    def test_unknown_season_raises_error(self):
+        """Verify an unknown season slug raises CommandError."""
+        with self.assertRaises(CommandError):
+            call_command("generate_fixtures", "missing")
+
+
+class SeedLeagueCommandTests(TestCase):
+    """
+    Tests for the seed_league management command.
+    """
+
+    def call_seed_league(self, *args):
+        out = StringIO()
+        call_command(
+            "seed_league",
+            "--seasons=2",
+            "--divisions=1",
+            "--teams=3",
+            *args,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_creates_synthetic_league(self):
+        """Verify seasons, fixtures, results and games are created."""
+        output = self.call_seed_league("--seed=3")
+
+        # 2 seasons x 6 fixtures (3 teams play home and away)
+        self.assertEqual(Fixture.objects.count(), 12)
+        self.assertIn("Created 2 season(s) with 12 fixture(s)", output)
+        self.assertTrue(SinglesGame.objects.exists())
+        self.assertEqual(
+            Season.objects.get(is_current=True).name[:9], "Synthetic"
+        )
+
+    def test_existing_prefix_raises_error(self):
+        """Verify a league is not created twice with the same prefix."""
+        self.call_seed_league()
+        with self.assertRaises(CommandError):
+            self.call_seed_league()
+        self.call_seed_league("--prefix=Other")
+
+    def test_keep_current_season(self):
+        """Verify --keep-current leaves the current season unchanged."""
+        setup_data = create_fixture_result_setup()
+        self.call_seed_league("--keep-current")
+        self.assertEqual(
+            Season.objects.get(is_current=True), setup_data["season"]
+        )
+
+    def test_invalid_options_raise_error(self):
+        """Verify too few teams or an invalid prefix raise CommandError."""
+        invalid_args = (
+            ["--teams=1"],
+            ["--prefix=!!!"],
+            ["--prefix=" + "x" * 13],
+        )
+        for args in invalid_args:
+            with self.subTest(args=args):
+                with self.assertRaises(CommandError):
+                    call_command("seed_league", *args, stdout=StringIO())
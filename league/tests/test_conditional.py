@@ -0,0 +1,181 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from test_utils.helpers import (
+    create_fixture_result_setup,
+    create_singles_match,
+    create_player,
+    create_team_player,
+)
+from clubs.models import Club, Venue
+from league.models import (
+    Division,
+    DoublesMatch,
+    Fixture,
+    FixtureResult,
+    Player,
+    Season,
+    SinglesMatch,
+    Team,
+    TeamPlayer,
+    Week,
+)
+
+
+class ConditionalGetTests(TestCase):
+    """Tests for ETag / Last-Modified handling of public league pages."""
+
+    def setUp(self):
+        self.data = create_fixture_result_setup()
+        self.fixture = self.data["fixture"]
+        self.fixture_result = self.data["fixture_result"]
+        self.team1 = self.data["team1"]
+        self.urls = [
+            reverse("fixtures"),
+            reverse("results"),
+            reverse("tables"),
+            reverse("team_summary", args=[self.team1.id]),
+            reverse("result_breakdown", args=[self.fixture.id]),
+            reverse("clubs"),
+        ]
+
+    def test_pages_include_validators(self):
+        """Verify pages include ETag, Last-Modified and no-cache headers."""
+        for url in self.urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.has_header("ETag"))
+                self.assertTrue(response.has_header("Last-Modified"))
+                self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_matching_etag_returns_not_modified(self):
+        """Verify a matching If-None-Match header returns a 304 response."""
+        for url in self.urls:
+            with self.subTest(url=url):
+                etag = self.client.get(url)["ETag"]
+                with self.assertNumQueries(1):
+                    response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+
+    def test_last_modified_returns_not_modified(self):
+        """Verify an up to date If-Modified-Since returns a 304 response."""
+        response = self.client.get(reverse("tables"))
+        response = self.client.get(
+            reverse("tables"),
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_result_change_changes_etag(self):
+        """Verify editing a result changes the ETag of pages showing it."""
+        etags = {url: self.client.get(url)["ETag"] for url in self.urls}
+        self.fixture_result.home_score = 5
+        self.fixture_result.away_score = 5
+        self.fixture_result.save()
+
+        for url in self.urls[:-1]:
+            with self.subTest(url=url):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+                self.assertEqual(response.status_code, 200)
+
+    def test_deleted_match_changes_etag(self):
+        """Verify deleting a record changes the ETag (via the row count)."""
+        player1 = create_team_player(
+            create_player("Home", "Player", self.data["club"]), self.team1
+        )
+        player2 = create_team_player(
+            create_player("Away", "Player", self.data["club"]),
+            self.data["team2"],
+        )
+        match = create_singles_match(
+            self.fixture_result, player1, player2, 3, 0
+        )
+        url = reverse("result_breakdown", args=[self.fixture.id])
+        etag = self.client.get(url)["ETag"]
+
+        SinglesMatch.objects.filter(id=match.id).delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_deleted_records_change_last_modified(self):
+        """
+        Verify deleting a record changes the Last-Modified time of the pages
+        showing it, as the latest updated_on time of the remaining records
+        does not.
+        """
+        player1 = create_team_player(
+            create_player("Home", "Player", self.data["club"]), self.team1
+        )
+        player2 = create_team_player(
+            create_player("Away", "Player", self.data["club"]),
+            self.data["team2"],
+        )
+        match = create_singles_match(
+            self.fixture_result, player1, player2, 3, 0
+        )
+        models = [
+            Season,
+            Division,
+            Club,
+            Venue,
+            Week,
+            Team,
+            Player,
+            TeamPlayer,
+            Fixture,
+            FixtureResult,
+            SinglesMatch,
+            DoublesMatch,
+        ]
+        deletions = [
+            (SinglesMatch.objects.filter(id=match.id), self.urls[:5]),
+            (
+                FixtureResult.objects.filter(id=self.fixture_result.id),
+                self.urls[:4],
+            ),
+            (Fixture.objects.filter(id=self.fixture.id), self.urls[:4]),
+        ]
+        for records, urls in deletions:
+            with self.subTest(model=records.model.__name__):
+                # Records last updated an hour ago
+                earlier = timezone.now() - timedelta(hours=1)
+                for model in models:
+                    model.objects.update(updated_on=earlier)
+                last_modified = {
+                    url: self.client.get(url)["Last-Modified"] for url in urls
+                }
+
+                records.delete()
+                for url in urls:
+                    response = self.client.get(
+                        url, HTTP_IF_MODIFIED_SINCE=last_modified[url]
+                    )
+                    self.assertEqual(response.status_code, 200, url)
+
+    def test_htmx_request_has_different_etag(self):
+        """Verify full pages and HTMX partials do not share an ETag."""
+        url = reverse("fixtures")
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(
+            url, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("HX-Request", response["Vary"])
+
+    def test_pending_messages_skip_conditional_response(self):
+        """Verify pages with pending flash messages are rendered in full."""
+        url = reverse("tables")
+        etag = self.client.get(url)["ETag"]
+        self.client.cookies["messages"] = "pending"
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_stale_last_modified_returns_page(self):
+        """Verify an out of date If-Modified-Since returns the full page."""
+        response = self.client.get(
+            reverse("tables"), HTTP_IF_MODIFIED_SINCE=http_date(0)
+        )
+        self.assertEqual(response.status_code, 200)
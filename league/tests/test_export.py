@@ -0,0 +1,151 @@
+import tempfile
+from datetime import time
+from io import StringIO
+from pathlib import Path
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from test_utils.helpers import (
+    create_division,
+    create_fixture_result_setup,
+    create_team,
+)
+from league.export import export_season, get_export_dir, rewrite_links
+from league.tests.test_cache import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ExportSeasonTests(TestCase):
+    """Tests for exporting a finished season as static HTML files."""
+
+    def setUp(self):
+        static_root = tempfile.TemporaryDirectory()
+        self.addCleanup(static_root.cleanup)
+        settings_override = override_settings(STATIC_ROOT=static_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.data = create_fixture_result_setup()
+        self.season = self.data["season"]
+        self.season.is_current = False
+        self.season.save()
+        self.export_dir = get_export_dir(self.season)
+
+    def get_page(self, path):
+        return (self.export_dir / path).read_text()
+
+    def test_every_page_is_exported(self):
+        counts = export_season(self.season, workers=1)
+
+        paths = {
+            path.relative_to(self.export_dir).as_posix()
+            for path in Path(self.export_dir).rglob("*.html")
+        }
+        self.assertEqual(
+            paths,
+            {
+                "fixtures.html",
+                "results.html",
+                "tables.html",
+                f"teams/{self.data['team1'].id}.html",
+                f"teams/{self.data['team2'].id}.html",
+                f"results/{self.data['fixture'].id}.html",
+            },
+        )
+        self.assertEqual(counts["written"], 6)
+        self.assertIn("Team A", self.get_page("tables.html"))
+
+    def test_links_between_exported_pages_are_rewritten(self):
+        export_season(self.season, workers=1)
+        results = self.get_page("results.html")
+        prefix = f"/static/seasons/{self.season.slug}/"
+        self.assertIn(
+            f'href="{prefix}teams/{self.data["team1"].id}.html"', results
+        )
+        self.assertIn(
+            f'href="{prefix}results/{self.data["fixture"].id}.html"', results
+        )
+        self.assertNotIn(
+            reverse("team_summary", args=[self.data["team1"].id]), results
+        )
+
+    def test_reexport_only_rewrites_changed_pages(self):
+        export_season(self.season, workers=1)
+        self.assertEqual(export_season(self.season, workers=1)["written"], 0)
+
+        # A team without fixtures only appears on its summary and the tables
+        division = create_division("Division 2", 2)
+        self.season.divisions.add(division)
+        team = create_team(
+            self.season,
+            division,
+            self.data["club"],
+            self.data["venue"],
+            "Team C",
+            "friday",
+            time(19, 0),
+        )
+        export_season(self.season, workers=1)
+
+        team.team_name = "Renamed Team"
+        team.save()
+        counts = export_season(self.season, workers=1)
+        self.assertEqual(counts, {"written": 2, "unchanged": 5, "removed": 0})
+        self.assertIn("Renamed Team", self.get_page(f"teams/{team.id}.html"))
+        self.assertIn("Renamed Team", self.get_page("tables.html"))
+
+    def test_missing_page_files_are_rewritten(self):
+        export_season(self.season, workers=1)
+        (self.export_dir / "tables.html").unlink()
+        self.assertEqual(export_season(self.season, workers=1)["written"], 1)
+        self.assertIn("Team A", self.get_page("tables.html"))
+
+    def test_pages_no_longer_in_season_are_removed(self):
+        export_season(self.season, workers=1)
+        self.data["fixture_result"].delete()
+
+        counts = export_season(self.season, workers=1)
+        self.assertEqual(counts["removed"], 1)
+        self.assertFalse(
+            (self.export_dir / f"results/{self.data['fixture'].id}.html")
+            .exists()
+        )
+
+    def test_unfinished_season_is_not_exported(self):
+        self.season.is_current = True
+        self.season.save()
+        with self.assertRaises(ValidationError):
+            export_season(self.season, workers=1)
+        with self.assertRaises(CommandError):
+            call_command("export_season", self.season.slug, stdout=StringIO())
+
+    def test_command_reports_counts(self):
+        out = StringIO()
+        call_command(
+            "export_season", self.season.slug, "--workers", "1", stdout=out
+        )
+        self.assertIn("6 page(s) written", out.getvalue())
+
+
+class RewriteLinksTests(TestCase):
+    """Tests for pointing links at exported pages."""
+
+    def test_links_are_matched_with_or_without_query(self):
+        link_map = {
+            "/league/tables/?season=a": "/static/tables.html",
+            "/league/team/1/summary": "/static/teams/1.html",
+        }
+        html = (
+            '<a href="/league/tables/?season=a">'
+            '<a href="/league/tables/?season=b">'
+            '<a href="/league/team/1/summary?season=a">'
+            '<a href="/league/tables/">'
+        )
+        self.assertEqual(
+            rewrite_links(html, link_map),
+            '<a href="/static/tables.html">'
+            '<a href="/league/tables/?season=b">'
+            '<a href="/static/teams/1.html">'
+            '<a href="/league/tables/">',
+        )
@@ -0,0 +1,163 @@
+from collections import Counter
+from datetime import time
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from test_utils.helpers import (
+    create_club,
+    create_division,
+    create_season,
+    create_team,
+    create_venue,
+    create_week,
+)
+from league.fixture_generator import (
+    generate_season_fixtures,
+    get_round_robin_rounds,
+)
+from league.models import Fixture
+from league.tests.test_cache import LOCMEM_CACHES
+
+
+class RoundRobinTests(TestCase):
+    """Tests for pairing teams into round-robin rounds."""
+
+    def check_double_round_robin(self, num_teams):
+        """Verify every team plays every other team home and away."""
+        teams = list(range(num_teams))
+        rounds = get_round_robin_rounds(teams)
+
+        expected_rounds = 2 * (num_teams - 1 + num_teams % 2)
+        self.assertEqual(len(rounds), expected_rounds)
+
+        pairs = [pair for round_pairs in rounds for pair in round_pairs]
+        self.assertEqual(len(pairs), num_teams * (num_teams - 1))
+        self.assertEqual(len(set(pairs)), len(pairs))
+
+        for round_pairs in rounds:
+            playing = [team for pair in round_pairs for team in pair]
+            self.assertEqual(len(playing), len(set(playing)))
+
+    def test_even_number_of_teams(self):
+        self.check_double_round_robin(6)
+
+    def test_odd_number_of_teams(self):
+        self.check_double_round_robin(5)
+
+    def test_fewer_than_two_teams(self):
+        self.assertEqual(get_round_robin_rounds(["A"]), [])
+
+    def test_home_games_are_balanced(self):
+        """Verify each team plays the same number of home games."""
+        rounds = get_round_robin_rounds(list(range(6)))
+        home_counts = Counter(
+            home for round_pairs in rounds for home, _ in round_pairs
+        )
+        self.assertEqual(set(home_counts.values()), {5})
+
+
+class GenerateSeasonFixturesTests(TestCase):
+    """Tests for generating and saving a season's fixtures."""
+
+    def setUp(self):
+        self.club = create_club("Test Club")
+        self.venue1 = create_venue("Venue 1")
+        self.venue2 = create_venue("Venue 2")
+        self.division1 = create_division("Division 1", 1)
+        self.division2 = create_division("Division 2", 2)
+        self.season = create_season(
+            "2024/25",
+            "24-25",
+            "24-25",
+            2024,
+            2025,
+            True,
+            [self.division1, self.division2],
+        )
+        self.weeks = [create_week(self.season, num) for num in range(1, 11)]
+        days = ["monday", "tuesday", "wednesday", "thursday"]
+        self.teams = {
+            division: [
+                create_team(
+                    self.season,
+                    division,
+                    self.club,
+                    self.venue1 if num % 2 else self.venue2,
+                    f"{division.name} Team {num}",
+                    days[num],
+                    time(19, 30),
+                )
+                for num in range(4)
+            ]
+            for division in (self.division1, self.division2)
+        }
+
+    def test_generates_double_round_robin_per_division(self):
+        """Verify each division gets a full home and away fixture list."""
+        fixtures = generate_season_fixtures(self.season)
+        self.assertEqual(len(fixtures), 24)
+        for division, teams in self.teams.items():
+            pairs = set(
+                Fixture.objects.filter(division=division).values_list(
+                    "home_team", "away_team"
+                )
+            )
+            expected = {
+                (home.id, away.id)
+                for home in teams
+                for away in teams
+                if home != away
+            }
+            self.assertEqual(pairs, expected)
+
+    def test_fixtures_use_home_team_day_time_and_venue(self):
+        """Verify fixtures follow the home team's day, time and venue."""
+        generate_season_fixtures(self.season)
+        for fixture in Fixture.objects.select_related("home_team", "week"):
+            home_team = fixture.home_team
+            local = fixture.datetime.astimezone()
+            self.assertEqual(
+                local.strftime("%A").lower(), home_team.home_day
+            )
+            self.assertEqual(local.time(), home_team.home_time)
+            self.assertEqual(fixture.venue_id, home_team.home_venue_id)
+            fixture.full_clean()
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_uses_constant_number_of_queries(self):
+        """
+        Verify fixtures are validated and inserted in bulk (one query each
+        for weeks, divisions, teams, existing fixtures and the insert, plus
+        the transaction savepoint and its release).
+        """
+        with self.assertNumQueries(7):
+            generate_season_fixtures(self.season)
+
+    def test_too_few_weeks_raises_error(self):
+        """Verify an error is raised if there are not enough weeks."""
+        self.weeks[-1].delete()
+        self.weeks[-2].delete()
+        self.weeks[-3].delete()
+        self.weeks[-4].delete()
+        self.weeks[-5].delete()
+        with self.assertRaises(ValidationError):
+            generate_season_fixtures(self.season)
+        self.assertFalse(Fixture.objects.exists())
+
+    def test_existing_fixtures_raise_error(self):
+        """Verify a season is not scheduled twice."""
+        generate_season_fixtures(self.season)
+        with self.assertRaises(ValidationError):
+            generate_season_fixtures(self.season)
+        self.assertEqual(Fixture.objects.count(), 24)
+
+    def test_unapproved_teams_are_excluded(self):
+        """Verify only approved teams are scheduled."""
+        team = self.teams[self.division1][0]
+        team.approved = False
+        team.save()
+        generate_season_fixtures(self.season)
+        self.assertFalse(
+            Fixture.objects.filter(home_team=team).exists()
+            or Fixture.objects.filter(away_team=team).exists()
+        )
+        self.assertEqual(Fixture.objects.count(), 6 + 12)
@@ -0,0 +1,137 @@
+from datetime import time
+from django.test import TestCase
+from django.urls import reverse
+from test_utils.helpers import (
+    create_club,
+    create_fixture,
+    create_fixture_result_setup,
+    create_team,
+)
+from league.ical import escape_text, fold_line
+
+
+class CalendarFeedTests(TestCase):
+    """Tests for the team, club and division iCalendar feeds."""
+
+    def setUp(self):
+        self.data = create_fixture_result_setup()
+        self.fixture = self.data["fixture"]
+        self.team1 = self.data["team1"]
+        self.team2 = self.data["team2"]
+
+        # Another club's team with a fixture against team 2
+        self.other_club = create_club("Other Club")
+        self.team3 = create_team(
+            season=self.data["season"],
+            division=self.data["division"],
+            club=self.other_club,
+            venue=self.data["venue"],
+            team_name="Team C",
+            home_day="wednesday",
+            home_time=time(19, 0),
+        )
+        self.other_fixture = create_fixture(
+            self.data["season"],
+            self.data["division"],
+            self.data["week"],
+            self.team3,
+            self.team2,
+        )
+
+    def get_feed(self, url, **extra):
+        """Returns the response and the streamed body for a feed."""
+        response = self.client.get(url, **extra)
+        if response.status_code != 200:
+            return response, ""
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_team_feed_contains_team_fixtures(self):
+        """Verify the team feed has one event per team fixture."""
+        response, body = self.get_feed(
+            reverse("team_calendar", args=[self.team1.id])
+        )
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            response["Content-Type"], "text/calendar; charset=utf-8"
+        )
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(body.endswith("END:VCALENDAR\r\n"))
+        self.assertEqual(body.count("BEGIN:VEVENT"), 1)
+        self.assertIn(f"UID:fixture-{self.fixture.id}@", body)
+        self.assertIn("SUMMARY:Team A vs Team B", body)
+        self.assertIn("LOCATION:Venue 1", body)
+        self.assertIn("DESCRIPTION:2024/25 Division 1\\nWeek 1", body)
+
+    def test_club_feed_matches_home_or_away(self):
+        """Verify the club feed includes home and away fixtures."""
+        _, body = self.get_feed(
+            reverse("club_calendar", args=[self.other_club.id])
+        )
+        self.assertEqual(body.count("BEGIN:VEVENT"), 1)
+        self.assertIn("SUMMARY:Team C vs Team B", body)
+
+        _, body = self.get_feed(
+            reverse("club_calendar", args=[self.data["club"].id])
+        )
+        self.assertEqual(body.count("BEGIN:VEVENT"), 2)
+
+    def test_division_feed_contains_division_fixtures(self):
+        """Verify the division feed includes every division fixture."""
+        _, body = self.get_feed(
+            reverse("division_calendar", args=[self.data["division"].id])
+        )
+        self.assertEqual(body.count("BEGIN:VEVENT"), 2)
+
+    def test_unknown_records_return_not_found(self):
+        """Verify unknown teams, clubs, divisions and seasons return 404."""
+        urls = [
+            reverse("team_calendar", args=[9999]),
+            reverse("club_calendar", args=[9999]),
+            reverse("division_calendar", args=[9999]),
+            reverse("division_calendar", args=[self.data["division"].id])
+            + "?season=missing",
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_cancelled_fixture_is_marked_cancelled(self):
+        """Verify cancelled fixtures are published as cancelled events."""
+        self.other_fixture.status = "cancelled"
+        self.other_fixture.save()
+        _, body = self.get_feed(
+            reverse("team_calendar", args=[self.team3.id])
+        )
+        self.assertIn("STATUS:CANCELLED", body)
+        self.assertIn("SUMMARY:Team C vs Team B (Cancelled)", body)
+
+    def test_matching_etag_returns_not_modified(self):
+        """Verify an unchanged feed returns a 304 response."""
+        url = reverse("team_calendar", args=[self.team1.id])
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.fixture.status = "postponed"
+        self.fixture.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_escape_text(self):
+        """Verify special characters are escaped in text values."""
+        self.assertEqual(
+            escape_text("A, B; C\\D\nE"), "A\\, B\\; C\\\\D\\nE"
+        )
+
+    def test_fold_line(self):
+        """Verify long lines are folded to at most 75 octets."""
+        folded = fold_line("SUMMARY:" + "é" * 100)
+        lines = folded.split("\r\n")[:-1]
+        self.assertGreater(len(lines), 1)
+        for line in lines:
+            self.assertLessEqual(len(line.encode("utf-8")), 75)
+        self.assertTrue(all(line.startswith(" ") for line in lines[1:]))
+        self.assertEqual(
+            folded.replace("\r\n ", ""), "SUMMARY:" + "é" * 100 + "\r\n"
+        )
@@ -0,0 +1,111 @@
+import json
+from unittest.mock import patch
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from test_utils.helpers import create_fixture_result_setup
+from league.cache import CACHE_ALIAS
+from league.instrumentation import (
+    RequestMetricsMiddleware,
+    get_current_metrics,
+)
+from league.tests.test_cache import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES, REQUEST_METRICS_SAMPLE_RATE=0)
+class RequestMetricsMiddlewareTests(TestCase):
+    """Tests for the per-request query, template and cache metrics."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_result_setup()
+        cls.staff_user = User.objects.create_user(
+            username="staff", password="password", is_staff=True
+        )
+
+    def setUp(self):
+        caches[CACHE_ALIAS].clear()
+
+    def tearDown(self):
+        caches[CACHE_ALIAS].clear()
+
+    def get_logged_metrics(self, url):
+        """Requests a URL and returns the response and its logged metrics."""
+        with self.assertLogs("league.requests", "INFO") as logs:
+            response = self.client.get(url)
+        return response, json.loads(logs.records[-1].getMessage())
+
+    def test_metrics_are_logged(self):
+        """Verify the view, query count and timings are logged."""
+        url = reverse("tables")
+        with self.assertLogs("league.requests", "INFO") as logs:
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(url)
+        metrics = json.loads(logs.records[-1].getMessage())
+
+        self.assertEqual(metrics["view"], "tables")
+        self.assertEqual(metrics["path"], url)
+        self.assertEqual(metrics["status"], 200)
+        self.assertEqual(metrics["queries"], len(queries))
+        self.assertGreater(metrics["template_ms"], 0)
+        self.assertLessEqual(metrics["db_ms"], metrics["total_ms"])
+
+    def test_cache_hits_and_misses_are_counted(self):
+        """Verify a repeated request is served from the cache."""
+        _, first = self.get_logged_metrics(reverse("tables"))
+        _, second = self.get_logged_metrics(reverse("tables"))
+        self.assertGreater(first["cache_misses"], 0)
+        self.assertEqual(second["cache_misses"], 0)
+        self.assertGreater(second["cache_hits"], 0)
+        self.assertLess(second["queries"], first["queries"])
+
+    def test_header_is_not_sent_to_public(self):
+        response, _ = self.get_logged_metrics(reverse("tables"))
+        self.assertNotIn("Server-Timing", response)
+
+    def test_header_is_sent_to_staff(self):
+        """Verify staff users receive the Server-Timing header."""
+        self.client.force_login(self.staff_user)
+        response, metrics = self.get_logged_metrics(reverse("tables"))
+        header = response["Server-Timing"]
+        self.assertIn(f'desc="{metrics["queries"]} queries"', header)
+        self.assertIn("tpl;dur=", header)
+        self.assertIn("total;dur=", header)
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=1)
+    def test_header_is_sent_to_sampled_requests(self):
+        response, _ = self.get_logged_metrics(reverse("clubs"))
+        self.assertIn("Server-Timing", response)
+
+    def test_streamed_pages_are_logged_when_the_stream_closes(self):
+        response = self.client.get(reverse("fixtures"), {"weeks": "all"})
+        self.assertTrue(response.streaming)
+        with self.assertLogs("league.requests", "INFO") as logs:
+            b"".join(response.streaming_content)
+            response.close()
+        metrics = json.loads(logs.records[-1].getMessage())
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(metrics["view"], "fixtures")
+        self.assertTrue(metrics["streamed"])
+        self.assertGreater(metrics["template_ms"], 0)
+
+    @override_settings(REQUEST_METRICS_ENABLED=False)
+    def test_disabled_metrics_do_not_wrap_templates(self):
+        """
+        Verify the middleware is not used and Template.render is left as
+        it is when metrics are disabled.
+        """
+        with patch(
+            "league.instrumentation.install_template_timer"
+        ) as install, self.assertRaises(MiddlewareNotUsed):
+            RequestMetricsMiddleware(lambda request: None)
+        install.assert_not_called()
+
+    def test_metrics_are_not_recorded_outside_requests(self):
+        self.client.get(reverse("tables"))
+        self.assertIsNone(get_current_metrics())
@@ -0,0 +1,126 @@
+from datetime import time
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from test_utils.helpers import (
+    create_club,
+    create_division,
+    create_fixture_result_setup,
+    create_team,
+)
+from league.filters import FixtureFilter
+from league.models import Fixture, SeasonClub
+
+
+class ClubMembershipTests(TestCase):
+    """
+    Tests for the clubs stored on fixtures and the season club lists used
+    to filter fixtures by club.
+    """
+
+    def setUp(self):
+        self.data = create_fixture_result_setup()
+        self.season = self.data["season"]
+        self.fixture = self.data["fixture"]
+        self.other_club = create_club("Other Club")
+
+    def get_fixture_clubs(self):
+        return Fixture.objects.values_list("home_club", "away_club").get(
+            id=self.fixture.id
+        )
+
+    def get_season_club_ids(self):
+        return set(
+            SeasonClub.objects.filter(season=self.season).values_list(
+                "club_id", flat=True
+            )
+        )
+
+    def test_fixture_save_copies_team_clubs(self):
+        club_id = self.data["club"].id
+        self.assertEqual(self.get_fixture_clubs(), (club_id, club_id))
+
+    def test_team_clubs_are_read_in_one_query(self):
+        club_id = self.data["club"].id
+        fixture = Fixture.objects.get(id=self.fixture.id)
+        with self.assertNumQueries(1):
+            clubs = fixture.get_team_clubs()
+        self.assertEqual(
+            clubs,
+            {self.data["team1"].id: club_id, self.data["team2"].id: club_id},
+        )
+
+        # Teams already loaded on the fixture are reused
+        with self.assertNumQueries(0):
+            self.assertEqual(len(self.fixture.get_team_clubs()), 2)
+
+    def test_team_clubs_of_a_fixture_without_teams(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(Fixture().get_team_clubs(), {})
+
+    def test_team_club_change_updates_fixtures_and_season_clubs(self):
+        """Verify changing a team's club updates its fixtures."""
+        team = self.data["team2"]
+        team.club = self.other_club
+        team.save()
+
+        self.assertEqual(
+            self.get_fixture_clubs(), (self.data["club"].id, team.club_id)
+        )
+        self.assertEqual(
+            self.get_season_club_ids(),
+            {self.data["club"].id, self.other_club.id},
+        )
+
+        Fixture.objects.filter(away_team=team).delete()
+        team.delete()
+        self.assertEqual(self.get_season_club_ids(), {self.data["club"].id})
+
+    def test_club_filter_options_list_each_club_once(self):
+        """Verify clubs with several teams in a season are listed once."""
+        division = create_division("Division 2", 2)
+        self.season.divisions.add(division)
+        create_team(
+            self.season,
+            division,
+            self.other_club,
+            self.data["venue"],
+            "Team C",
+            "monday",
+            time(19, 0),
+        )
+
+        season_filter = FixtureFilter({"season": self.season.slug})
+        self.assertEqual(
+            season_filter.form.fields["club"].records,
+            [self.other_club, self.data["club"]],
+        )
+        division_filter = FixtureFilter(
+            {"season": self.season.slug, "division": division.id}
+        )
+        self.assertEqual(
+            division_filter.form.fields["club"].records,
+            [self.other_club],
+        )
+
+    def test_club_filter_does_not_join_teams(self):
+        """Verify club filtering uses the clubs stored on fixtures."""
+        fixture_filter = FixtureFilter(
+            {"season": self.season.slug, "club": self.data["club"].id},
+            queryset=Fixture.objects.all(),
+        )
+        sql = str(fixture_filter.qs.query)
+        self.assertNotIn("league_team", sql)
+        self.assertNotIn("DISTINCT", sql)
+        self.assertEqual(list(fixture_filter.qs), [self.fixture])
+
+    def test_rebuild_standings_rebuilds_membership(self):
+        """Verify bulk-loaded data can be brought up to date."""
+        Fixture.objects.update(home_club=None, away_club=None)
+        SeasonClub.objects.all().delete()
+
+        call_command("rebuild_standings", stdout=StringIO())
+
+        club_id = self.data["club"].id
+        self.assertEqual(self.get_fixture_clubs(), (club_id, club_id))
+        self.assertEqual(self.get_season_club_ids(), {club_id})
@@ -34,6 +34,7 @@ from league.models import (
     DoublesMatch,
     SinglesGame,
     DoublesGame,
+    LeagueStanding,
 )
 from clubs.models import Club, Venue
 
@@ -2224,3 +2225,132 @@ class DoublesGameTests(TestCase):
         self.assertEqual(games[0], self.doubles_game)
         self.assertEqual(games[1], doubles_game2)
         self.assertEqual(games[2], doubles_game3)
+
+
+class LeagueStandingTests(TestCase):
+    """
+    Unit tests for the LeagueStanding model verifying records are created
+    for new teams and kept up to date as results are saved and deleted.
+    """
+
+    def setUp(self):
+        # Create a fixture with result using helper method
+        setup_data = create_fixture_result_setup()
+
+        # Assign to self
+        for key, value in setup_data.items():
+            setattr(self, key, value)
+
+        # Players for individual matches
+        self.player1 = create_player("Home", "Player", self.club)
+        self.player2 = create_player("Away", "Player", self.club)
+        self.team_player1 = create_team_player(self.player1, self.team1)
+        self.team_player2 = create_team_player(self.player2, self.team2)
+
+    def test_standing_created_for_new_team(self):
+        """Verify a zeroed standing record is created with a new team."""
+        team = create_team(
+            season=self.season,
+            division=self.division,
+            club=self.club,
+            venue=self.venue,
+            team_name="Team C",
+            home_day="monday",
+            home_time=time(19, 0),
+        )
+        standing = LeagueStanding.objects.get(team=team)
+        self.assertEqual(standing.season, self.season)
+        self.assertEqual(standing.division, self.division)
+        self.assertEqual(standing.played, 0)
+        self.assertEqual(standing.points, 0)
+
+    def test_standings_updated_when_result_saved(self):
+        """Verify saving a result updates standings for both teams."""
+        home = LeagueStanding.objects.get(team=self.team1)
+        away = LeagueStanding.objects.get(team=self.team2)
+
+        self.assertEqual(
+            (home.played, home.won, home.lost, home.points), (1, 1, 0, 2)
+        )
+        self.assertEqual(home.team_sets_won, 7)
+        self.assertEqual(
+            (away.played, away.won, away.lost, away.points), (1, 0, 1, 0)
+        )
+        self.assertEqual(away.team_sets_won, 3)
+
+    def test_standings_updated_when_result_edited(self):
+        """Verify editing a result to a draw updates both standings."""
+        self.fixture_result.home_score = 5
+        self.fixture_result.away_score = 5
+        self.fixture_result.save()
+
+        for team in (self.team1, self.team2):
+            standing = LeagueStanding.objects.get(team=team)
+            self.assertEqual(standing.drawn, 1)
+            self.assertEqual(standing.points, 1)
+            self.assertEqual(standing.team_sets_won, 5)
+
+    def test_standings_updated_when_result_deleted(self):
+        """Verify deleting a result resets both standings."""
+        self.fixture_result.delete()
+
+        for team in (self.team1, self.team2):
+            standing = LeagueStanding.objects.get(team=team)
+            self.assertEqual(standing.played, 0)
+            self.assertEqual(standing.points, 0)
+            self.assertEqual(standing.team_sets_won, 0)
+
+    def test_standings_updated_when_fixture_deleted(self):
+        """Verify deleting a fixture (cascading to its result) resets both
+        standings."""
+        self.fixture.delete()
+
+        standing = LeagueStanding.objects.get(team=self.team1)
+        self.assertEqual(standing.played, 0)
+
+    def test_individual_sets_updated_by_singles_matches(self):
+        """Verify singles match sets are added and removed."""
+        match = create_singles_match(
+            self.fixture_result, self.team_player1, self.team_player2, 3, 1
+        )
+        home = LeagueStanding.objects.get(team=self.team1)
+        away = LeagueStanding.objects.get(team=self.team2)
+        self.assertEqual(home.individual_sets_won, 3)
+        self.assertEqual(away.individual_sets_won, 1)
+
+        match.delete()
+        home.refresh_from_db()
+        self.assertEqual(home.individual_sets_won, 0)
+
+    def test_individual_sets_updated_by_doubles_match(self):
+        """Verify doubles match sets are included in individual sets."""
+        create_doubles_match(
+            self.fixture_result,
+            [self.team_player1],
+            [self.team_player2],
+            2,
+            3,
+        )
+        home = LeagueStanding.objects.get(team=self.team1)
+        away = LeagueStanding.objects.get(team=self.team2)
+        self.assertEqual(home.individual_sets_won, 2)
+        self.assertEqual(away.individual_sets_won, 3)
+
+    def test_standing_division_follows_team(self):
+        """Verify standing division is updated if the team division changes."""
+        division2 = Division.objects.create(name="Division 2", rank=2)
+        self.team1.division = division2
+        self.team1.save()
+
+        standing = LeagueStanding.objects.get(team=self.team1)
+        self.assertEqual(standing.division, division2)
+
+    def test_standing_deleted_with_team(self):
+        """Verify standing is deleted when its team is deleted."""
+        self.fixture.delete()
+        team_id = self.team1.id
+        self.team_player1.delete()
+        self.team1.delete()
+        self.assertFalse(
+            LeagueStanding.objects.filter(team_id=team_id).exists()
+        )
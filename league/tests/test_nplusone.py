@@ -0,0 +1,136 @@
+from datetime import time
+from django.template import Context, Template
+from django.http import StreamingHttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from test_utils.helpers import (
+    create_fixture,
+    create_fixture_result_setup,
+    create_team,
+    create_venue,
+    create_week,
+)
+from league.models import Fixture, Season
+from league.nplusone import (
+    NPlusOneMiddleware,
+    RepeatedQueriesError,
+    detect_repeated_queries,
+    get_query_shape,
+)
+from league.tests.test_cache import LOCMEM_CACHES
+
+
+class QueryShapeTests(TestCase):
+    """Tests for reducing SQL to its shape."""
+
+    def test_parameters_and_literals_are_replaced(self):
+        self.assertEqual(
+            get_query_shape(
+                'SELECT "a"."id" FROM "a" WHERE "a"."id" = %s\n'
+                "  AND \"a\".\"name\" = 'x''s' LIMIT 21"
+            ),
+            'SELECT "a"."id" FROM "a" WHERE "a"."id" = ? '
+            'AND "a"."name" = ? LIMIT ?',
+        )
+
+    def test_in_lists_of_any_length_share_a_shape(self):
+        self.assertEqual(
+            get_query_shape('SELECT * FROM "a" WHERE "id" IN (%s, %s, %s)'),
+            get_query_shape('SELECT * FROM "a" WHERE "id" IN (1)'),
+        )
+
+
+class DetectRepeatedQueriesTests(TestCase):
+    """Tests for detecting query shapes repeated within a block."""
+
+    @classmethod
+    def setUpTestData(cls):
+        data = create_fixture_result_setup()
+        week = create_week(data["season"], 2)
+        for num in range(6):
+            team = create_team(
+                data["season"],
+                data["division"],
+                data["club"],
+                create_venue(f"Venue {num + 2}"),
+                f"Team {num}",
+                "monday",
+                time(19, 0),
+            )
+            create_fixture(
+                data["season"], data["division"], week, team, data["team1"]
+            )
+
+    def test_repeated_lazy_loads_raise_error(self):
+        """Verify the error names the query and the line running it."""
+        with self.assertRaises(RepeatedQueriesError) as error:
+            with detect_repeated_queries(threshold=5):
+                for fixture in Fixture.objects.all():
+                    fixture.venue.name
+        message = str(error.exception)
+        self.assertIn('FROM "clubs_venue"', message)
+        self.assertIn("league/tests/test_nplusone.py:", message)
+
+    def test_queries_within_threshold_are_allowed(self):
+        with detect_repeated_queries(threshold=5) as counter:
+            for _ in range(5):
+                Season.objects.filter(is_current=True).first()
+        self.assertEqual(counter.repeated, [])
+
+    def test_log_mode_logs_warning(self):
+        """Verify each repeated shape is logged once without raising."""
+        with self.assertLogs("league.queries", "WARNING") as logs:
+            with detect_repeated_queries(threshold=2, mode="log") as counter:
+                for fixture in Fixture.objects.all():
+                    fixture.venue.name
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(len(counter.repeated), 1)
+
+    def test_allowlisted_shapes_are_ignored(self):
+        with detect_repeated_queries(
+            threshold=2, allowlist=[r'FROM "clubs_venue"']
+        ) as counter:
+            for fixture in Fixture.objects.all():
+                fixture.venue.name
+        self.assertEqual(counter.repeated, [])
+
+    def test_template_location_is_reported(self):
+        """Verify queries run by a template report the template line."""
+        template = Template(
+            "{% for fixture in fixtures %}\n"
+            "{{ fixture.venue.name }}\n"
+            "{% endfor %}"
+        )
+        context = Context({"fixtures": Fixture.objects.all()})
+        with detect_repeated_queries(threshold=2, mode="log") as counter:
+            with self.assertLogs("league.queries", "WARNING"):
+                template.render(context)
+        self.assertEqual(counter.repeated[0][1], "<unknown source>:2")
+
+    @override_settings(N_PLUS_ONE_MODE="raise", N_PLUS_ONE_THRESHOLD=2)
+    def test_middleware_checks_streamed_responses(self):
+        """
+        Verify queries made while a streamed response is sent are counted
+        with the queries made by the view.
+        """
+
+        def stream_venues():
+            for fixture in Fixture.objects.all():
+                yield fixture.venue.name
+
+        def get_response(request):
+            Fixture.objects.first().venue
+            return StreamingHttpResponse(stream_venues())
+
+        middleware = NPlusOneMiddleware(get_response)
+        response = middleware(RequestFactory().get("/"))
+        with self.assertRaises(RepeatedQueriesError):
+            b"".join(response.streaming_content)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_fixtures_page_has_no_repeated_queries(self):
+        """Verify fixture venues are not loaded one at a time."""
+        with detect_repeated_queries(threshold=2) as counter:
+            response = self.client.get(reverse("fixtures"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(counter.repeated, [])
@@ -0,0 +1,202 @@
+from datetime import datetime, time, timedelta
+from itertools import permutations
+from unittest.mock import patch
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from test_utils.helpers import (
+    create_fixture,
+    create_fixture_result,
+    create_fixture_result_setup,
+    create_team,
+    create_week,
+)
+from league.archive import ARCHIVE_MAX_AGE, finalize_season
+from league.cache import CACHE_ALIAS
+from league.paging import WEEKS_PER_PAGE
+from league.tests.test_cache import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class WeekPagingTests(TestCase):
+    """Tests for the week-by-week paging of the fixtures and results."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = create_fixture_result_setup()
+        cls.season = cls.data["season"]
+        teams = [cls.data["team1"], cls.data["team2"]] + [
+            create_team(
+                cls.season,
+                cls.data["division"],
+                cls.data["club"],
+                cls.data["venue"],
+                name,
+                "wednesday",
+                time(19, 0),
+            )
+            for name in ["Team C", "Team D"]
+        ]
+
+        # Twelve weeks with one fixture in each of weeks 2 to 12, of which
+        # weeks 1 to 8 have results
+        cls.weeks = [cls.data["week"]] + [
+            create_week(cls.season, week_num) for week_num in range(2, 13)
+        ]
+        pairs = [
+            pair
+            for pair in permutations(teams, 2)
+            if pair != (cls.data["team1"], cls.data["team2"])
+        ]
+        for week, (home, away) in zip(cls.weeks[1:], pairs):
+            fixture = create_fixture(
+                cls.season, cls.data["division"], week, home, away
+            )
+            if week.start_date <= cls.weeks[7].start_date:
+                create_fixture_result(fixture, 6, 4)
+
+    def setUp(self):
+        caches[CACHE_ALIAS].clear()
+
+    def get_on(self, day, url, params=None, **headers):
+        """Requests a page as if today were the given date."""
+        now = timezone.make_aware(datetime.combine(day, datetime.min.time()))
+        with patch("league.views.timezone.now", return_value=now):
+            return self.client.get(url, params or {}, **headers)
+
+    def assertWeeks(self, response, weeks):
+        """Checks the weeks shown on a page (held in the season index)."""
+        self.assertEqual(
+            [week.id for week in response.context["weeks"]],
+            [week.id for week in weeks],
+        )
+
+    # Fixtures
+    def test_fixtures_open_on_the_current_week(self):
+        response = self.get_on(
+            self.weeks[5].start_date + timedelta(days=3), reverse("fixtures")
+        )
+        self.assertWeeks(response, self.weeks[4:9])
+        self.assertEqual(response.context["current_week_id"], self.weeks[5].id)
+        self.assertContains(response, "Show earlier weeks")
+        self.assertContains(response, "Show later weeks")
+        self.assertNotContains(response, self.weeks[3].name + ":")
+
+    def test_fixtures_open_on_the_last_weeks_of_a_finished_season(self):
+        response = self.get_on(
+            self.weeks[-1].start_date + timedelta(days=30),
+            reverse("fixtures"),
+        )
+        self.assertWeeks(response, self.weeks[-5:])
+        self.assertIsNone(response.context["current_week_id"])
+        self.assertContains(response, "Show earlier weeks")
+        self.assertNotContains(response, "Show later weeks")
+
+    def test_fixtures_open_on_the_first_weeks_before_the_season(self):
+        response = self.get_on(
+            self.season.start_date - timedelta(days=30), reverse("fixtures")
+        )
+        self.assertWeeks(response, self.weeks[:5])
+        self.assertNotContains(response, "Show earlier weeks")
+        self.assertContains(response, "Show later weeks")
+
+    def test_page_size_does_not_grow_with_the_season(self):
+        today = self.weeks[5].start_date
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_on(today, reverse("fixtures"))
+        size = len(response.content)
+
+        for week_num in range(13, 40):
+            create_week(self.season, week_num)
+        caches[CACHE_ALIAS].clear()
+        with self.assertNumQueries(len(queries)):
+            response = self.get_on(today, reverse("fixtures"))
+        self.assertEqual(len(response.context["weeks"]), WEEKS_PER_PAGE)
+        self.assertEqual(len(response.content), size)
+
+    def test_later_and_earlier_weeks_load_through_htmx(self):
+        today = self.weeks[5].start_date
+        response = self.get_on(today, reverse("fixtures"))
+        later_url = response.context["later_weeks_url"]
+        earlier_url = response.context["earlier_weeks_url"]
+
+        response = self.get_on(today, later_url, HTTP_HX_REQUEST="true")
+        self.assertTemplateUsed(response, "league/partials/fixture_weeks.html")
+        self.assertTemplateNotUsed(
+            response, "league/partials/fixtures_section.html"
+        )
+        self.assertWeeks(response, self.weeks[9:])
+        self.assertNotContains(response, "Show later weeks")
+        self.assertNotContains(response, "Show earlier weeks")
+
+        response = self.get_on(today, earlier_url, HTTP_HX_REQUEST="true")
+        self.assertWeeks(response, self.weeks[:4])
+        self.assertNotContains(response, "Show earlier weeks")
+
+    def test_more_weeks_urls_keep_the_filters(self):
+        response = self.get_on(
+            self.weeks[5].start_date,
+            reverse("fixtures"),
+            {"division": self.data["division"].id},
+        )
+        self.assertEqual(
+            response.context["later_weeks_url"],
+            f"{reverse('fixture_weeks')}?division="
+            f"{self.data['division'].id}&season={self.season.slug}"
+            f"&after={self.weeks[8].start_date.isoformat()}",
+        )
+
+    def test_week_endpoints_are_for_htmx_only(self):
+        for name in ["fixture_weeks", "result_weeks"]:
+            with self.subTest(name=name):
+                response = self.client.get(reverse(name))
+                self.assertEqual(response.status_code, 400)
+
+    def test_all_weeks_are_shown_on_request(self):
+        response = self.get_on(
+            self.weeks[5].start_date, reverse("fixtures"), {"weeks": "all"}
+        )
+        self.assertWeeks(response, self.weeks)
+        self.assertFalse(response.context["filters_applied"])
+        self.assertNotContains(response, "Show earlier weeks")
+        self.assertNotContains(response, "Show later weeks")
+
+    # Results
+    def test_results_open_on_the_latest_results(self):
+        response = self.client.get(reverse("results"))
+        self.assertWeeks(response, self.weeks[7:2:-1])
+        self.assertContains(response, "Show earlier results")
+
+        response = self.client.get(
+            response.context["earlier_weeks_url"], HTTP_HX_REQUEST="true"
+        )
+        self.assertTemplateUsed(response, "league/partials/result_weeks.html")
+        self.assertWeeks(response, self.weeks[2::-1])
+        self.assertNotContains(response, "Show earlier results")
+
+    def test_archived_results_are_paged(self):
+        self.season.is_current = False
+        self.season.save()
+        finalize_season(self.season)
+
+        response = self.client.get(
+            reverse("results"), {"season": self.season.slug}
+        )
+        self.assertEqual(
+            [week["id"] for week in response.context["weeks"]],
+            [week.id for week in self.weeks[7:2:-1]],
+        )
+
+        response = self.client.get(
+            response.context["earlier_weeks_url"], HTTP_HX_REQUEST="true"
+        )
+        self.assertEqual(
+            [week["id"] for week in response.context["weeks"]],
+            [week.id for week in self.weeks[2::-1]],
+        )
+        self.assertIn(
+            f"max-age={ARCHIVE_MAX_AGE}", response["Cache-Control"]
+        )
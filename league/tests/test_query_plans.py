@@ -0,0 +1,159 @@
+"""
+Query plan tests for the league pages.
+
+Each test requests a page, runs EXPLAIN QUERY PLAN on the queries it makes
+and checks that the league tables are searched using the expected indexes
+rather than scanned in full, so schema or view changes cannot silently
+remove an index from a hot path. SQLite only, as plans are database
+specific.
+"""
+
+import re
+from unittest import skipUnless
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from test_utils.helpers import create_fixture_result_setup
+from league.cache import CACHE_ALIAS
+from league.tests.test_cache import LOCMEM_CACHES
+
+
+# League tables which must never be scanned in full by the pages
+LEAGUE_TABLES = [
+    "league_fixture",
+    "league_fixtureresult",
+    "league_singlesmatch",
+    "league_doublesmatch",
+    "league_week",
+    "league_leaguestanding",
+]
+
+
+def get_query_plan(sql):
+    """Returns the EXPLAIN QUERY PLAN details for the SQL as a list."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return [row[-1] for row in cursor.fetchall()]
+
+
+@skipUnless(connection.vendor == "sqlite", "Query plans are SQLite specific")
+@override_settings(CACHES=LOCMEM_CACHES)
+class LeagueQueryPlanTests(TestCase):
+    """Tests that the league page queries use the league indexes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = create_fixture_result_setup()
+        cls.season = cls.data["season"]
+
+    def setUp(self):
+        caches[CACHE_ALIAS].clear()
+
+    def get_page_plans(self, url):
+        """
+        Requests a page and returns the SQL and query plan of each query.
+
+        Returns:
+            list[tuple]: (sql, plan) for every query the page ran.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [
+            (query["sql"], get_query_plan(query["sql"]))
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT")
+        ]
+
+    def get_plan(self, plans, pattern):
+        """Returns the plan of the first query matching the pattern."""
+        for sql, plan in plans:
+            if re.search(pattern, sql):
+                return plan
+        self.fail(f"No query matching {pattern}")
+
+    def assertNoFullScans(self, plans):
+        """Fails if any query reads a whole league table or index."""
+        for sql, plan in plans:
+            for detail in plan:
+                for table in LEAGUE_TABLES:
+                    with self.subTest(table=table, sql=sql[:120]):
+                        self.assertFalse(
+                            re.match(rf"SCAN {table}\b", detail),
+                            f"Full scan of {table}: {plan}",
+                        )
+
+    def assertUsesIndex(self, plan, index_name):
+        self.assertTrue(
+            any(index_name in detail for detail in plan),
+            f"{index_name} not used: {plan}",
+        )
+
+    def test_fixtures_page_uses_indexes(self):
+        """
+        Verify the season index reads weeks in date order from the season
+        and date index and the season's fixtures through a season index.
+        """
+        plans = self.get_page_plans(
+            f"{reverse('fixtures')}?season={self.season.slug}"
+            f"&division={self.data['division'].id}"
+        )
+        self.assertNoFullScans(plans)
+
+        week_plan = self.get_plan(plans, r'FROM "league_week" WHERE')
+        self.assertUsesIndex(week_plan, "week_season_date_idx")
+        self.assertFalse(
+            any("TEMP B-TREE" in detail for detail in week_plan), week_plan
+        )
+        fixture_plan = self.get_plan(
+            plans, r'FROM "league_fixture" .*WHERE "league_fixture"\."season'
+        )
+        self.assertUsesIndex(fixture_plan, "(season_id=?)")
+
+    def test_club_filtered_fixtures_use_indexes(self):
+        plans = self.get_page_plans(
+            f"{reverse('fixtures')}?season={self.season.slug}"
+            f"&club={self.data['club'].id}"
+        )
+        self.assertNoFullScans(plans)
+
+    def test_results_page_uses_indexes(self):
+        plans = self.get_page_plans(
+            f"{reverse('results')}?season={self.season.slug}"
+            f"&division={self.data['division'].id}"
+        )
+        self.assertNoFullScans(plans)
+        team_plan = self.get_plan(plans, r'FROM "league_team" WHERE')
+        self.assertUsesIndex(team_plan, "(season_id=?)")
+        self.assertFalse(
+            any("TEMP B-TREE" in detail for detail in team_plan), team_plan
+        )
+
+    def test_current_season_pages_have_no_full_scans(self):
+        """
+        Verify pages defaulting to the current season (including their
+        conditional GET checks) only read that season's records.
+        """
+        self.season.is_current = True
+        self.season.save()
+        for name in ["tables", "fixtures", "results"]:
+            with self.subTest(page=name):
+                self.assertNoFullScans(self.get_page_plans(reverse(name)))
+
+    def test_team_summary_uses_team_indexes(self):
+        """
+        Verify a team's home or away fixtures (and the singles matches in
+        them) are found through the home and away team indexes.
+        """
+        plans = self.get_page_plans(
+            reverse("team_summary", args=[self.data["team1"].id])
+        )
+        self.assertNoFullScans(plans)
+        fixture_plan = self.get_plan(
+            plans, r'FROM "league_fixture" .*"home_team_id" = \d+ OR'
+        )
+        self.assertIn("MULTI-INDEX OR", fixture_plan)
+        stats_plan = self.get_plan(plans, r'FROM "league_singlesmatch"')
+        self.assertIn("MULTI-INDEX OR", stats_plan)
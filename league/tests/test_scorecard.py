@@ -0,0 +1,345 @@
+import json
+from datetime import time
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from test_utils.helpers import (
+    create_club,
+    create_division,
+    create_fixture,
+    create_player,
+    create_season,
+    create_team,
+    create_team_player,
+    create_venue,
+    create_week,
+)
+from league.models import (
+    DoublesGame,
+    DoublesMatch,
+    Fixture,
+    FixtureResult,
+    LeagueStanding,
+    SinglesGame,
+    SinglesMatch,
+)
+from league.scorecard import (
+    build_scorecard,
+    get_scorecard_fixtures,
+    get_scorecard_players,
+    parse_game_scores,
+    save_scorecard,
+)
+from league.tests.test_cache import LOCMEM_CACHES
+
+HOME_WIN = [[11, 5], [11, 7], [11, 9]]
+AWAY_WIN = [[5, 11], [11, 7], [9, 11], [12, 14]]
+
+
+class ScorecardTests(TestCase):
+    """Tests for submitting a complete scorecard for a fixture."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.home_club = create_club("Home Club")
+        cls.away_club = create_club("Away Club")
+        cls.venue = create_venue("Venue 1")
+        cls.division = create_division("Division 1", 1)
+        cls.season = create_season(
+            "2024/25", "24-25", "24-25", 2024, 2025, True, [cls.division]
+        )
+        cls.week = create_week(cls.season, 1)
+        cls.home_team = create_team(
+            cls.season,
+            cls.division,
+            cls.home_club,
+            cls.venue,
+            "Home Team",
+            "monday",
+            time(19, 0),
+        )
+        cls.away_team = create_team(
+            cls.season,
+            cls.division,
+            cls.away_club,
+            cls.venue,
+            "Away Team",
+            "tuesday",
+            time(19, 0),
+        )
+        cls.fixture = create_fixture(
+            cls.season, cls.division, cls.week, cls.home_team, cls.away_team
+        )
+        cls.home_players = [
+            create_team_player(
+                create_player("Home", f"Player{num}", cls.home_club),
+                cls.home_team,
+            )
+            for num in range(1, 4)
+        ]
+        cls.away_players = [
+            create_team_player(
+                create_player("Away", f"Player{num}", cls.away_club),
+                cls.away_team,
+            )
+            for num in range(1, 4)
+        ]
+        cls.staff_user = User.objects.create_user(
+            username="staff", password="password", is_staff=True
+        )
+        cls.url = reverse("scorecard", args=[cls.fixture.id])
+
+    def setUp(self):
+        self.client.force_login(self.staff_user)
+
+    def get_scorecard_data(self):
+        """
+        Returns valid scorecard data where the home team wins the first six
+        singles matches and the doubles match (a 7-3 home win).
+        """
+        singles = []
+        for home_player in self.home_players:
+            for away_player in self.away_players:
+                singles.append(
+                    {
+                        "home_player": home_player.id,
+                        "away_player": away_player.id,
+                        "games": HOME_WIN if len(singles) < 6 else AWAY_WIN,
+                    }
+                )
+        return {
+            "singles": singles,
+            "doubles": {
+                "home_players": [p.id for p in self.home_players[:2]],
+                "away_players": [p.id for p in self.away_players[:2]],
+                "games": HOME_WIN,
+            },
+        }
+
+    def post_json(self, data):
+        return self.client.post(
+            self.url, json.dumps(data), content_type="application/json"
+        )
+
+    def test_json_scorecard_saves_all_records(self):
+        """Verify every match, game and doubles player is saved."""
+        response = self.post_json(self.get_scorecard_data())
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            response.json(),
+            {
+                "fixture_id": self.fixture.id,
+                "home_score": 7,
+                "away_score": 3,
+                "winner": "home",
+                "url": reverse("result_breakdown", args=[self.fixture.id]),
+            },
+        )
+
+        self.assertEqual(SinglesMatch.objects.count(), 9)
+        self.assertEqual(SinglesGame.objects.count(), 6 * 3 + 3 * 4)
+        doubles = DoublesMatch.objects.get()
+        self.assertEqual(doubles.home_players.count(), 2)
+        self.assertEqual(doubles.away_players.count(), 2)
+        self.assertEqual(DoublesGame.objects.count(), 3)
+
+        fixture = Fixture.objects.get(id=self.fixture.id)
+        self.assertEqual(fixture.status, "completed")
+
+    def test_sets_and_winners_are_derived_from_games(self):
+        """Verify submitted scores are ignored in favour of game points."""
+        data = self.get_scorecard_data()
+        data["home_score"] = 10
+        data["singles"][-1]["home_sets"] = 3
+        self.post_json(data)
+
+        result = FixtureResult.objects.get()
+        self.assertEqual((result.home_score, result.away_score), (7, 3))
+        match = SinglesMatch.objects.get(
+            home_player=self.home_players[2], away_player=self.away_players[2]
+        )
+        self.assertEqual((match.home_sets, match.away_sets), (1, 3))
+        self.assertEqual(match.winner, "away")
+        self.assertEqual(
+            list(match.singles_games.values_list("winner", flat=True)),
+            ["away", "home", "away", "away"],
+        )
+
+    def test_standings_are_refreshed(self):
+        """Verify both teams' standings are updated."""
+        self.post_json(self.get_scorecard_data())
+        home = LeagueStanding.objects.get(team=self.home_team)
+        self.assertEqual(home.played, 1)
+        self.assertEqual(home.points, 2)
+        self.assertEqual(home.team_sets_won, 7)
+        self.assertEqual(home.individual_sets_won, 6 * 3 + 3 * 1 + 3)
+        result = FixtureResult.objects.get()
+        self.assertEqual(result.home_individual_sets, 6 * 3 + 3 * 1 + 3)
+        self.assertEqual(result.away_individual_sets, 6 * 0 + 3 * 3 + 0)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_query_count_does_not_depend_on_games(self):
+        """
+        Verify the scorecard is validated in memory and saved in bulk: one
+        insert per table regardless of the number of matches and games,
+        plus the session, fixture, player, standings and cache tag queries.
+        """
+        with self.assertNumQueries(22):
+            self.post_json(self.get_scorecard_data())
+
+    def test_invalid_scorecard_saves_nothing(self):
+        """Verify errors are reported for each match and nothing is saved."""
+        data = self.get_scorecard_data()
+        data["singles"][0]["games"] = [[11, 10], [11, 5], [11, 5]]
+        data["singles"][1]["games"] = HOME_WIN + [[11, 5]]
+        data["doubles"]["home_players"] = [self.home_players[0].id]
+
+        response = self.post_json(data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["errors"],
+            [
+                "Singles match 1: Set 1: Winner must be at least 2 points "
+                "ahead.",
+                "Singles match 2: Set 4 was played after the match was won.",
+                "Doubles match: Exactly 2 home players must be selected.",
+            ],
+        )
+        self.assertFalse(FixtureResult.objects.exists())
+        self.assertFalse(SinglesMatch.objects.exists())
+
+    def test_players_must_belong_to_club_and_season(self):
+        """Verify players from the wrong club are rejected."""
+        data = self.get_scorecard_data()
+        data["singles"][0]["home_player"] = self.away_players[0].id
+        response = self.post_json(data)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(
+            f"{self.away_players[0].id} is not a home club player",
+            response.json()["errors"][0],
+        )
+
+    def test_total_score_must_be_ten(self):
+        """Verify a scorecard with missing matches is rejected."""
+        data = self.get_scorecard_data()
+        data["singles"].pop()
+        response = self.post_json(data)
+        self.assertEqual(
+            response.json()["errors"], ["Total score must add up to 10."]
+        )
+
+    def test_existing_result_is_not_replaced(self):
+        """Verify a fixture can only be scored once."""
+        self.post_json(self.get_scorecard_data())
+        response = self.post_json(self.get_scorecard_data())
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(FixtureResult.objects.count(), 1)
+
+        response = self.client.get(self.url)
+        self.assertRedirects(
+            response, reverse("result_breakdown", args=[self.fixture.id])
+        )
+
+    def test_invalid_json_returns_bad_request(self):
+        response = self.client.post(
+            self.url, "{", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_values_return_bad_request(self):
+        """Verify wrongly typed values in valid JSON are reported."""
+        data = self.get_scorecard_data()
+        data["doubles"]["home_players"] = 5
+        data["singles"][0]["games"] = [[float("inf"), 5]]
+        response = self.post_json(data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["errors"],
+            [
+                "Singles match 1: Set 1 score is invalid.",
+                "Doubles match: The home players must be a list of player "
+                "IDs.",
+            ],
+        )
+
+    def test_result_entered_while_validating_is_not_replaced(self):
+        """
+        Verify a scorecard saved after another submission for the fixture
+        is rejected rather than failing on the duplicate result.
+        """
+        fixture = get_scorecard_fixtures().get(id=self.fixture.id)
+        scorecard = build_scorecard(
+            fixture,
+            self.get_scorecard_data(),
+            get_scorecard_players(fixture),
+        )
+        self.post_json(self.get_scorecard_data())
+
+        with self.assertRaises(ValidationError):
+            save_scorecard(scorecard)
+        self.assertEqual(FixtureResult.objects.count(), 1)
+        self.assertEqual(SinglesMatch.objects.count(), 9)
+
+    def test_requires_staff_user(self):
+        """Verify non-staff users are redirected to the admin login."""
+        self.client.logout()
+        user = User.objects.create_user(username="user", password="password")
+        self.client.force_login(user)
+        response = self.post_json(self.get_scorecard_data())
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(FixtureResult.objects.exists())
+
+    def test_form_renders(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "league/scorecard.html")
+        self.assertContains(response, "Home Team player 1")
+
+    def test_form_submission_saves_scorecard(self):
+        """Verify the form builds the same scorecard as the JSON data."""
+        form_data = {}
+        for num in range(3):
+            form_data[f"home_player_{num + 1}"] = self.home_players[num].id
+            form_data[f"away_player_{num + 1}"] = self.away_players[num].id
+        for home_num in range(1, 4):
+            for away_num in range(1, 4):
+                form_data[f"singles_{home_num}_{away_num}"] = (
+                    "11-5, 11-7, 11-9" if home_num < 3 else "5-11, 7-11, 9-11"
+                )
+        form_data.update(
+            {
+                "doubles_home_player_1": self.home_players[0].id,
+                "doubles_home_player_2": self.home_players[1].id,
+                "doubles_away_player_1": self.away_players[0].id,
+                "doubles_away_player_2": self.away_players[1].id,
+                "doubles_games": "11-5, 11-7, 11-9",
+            }
+        )
+
+        response = self.client.post(self.url, form_data)
+        self.assertRedirects(
+            response, reverse("result_breakdown", args=[self.fixture.id])
+        )
+        result = FixtureResult.objects.get()
+        self.assertEqual((result.home_score, result.away_score), (7, 3))
+
+    def test_form_shows_scorecard_errors(self):
+        response = self.client.post(self.url, {"doubles_games": "11-5"})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.context["form"].is_valid())
+        self.assertFalse(FixtureResult.objects.exists())
+
+
+class ParseGameScoresTests(TestCase):
+    """Tests for parsing game scores entered as text."""
+
+    def test_parses_comma_separated_scores(self):
+        self.assertEqual(
+            parse_game_scores("11-5, 9 - 11,12-10"),
+            [[11, 5], [9, 11], [12, 10]],
+        )
+
+    def test_invalid_score_raises_error(self):
+        with self.assertRaises(ValidationError):
+            parse_game_scores("11-5, eleven-9")
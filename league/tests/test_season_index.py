@@ -0,0 +1,163 @@
+from datetime import time
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from test_utils.helpers import (
+    create_club,
+    create_division,
+    create_fixture,
+    create_fixture_result,
+    create_fixture_result_setup,
+    create_season,
+    create_team,
+    create_week,
+)
+from league.cache import CACHE_ALIAS
+from league.season_index import (
+    MAX_SEASON_INDEXES,
+    _indexes,
+    get_season_index,
+)
+from league.tests.test_cache import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SeasonIndexTests(TestCase):
+    """Tests for the season fixtures held by each worker."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = create_fixture_result_setup()
+        cls.season = cls.data["season"]
+        cls.week2 = create_week(cls.season, 2)
+
+        # A division 2 fixture (without a result) against another club
+        cls.division2 = create_division("Division 2", 2)
+        cls.season.divisions.add(cls.division2)
+        cls.club2 = create_club("Another Club")
+        cls.teams = [
+            create_team(
+                cls.season,
+                cls.division2,
+                club,
+                cls.data["venue"],
+                name,
+                "wednesday",
+                time(19, 0),
+            )
+            for club, name in [
+                (cls.data["club"], "Team C"),
+                (cls.club2, "Team D"),
+            ]
+        ]
+        cls.fixture2 = create_fixture(
+            cls.season, cls.division2, cls.week2, *cls.teams
+        )
+
+    def setUp(self):
+        caches[CACHE_ALIAS].clear()
+
+    def test_index_is_loaded_once(self):
+        index = get_season_index(self.season)
+        with self.assertNumQueries(0):
+            self.assertIs(get_season_index(self.season), index)
+
+        self.assertEqual(
+            [week.id for week in index.weeks],
+            [self.data["week"].id, self.week2.id],
+        )
+        fixture = index.fixtures[0]
+        self.assertEqual(fixture.id, self.data["fixture"].id)
+        self.assertEqual(fixture.home_team.team_name, "Team A")
+        self.assertEqual(fixture.result.home_score, 7)
+        self.assertIsNone(index.fixtures[1].result)
+
+    def test_fixtures_are_looked_up(self):
+        index = get_season_index(self.season)
+        fixture1, fixture2 = index.fixtures
+        self.assertEqual(index.by_week[self.data["week"].id], (fixture1,))
+        self.assertEqual(index.by_week[self.week2.id], (fixture2,))
+        self.assertEqual(
+            index.get_week_fixtures(
+                index.weeks[1], division_id=self.division2.id
+            ),
+            [fixture2],
+        )
+        self.assertEqual(
+            index.get_week_fixtures(index.weeks[1], club_id=self.club2.id),
+            [fixture2],
+        )
+        self.assertEqual(
+            index.get_week_fixtures(index.weeks[0], club_id=self.club2.id),
+            [],
+        )
+
+    def test_weeks_are_filtered(self):
+        index = get_season_index(self.season)
+        weeks = list(index.iter_weeks(index.weeks, club_id=self.club2.id))
+        self.assertEqual(weeks[0].week_fixtures.all(), [])
+        self.assertEqual(
+            [fixture.id for fixture in weeks[1].week_fixtures.all()],
+            [self.fixture2.id],
+        )
+
+        result_weeks = list(index.iter_result_weeks())
+        self.assertEqual(
+            [week.id for week in result_weeks], [self.data["week"].id]
+        )
+        self.assertEqual(
+            list(index.iter_result_weeks(division_id=self.division2.id)),
+            [],
+        )
+
+    def test_changes_reload_the_index(self):
+        index = get_season_index(self.season)
+
+        create_fixture_result(self.fixture2, 4, 6)
+        reloaded = get_season_index(self.season)
+        self.assertIsNot(reloaded, index)
+        self.assertEqual(reloaded.fixtures[1].result.away_score, 6)
+
+        self.teams[1].team_name = "Team E"
+        self.teams[1].save()
+        self.assertEqual(
+            get_season_index(self.season).teams[self.teams[1].id].team_name,
+            "Team E",
+        )
+
+    def test_least_recently_used_indexes_are_dropped(self):
+        seasons = [self.season] + [
+            create_season(
+                f"20{year}/{year + 1}",
+                f"{year}-{year + 1}",
+                f"{year}-{year + 1}",
+                2000 + year,
+                2001 + year,
+                False,
+                [self.division2],
+            )
+            for year in range(10, 10 + MAX_SEASON_INDEXES)
+        ]
+        _indexes.clear()
+        index = get_season_index(self.season)
+        for season in seasons[1:-1]:
+            get_season_index(season)
+
+        # The first season was used again, so the second is dropped
+        self.assertIs(get_season_index(self.season), index)
+        get_season_index(seasons[-1])
+        self.assertEqual(len(_indexes), MAX_SEASON_INDEXES)
+        self.assertIn(self.season.id, _indexes)
+        self.assertNotIn(seasons[1].id, _indexes)
+
+    def test_pages_read_no_fixtures_on_a_warm_worker(self):
+        # Full-season pages skip the section cache, so only the conditional
+        # GET check (see league/conditional.py) reads the database
+        params = {"season": self.season.slug, "weeks": "all"}
+        for name in ["fixtures", "results"]:
+            with self.subTest(name=name):
+                b"".join(self.client.get(reverse(name), params))
+                with self.assertNumQueries(1):
+                    response = self.client.get(reverse(name), params)
+                    content = b"".join(response.streaming_content)
+                self.assertIn(b"Team A", content)
@@ -0,0 +1,122 @@
+from datetime import time
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from test_utils.helpers import (
+    create_club,
+    create_division,
+    create_fixture_result_setup,
+    create_team,
+)
+from league.cache import CACHE_ALIAS
+from league.filters import FixtureFilter
+from league.forms import LeagueTableForm
+from league.seasons import get_current_season, get_season_store
+from league.tests.test_cache import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SeasonStoreTests(TestCase):
+    """Tests for the seasons and divisions held by each worker."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = create_fixture_result_setup()
+        cls.season = cls.data["season"]
+        cls.division = cls.data["division"]
+
+    def setUp(self):
+        # Start each test with a freshly loaded store
+        caches[CACHE_ALIAS].clear()
+        get_season_store()
+
+    def test_filters_use_no_queries_on_a_warm_worker(self):
+        # The season's club options are loaded on first use
+        FixtureFilter({"season": self.season.slug})
+        with self.assertNumQueries(0):
+            fixture_filter = FixtureFilter(
+                {"season": self.season.slug, "division": self.division.id}
+            )
+            self.assertTrue(fixture_filter.form.is_valid())
+            season_select = str(fixture_filter.form["season"])
+            division_select = str(fixture_filter.form["division"])
+
+            table_form = LeagueTableForm()
+            table_select = str(table_form["season"])
+
+        self.assertEqual(
+            fixture_filter.form.cleaned_data["division"], self.division
+        )
+        self.assertIn(f'value="{self.season.slug}" selected', season_select)
+        self.assertIn(f'value="{self.season.slug}" selected', table_select)
+        self.assertIn("Division 1", division_select)
+
+    def test_current_season_is_the_default(self):
+        fixture_filter = FixtureFilter({})
+        self.assertTrue(fixture_filter.form.is_valid())
+        self.assertEqual(
+            fixture_filter.form.cleaned_data["season"], self.season
+        )
+
+    def test_unknown_choices_are_invalid(self):
+        self.assertFalse(LeagueTableForm({"season": "missing"}).is_valid())
+        other_division = create_division("Division 2", 2)
+        fixture_filter = FixtureFilter(
+            {"season": self.season.slug, "division": other_division.id}
+        )
+        self.assertFalse(fixture_filter.form.is_valid())
+
+    def test_season_changes_reload_the_store(self):
+        self.season.is_current = False
+        self.season.save()
+        self.assertIsNone(get_current_season())
+
+        self.season.is_visible = False
+        self.season.save()
+        self.assertFalse(LeagueTableForm({"season": "24-25"}).is_valid())
+
+    def test_division_changes_reload_the_store(self):
+        division = create_division("Division 2", 2)
+        self.season.divisions.add(division)
+        self.assertEqual(
+            get_season_store().get_divisions(self.season),
+            [self.division, division],
+        )
+
+        division.name = "Premier Division"
+        division.save()
+        self.assertEqual(
+            get_season_store().get_divisions(self.season)[1].name,
+            "Premier Division",
+        )
+
+    def test_filter_endpoint_uses_no_queries_on_a_warm_worker(self):
+        url = reverse("fixtures_filter")
+        params = {"season": self.season.slug, "division": self.division.id}
+        self.client.get(url, params, HTTP_HX_REQUEST="true")
+        with self.assertNumQueries(0):
+            response = self.client.get(url, params, HTTP_HX_REQUEST="true")
+        self.assertContains(response, "Test Club")
+
+    def test_team_changes_reload_club_options(self):
+        division = create_division("Division 2", 2)
+        self.season.divisions.add(division)
+        self.assertEqual(
+            get_season_store().get_clubs(self.season), [self.data["club"]]
+        )
+
+        club = create_club("Another Club")
+        create_team(
+            self.season,
+            division,
+            club,
+            self.data["venue"],
+            "Team C",
+            "monday",
+            time(19, 0),
+        )
+        store = get_season_store()
+        self.assertEqual(
+            store.get_clubs(self.season), [club, self.data["club"]]
+        )
+        self.assertEqual(store.get_clubs(self.season, division.id), [club])
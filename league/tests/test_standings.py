@@ -0,0 +1,346 @@
+import random
+from datetime import time
+from unittest.mock import patch
+from django.db import connection, transaction
+from django.db.models.signals import post_delete
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from test_utils.helpers import (
+    create_club,
+    create_division,
+    create_doubles_match,
+    create_fixture,
+    create_fixture_result,
+    create_fixture_result_setup,
+    create_player,
+    create_season,
+    create_singles_match,
+    create_team,
+    create_team_player,
+    create_venue,
+    create_week,
+)
+from league.models import FixtureResult, LeagueStanding, SinglesMatch, Team
+from league.standings import (
+    STANDING_ORDER,
+    calculate_team_standings,
+    rebuild_league_standings,
+    refresh_team_standings,
+)
+
+
+class StandingsCalculationTests(TestCase):
+    """
+    Tests for the database aggregation used to calculate league standings.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = create_club("Test Club")
+        cls.venue = create_venue("Venue 1")
+        cls.divisions = [
+            create_division(name=f"Division {rank}", rank=rank)
+            for rank in range(1, 4)
+        ]
+        cls.season = create_season(
+            name="2024/25",
+            short_name="24-25",
+            slug="24-25",
+            start_year=2024,
+            end_year=2025,
+            is_current=True,
+            divisions_list=cls.divisions,
+        )
+        cls.week = create_week(season=cls.season, week_num=1)
+
+        # 4 teams per division with a full set of home and away results
+        rng = random.Random(7)
+        cls.teams = []
+        for division in cls.divisions:
+            teams = [
+                create_team(
+                    season=cls.season,
+                    division=division,
+                    club=cls.club,
+                    venue=cls.venue,
+                    team_name=f"{division.name} Team {num}",
+                    home_day="monday",
+                    home_time=time(19, 0),
+                )
+                for num in range(1, 5)
+            ]
+            cls.teams.extend(teams)
+            players = {
+                team: create_team_player(
+                    create_player(team.team_name, "Player", cls.club), team
+                )
+                for team in teams
+            }
+            for home_team in teams:
+                for away_team in teams:
+                    if home_team == away_team:
+                        continue
+                    fixture = create_fixture(
+                        cls.season,
+                        division,
+                        cls.week,
+                        home_team,
+                        away_team,
+                    )
+                    home_score = rng.choice([3, 5, 5, 7])
+                    result = create_fixture_result(
+                        fixture, home_score, 10 - home_score
+                    )
+                    create_singles_match(
+                        result,
+                        players[home_team],
+                        players[away_team],
+                        *rng.choice([(3, 0), (3, 2), (1, 3)]),
+                    )
+                    create_doubles_match(
+                        result,
+                        [players[home_team]],
+                        [players[away_team]],
+                        *rng.choice([(3, 1), (0, 3)]),
+                    )
+
+    def get_python_standings(self):
+        """
+        Calculate standings with the original Python implementation for
+        comparison with the database aggregation.
+        """
+        data = {}
+        for team in Team.objects.filter(season=self.season):
+            data[team.id] = {
+                "division": team.division_id,
+                "P": 0,
+                "W": 0,
+                "D": 0,
+                "L": 0,
+                "team_sets_won": 0,
+                "individual_sets_won": 0,
+                "Pts": 0,
+            }
+        for team in Team.objects.filter(season=self.season):
+            for fixture in team.home_fixtures.select_related("result"):
+                result = fixture.result
+                for team_id, side in (
+                    (fixture.home_team_id, "home"),
+                    (fixture.away_team_id, "away"),
+                ):
+                    row = data[team_id]
+                    row["P"] += 1
+                    row["team_sets_won"] += getattr(result, f"{side}_score")
+                    for match in result.singles_matches.all():
+                        row["individual_sets_won"] += getattr(
+                            match, f"{side}_sets"
+                        )
+                    row["individual_sets_won"] += getattr(
+                        result.doubles_match, f"{side}_sets"
+                    )
+                    if result.winner == "draw":
+                        row["D"] += 1
+                        row["Pts"] += 1
+                    elif result.winner == side:
+                        row["W"] += 1
+                        row["Pts"] += 2
+                    else:
+                        row["L"] += 1
+        return data
+
+    def test_season_calculation_uses_one_query(self):
+        """Verify every division in a season is calculated in one query."""
+        teams = list(Team.objects.filter(season=self.season))
+        with self.assertNumQueries(1):
+            calculate_team_standings(teams, season=self.season)
+
+    def test_calculation_does_not_read_matches(self):
+        """Verify standings are calculated from FixtureResult alone."""
+        teams = list(Team.objects.filter(season=self.season))
+        with CaptureQueriesContext(connection) as queries:
+            calculate_team_standings(teams, season=self.season)
+        sql = queries[0]["sql"]
+        self.assertNotIn("league_singlesmatch", sql)
+        self.assertNotIn("league_doublesmatch", sql)
+
+    def test_calculation_matches_python_totals(self):
+        """Verify database totals match totals calculated in Python."""
+        expected = self.get_python_standings()
+        teams = list(Team.objects.filter(season=self.season))
+        calculated = calculate_team_standings(teams, season=self.season)
+
+        for team_id, row in expected.items():
+            self.assertEqual(
+                calculated[team_id],
+                {
+                    "played": row["P"],
+                    "won": row["W"],
+                    "drawn": row["D"],
+                    "lost": row["L"],
+                    "team_sets_won": row["team_sets_won"],
+                    "individual_sets_won": row["individual_sets_won"],
+                    "points": row["Pts"],
+                },
+            )
+
+    def test_team_calculation_matches_season_calculation(self):
+        """Verify calculating a subset of teams gives the same totals."""
+        teams = list(Team.objects.filter(season=self.season))
+        season_data = calculate_team_standings(teams, season=self.season)
+        team_data = calculate_team_standings(teams[:2])
+        for team in teams[:2]:
+            self.assertEqual(team_data[team.id], season_data[team.id])
+
+    def test_stored_order_matches_python_sort_key(self):
+        """
+        Verify stored standings are read in the same order as the original
+        Python sort key (points, wins, team sets, individual sets then
+        team name).
+        """
+        rebuild_league_standings()
+        expected = self.get_python_standings()
+        names = dict(
+            Team.objects.filter(season=self.season).values_list(
+                "id", "team_name"
+            )
+        )
+
+        for division in self.divisions:
+            division_teams = sorted(
+                (
+                    team_id
+                    for team_id, row in expected.items()
+                    if row["division"] == division.id
+                ),
+                key=lambda team_id: names[team_id],
+            )
+            python_order = sorted(
+                division_teams,
+                key=lambda team_id: (
+                    -expected[team_id]["Pts"],
+                    -expected[team_id]["W"],
+                    -expected[team_id]["team_sets_won"],
+                    -expected[team_id]["individual_sets_won"],
+                ),
+            )
+            stored_order = list(
+                LeagueStanding.objects.filter(
+                    season=self.season, division=division
+                )
+                .order_by(*STANDING_ORDER)
+                .values_list("team_id", flat=True)
+            )
+            self.assertEqual(stored_order, python_order)
+
+
+class IndividualSetsTests(TestCase):
+    """
+    Tests for keeping the individual set totals stored on fixture results
+    in sync with their singles and doubles matches.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = create_fixture_result_setup()
+        cls.result = cls.data["fixture_result"]
+        cls.home_player = create_team_player(
+            create_player("Home", "Player", cls.data["club"]),
+            cls.data["team1"],
+        )
+        cls.away_player = create_team_player(
+            create_player("Away", "Player", cls.data["club"]),
+            cls.data["team2"],
+        )
+
+    def get_totals(self, result=None):
+        result = FixtureResult.objects.get(id=(result or self.result).id)
+        return (result.home_individual_sets, result.away_individual_sets)
+
+    def test_totals_follow_match_changes(self):
+        """Verify totals update when matches are created, edited or deleted."""
+        singles = create_singles_match(
+            self.result, self.home_player, self.away_player, 3, 1
+        )
+        self.assertEqual(self.get_totals(), (3, 1))
+
+        doubles = create_doubles_match(
+            self.result, [self.home_player], [self.away_player], 2, 3
+        )
+        self.assertEqual(self.get_totals(), (5, 4))
+
+        singles.home_sets = 0
+        singles.away_sets = 3
+        singles.save()
+        self.assertEqual(self.get_totals(), (2, 6))
+
+        doubles.delete()
+        self.assertEqual(self.get_totals(), (0, 3))
+
+        standing = LeagueStanding.objects.get(team=self.data["team2"])
+        self.assertEqual(standing.individual_sets_won, 3)
+
+    def test_moving_match_updates_both_results(self):
+        """Verify a match moved to another result updates both totals."""
+        week = create_week(self.data["season"], 2)
+        fixture = create_fixture(
+            self.data["season"],
+            self.data["division"],
+            week,
+            self.data["team2"],
+            self.data["team1"],
+        )
+        other_result = create_fixture_result(fixture, 5, 5)
+        singles = create_singles_match(
+            self.result, self.home_player, self.away_player, 3, 2
+        )
+
+        singles.fixture_result = other_result
+        singles.save()
+        self.assertEqual(self.get_totals(), (0, 0))
+        self.assertEqual(self.get_totals(other_result), (3, 2))
+
+    def test_deleting_result_refreshes_standings_once(self):
+        """Verify deleting a result does not refresh standings per match."""
+        create_singles_match(
+            self.result, self.home_player, self.away_player, 3, 1
+        )
+        create_doubles_match(
+            self.result, [self.home_player], [self.away_player], 2, 3
+        )
+
+        with patch(
+            "league.signals.refresh_team_standings",
+            wraps=refresh_team_standings,
+        ) as refresh, patch(
+            "league.signals.refresh_individual_sets"
+        ) as refresh_sets:
+            self.result.delete()
+        refresh.assert_called_once()
+        refresh_sets.assert_not_called()
+
+        standing = LeagueStanding.objects.get(team=self.data["team1"])
+        self.assertEqual((standing.played, standing.points), (0, 0))
+
+    def test_failed_result_delete_does_not_stop_match_refreshes(self):
+        """
+        Verify a result whose delete was rolled back still refreshes its
+        totals and standings when its matches change.
+        """
+        singles = create_singles_match(
+            self.result, self.home_player, self.away_player, 3, 1
+        )
+
+        def fail_delete(**kwargs):
+            raise RuntimeError("Delete failed")
+
+        post_delete.connect(fail_delete, sender=SinglesMatch)
+        try:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                self.result.delete()
+        finally:
+            post_delete.disconnect(fail_delete, sender=SinglesMatch)
+
+        singles.home_sets = 3
+        singles.away_sets = 2
+        singles.save()
+        self.assertEqual(self.get_totals(), (3, 2))
@@ -0,0 +1,129 @@
+from datetime import time
+from unittest.mock import patch
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from test_utils.helpers import (
+    create_division,
+    create_fixture,
+    create_fixture_result,
+    create_fixture_result_setup,
+    create_team,
+    create_week,
+)
+from league.cache import CACHE_ALIAS
+from league.season_index import show_week
+from league.tests.test_cache import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StreamedPageTests(TestCase):
+    """Tests for the streamed full-season fixtures and results pages."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = create_fixture_result_setup()
+        cls.season = cls.data["season"]
+        cls.week2 = create_week(cls.season, 2)
+        cls.week3 = create_week(cls.season, 3)
+        cls.division2 = create_division("Division 2", 2)
+        cls.season.divisions.add(cls.division2)
+        cls.teams = [
+            create_team(
+                cls.season,
+                cls.division2,
+                cls.data["club"],
+                cls.data["venue"],
+                name,
+                "wednesday",
+                time(19, 0),
+            )
+            for name in ["Team C", "Team D"]
+        ]
+        # Week 2 has no fixtures and week 3 a division 2 result
+        create_fixture_result(
+            create_fixture(cls.season, cls.division2, cls.week3, *cls.teams),
+            7,
+            3,
+        )
+
+    def setUp(self):
+        caches[CACHE_ALIAS].clear()
+
+    def get_streamed(self, name, params=None):
+        """Requests a full-season page, returning the response and chunks."""
+        response = self.client.get(
+            reverse(name), {"weeks": "all", **(params or {})}
+        )
+        self.assertTrue(response.streaming)
+        chunks = [
+            chunk.decode("utf-8") for chunk in response.streaming_content
+        ]
+        return response, chunks
+
+    def test_fixtures_page_streams_each_week(self):
+        response, chunks = self.get_streamed("fixtures")
+        self.assertEqual(response["Content-Type"], "text/html; charset=utf-8")
+
+        # The page start, each week and the page end
+        self.assertEqual(len(chunks), 5)
+        self.assertIn("Fixtures</h1>", chunks[0])
+        self.assertNotIn("week-fixtures", chunks[0])
+        self.assertIn(self.data["week"].name, chunks[1])
+        self.assertIn("Team A", chunks[1])
+        self.assertIn("No fixtures this week.", chunks[2])
+        self.assertIn("Team C", chunks[3])
+        self.assertIn("</html>", chunks[4])
+
+    def test_results_page_streams_latest_week_first(self):
+        _, chunks = self.get_streamed("results")
+        self.assertEqual(len(chunks), 4)
+        self.assertIn("Results</h1>", chunks[0])
+        self.assertIn("7 - 3", chunks[1])
+        self.assertIn(self.data["week"].name, chunks[2])
+
+    def test_results_weeks_are_built_as_they_are_sent(self):
+        """
+        Verify only the first week of results is built before the page
+        starts streaming.
+        """
+        with patch("league.season_index.show_week", wraps=show_week) as shown:
+            response = self.client.get(reverse("results"), {"weeks": "all"})
+            self.assertEqual(shown.call_count, 1)
+            b"".join(response.streaming_content)
+            self.assertEqual(shown.call_count, 2)
+
+    def test_weeks_are_sent_without_queries(self):
+        response = self.client.get(reverse("fixtures"), {"weeks": "all"})
+
+        # The weeks are read from the season index
+        with self.assertNumQueries(0):
+            content = b"".join(response.streaming_content)
+        self.assertIn(b"Team D", content)
+
+    def test_streamed_pages_are_filtered(self):
+        _, chunks = self.get_streamed(
+            "fixtures", {"division": self.division2.id}
+        )
+        self.assertIn("No fixtures this week.", chunks[1])
+        self.assertIn("Team C", chunks[3])
+
+        _, chunks = self.get_streamed(
+            "results", {"division": self.data["division"].id}
+        )
+        self.assertEqual(len(chunks), 3)
+        self.assertIn("Team A", chunks[1])
+
+    def test_htmx_requests_are_not_streamed(self):
+        response = self.client.get(
+            reverse("fixtures"), {"weeks": "all"}, HTTP_HX_REQUEST="true"
+        )
+        self.assertFalse(response.streaming)
+        self.assertContains(response, "Team C")
+
+    def test_page_without_a_season_is_not_streamed(self):
+        response = self.client.get(
+            reverse("fixtures"), {"weeks": "all", "season": "missing"}
+        )
+        self.assertFalse(response.streaming)
+        self.assertContains(response, "Season not found.")
@@ -0,0 +1,119 @@
+import random
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from league.models import (
+    DoublesMatch,
+    Fixture,
+    FixtureResult,
+    LeagueStanding,
+    Season,
+    SinglesGame,
+    SinglesMatch,
+)
+from league.synthetic import (
+    create_synthetic_league,
+    get_game_points,
+    get_match_games,
+)
+
+
+class SyntheticScoreTests(TestCase):
+    """Tests for generating random game and match scores."""
+
+    def test_game_points_are_valid(self):
+        """Verify generated games pass SinglesGame validation."""
+        rng = random.Random(1)
+        for _ in range(500):
+            winner = rng.choice(["home", "away"])
+            home_points, away_points = get_game_points(rng, winner)
+            game = SinglesGame(
+                singles_match=SinglesMatch(),
+                set_num=1,
+                home_points=home_points,
+                away_points=away_points,
+            )
+            game.clean()
+            self.assertEqual(
+                winner, "home" if home_points > away_points else "away"
+            )
+
+    def test_match_is_won_in_last_game(self):
+        """Verify the match winner wins 3 sets, the last one decisive."""
+        rng = random.Random(2)
+        for _ in range(200):
+            games = get_match_games(rng, "away")
+            away_sets = [away > home for home, away in games]
+            self.assertEqual(sum(away_sets), 3)
+            self.assertTrue(away_sets[-1])
+            self.assertLessEqual(len(games), 5)
+
+
+class CreateSyntheticLeagueTests(TestCase):
+    """Tests for creating a synthetic league."""
+
+    def create_league(self, seed=0):
+        return create_synthetic_league(2, 2, 4, seed=seed)
+
+    def test_creates_seasons_fixtures_and_scorecards(self):
+        """Verify each played fixture has a complete, valid scorecard."""
+        counts = self.create_league()
+        self.assertEqual(Season.objects.count(), 2)
+        self.assertEqual(Season.objects.filter(is_current=True).count(), 1)
+        # 2 seasons x 2 divisions x 12 fixtures
+        self.assertEqual(Fixture.objects.count(), 48)
+        self.assertEqual(counts["fixtures"], 48)
+        self.assertEqual(FixtureResult.objects.count(), counts["results"])
+        self.assertGreater(counts["results"], 24)
+        self.assertEqual(SinglesMatch.objects.count(), 9 * counts["results"])
+        self.assertEqual(DoublesMatch.objects.count(), counts["results"])
+
+        for result in FixtureResult.objects.prefetch_related(
+            "singles_matches", "doubles_match"
+        ).select_related("fixture"):
+            result.clean()
+            self.assertEqual(result.fixture.status, "completed")
+            matches = list(result.singles_matches.all())
+            matches.append(result.doubles_match)
+            self.assertEqual(
+                result.home_individual_sets,
+                sum(match.home_sets for match in matches),
+            )
+
+        for match in SinglesMatch.objects.select_related(
+            "fixture_result__fixture__season",
+            "fixture_result__fixture__home_team__club",
+            "fixture_result__fixture__away_team__club",
+            "home_player__team__season",
+            "home_player__team__club",
+            "away_player__team__season",
+            "away_player__team__club",
+        )[:50]:
+            try:
+                match.clean()
+            except ValidationError as error:
+                self.fail(f"{match.pk}: {error}")
+
+    def test_standings_are_rebuilt(self):
+        """Verify stored standings include the generated results."""
+        counts = self.create_league()
+        played = sum(LeagueStanding.objects.values_list("played", flat=True))
+        self.assertEqual(played, 2 * counts["results"])
+
+    def test_same_seed_gives_same_league(self):
+        """Verify the league is reproducible from its seed."""
+        create_synthetic_league(2, 2, 4, seed=5, prefix="First")
+        create_synthetic_league(2, 2, 4, seed=5, prefix="Second")
+
+        def get_points(prefix):
+            season_field = "singles_match__fixture_result__fixture__season"
+            return list(
+                SinglesGame.objects.filter(
+                    **{f"{season_field}__name__startswith": prefix}
+                )
+                .order_by("id")
+                .values_list("home_points", "away_points")
+            )
+
+        first = get_points("First")
+        self.assertGreater(len(first), 0)
+        self.assertEqual(first, get_points("Second"))
@@ -1,6 +1,8 @@
 from datetime import time, datetime, timedelta
 from unittest.mock import patch
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from django.contrib import messages
@@ -25,6 +27,7 @@ from test_utils.helpers import (
     create_singles_game,
     create_doubles_game,
 )
+from league.archive import get_archive_store
 
 
 class FixturesPageTests(TestCase):
@@ -2009,6 +2012,43 @@ class TeamSummaryPageTests(TestCase):
         self.assertEqual(player_data[2]["percent"], 50.0)
         self.assertContains(response, "(RESERVE)")
 
+    def test_player_data_query_count_does_not_grow_with_players(self):
+        """
+        Verify player stats are calculated with a fixed number of queries
+        regardless of how many registered and reserve players there are.
+        """
+        p1 = create_player("Player", "One", self.club)
+        p2 = create_player("Player", "Two", self.club)
+        t1p1 = create_team_player(p1, self.team1)
+        t2p1 = create_team_player(p2, self.team2)
+        create_singles_match(self.fixture_result1, t1p1, t2p1, 3, 0)
+
+        # Load the archived seasons held by each process before counting
+        get_archive_store()
+        with CaptureQueriesContext(connection) as initial_queries:
+            self.client.get(self.url)
+
+        # Add more registered players and reserves from another team
+        for num in range(5):
+            registered = create_team_player(
+                create_player("Registered", f"Player {num}", self.club),
+                self.team1,
+            )
+            reserve = create_team_player(
+                create_player("Reserve", f"Player {num}", self.club),
+                self.team3,
+            )
+            create_singles_match(
+                self.fixture_result1, registered, t2p1, 3, 1
+            )
+            create_singles_match(self.fixture_result2, t2p1, reserve, 1, 3)
+
+        with CaptureQueriesContext(connection) as final_queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.context["player_data"]), 11)
+        self.assertEqual(len(final_queries), len(initial_queries))
+
     # Placeholder fallbacks
     def test_team_with_no_fixtures_or_results_displays_placeholders(self):
         """
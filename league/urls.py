@@ -1,18 +1,40 @@
 from django.urls import path
-from . import views
+from . import ical, views
 
 
 urlpatterns = [
     path("fixtures/", views.fixtures, name="fixtures"),
     path("fixtures/filter", views.fixtures_filter, name="fixtures_filter"),
+    path("fixtures/weeks", views.fixture_weeks, name="fixture_weeks"),
     path("results/", views.results, name="results"),
+    path("results/weeks", views.result_weeks, name="result_weeks"),
     path(
         "results/<int:fixture_id>/breakdown/",
         views.result_breakdown,
         name="result_breakdown",
     ),
+    path(
+        "results/<int:fixture_id>/scorecard/",
+        views.scorecard,
+        name="scorecard",
+    ),
     path("tables/", views.tables, name="tables"),
     path(
         "team/<int:team_id>/summary", views.team_summary, name="team_summary"
     ),
+    path(
+        "team/<int:team_id>/fixtures.ics",
+        ical.team_calendar,
+        name="team_calendar",
+    ),
+    path(
+        "club/<int:club_id>/fixtures.ics",
+        ical.club_calendar,
+        name="club_calendar",
+    ),
+    path(
+        "division/<int:division_id>/fixtures.ics",
+        ical.division_calendar,
+        name="division_calendar",
+    ),
 ]
@@ -1,63 +1,101 @@
+import json
 from datetime import timedelta
+from itertools import chain
 from urllib.parse import urlparse
-from django.http import HttpResponseBadRequest
+from django.core.exceptions import ValidationError
+from django.http import HttpResponse, HttpResponseBadRequest, JsonResponse
 from django.urls import reverse
-from django.db.models import Prefetch, Q
+from django.db.models import Case, Count, F, Prefetch, Q, When
 from django.shortcuts import render, get_object_or_404, redirect
+from django.template.loader import render_to_string
 from django.utils import timezone
 from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
+from clubs.models import Club, Venue
 from .models import (
+    Division,
     Week,
     Fixture,
     SinglesMatch,
+    SinglesGame,
     DoublesMatch,
+    DoublesGame,
     FixtureResult,
+    Player,
     Team,
     Season,
     TeamPlayer,
+    LeagueStanding,
+    SeasonArchive,
 )
+from .archive import (
+    ARCHIVE_MAX_AGE,
+    get_archived_breakdown,
+    get_archived_team_summary,
+    get_requested_archive,
+)
+from .cache import (
+    CLUBS_TAG,
+    SEASONS_TAG,
+    get_or_render_section,
+    get_season_page_tags,
+    team_tag,
+)
+from .conditional import conditional_page
 from .filters import FixtureFilter
-from .forms import LeagueTableForm
-
-
-# Constants
-POINTS_FOR_WIN = 2
-POINTS_FOR_DRAW = 1
+from .forms import LeagueTableForm, ScorecardForm
+from .paging import (
+    PAGING_PARAMS,
+    get_cursor,
+    get_fixture_week_page,
+    get_more_weeks_url,
+    get_result_week_page,
+    get_start_date,
+    shows_all_weeks,
+)
+from .scorecard import (
+    build_scorecard,
+    get_scorecard_fixtures,
+    get_scorecard_players,
+    save_scorecard,
+)
+from .season_index import get_season_index
+from .seasons import get_current_season
+from .standings import POINTS_FOR_WIN, POINTS_FOR_DRAW, STANDING_ORDER
+from .streaming import stream_weeks_page
 
 
 # Helper functions
-def get_default_team_data(team):
+def get_standing_data(standing):
     """
-    Defines the default team data for use in the generate_league_tables
-    helper function.
+    Builds a dictionary of league table data from a stored team standing.
 
     Args:
-        team (Team): The team instance for which default data is generated.
+        standing (LeagueStanding): The standing record for a team.
 
     Returns:
-        dict: A dictionary containing default team data with keys:
+        dict: A dictionary containing team data with keys:
             - 'id' (int): The team's unique identifier.
             - 'name' (str): The team's name.
-            - 'P' (int): Matches played (default as 0).
-            - 'W' (int): Matches won (default as 0).
-            - 'D' (int): Matches drawn (default as 0).
-            - 'L' (int): Matches lost (default as 0).
-            - 'team_sets_won' (int): Number of team sets won (default as 0).
-            - 'individual_sets_won' (int): Number of individual sets won
-                                           (default as 0).
-            - 'Pts' (int): Points earned (default as 0).
+            - 'P' (int): Matches played.
+            - 'W' (int): Matches won.
+            - 'D' (int): Matches drawn.
+            - 'L' (int): Matches lost.
+            - 'team_sets_won' (int): Number of team sets won.
+            - 'individual_sets_won' (int): Number of individual sets won.
+            - 'Pts' (int): Points earned.
     """
 
     return {
-        "id": team.id,
-        "name": team.team_name,
-        "P": 0,
-        "W": 0,
-        "D": 0,
-        "L": 0,
-        "team_sets_won": 0,
-        "individual_sets_won": 0,
-        "Pts": 0,
+        "id": standing.team_id,
+        "name": standing.team.team_name,
+        "P": standing.played,
+        "W": standing.won,
+        "D": standing.drawn,
+        "L": standing.lost,
+        "team_sets_won": standing.team_sets_won,
+        "individual_sets_won": standing.individual_sets_won,
+        "Pts": standing.points,
     }
 
 
@@ -104,59 +142,74 @@ def get_fixture_data(team, fixture):
     }
 
 
-def get_player_match_stats(team_player, team, registered_player_ids):
+def get_team_player_stats(team):
     """
-    Calculates match statistics for a given player when playing for the
-    specified team.
+    Calculates singles match statistics for every player who is registered
+    to, or has played for, the specified team.
 
-    Determines whether the player is officially registered with the team or
-    is a reserve. Considers only singles match records for fixtures where
-    they represented the specified team.
+    Only singles matches in fixtures where the player represented the
+    specified team are counted. The played and won counts for all players
+    are aggregated together in a single grouped query.
 
     Args:
-        team_player (TeamPlayer): The player to calculate stats for.
         team (Team): The team for which the stats are calculated.
-        registered_player_ids (set[int]): A set of IDs for players registered
-                                          to the team.
 
     Returns:
-        dict: A dictionary containing:
+        list[dict]: A list of dictionaries (one per player) containing:
             - 'name' (str): Full name of the player.
             - 'is_registered' (bool): Whether the player is officially
-                                      registered to the team.
+                                      registered to the team (or a reserve).
             - 'played' (int): Total number of singles matches played for the
                               specified team.
             - 'wins' (int): Number of singles matches won.
             - 'percent' (float): Win percentage (rounded to 1 decimal place).
     """
-    # Deduce whether player is registered for the team (or a reserve)
-    is_registered = team_player.id in registered_player_ids
-
-    # Get matches where team player or reserve is playing for this team
-    matches = SinglesMatch.objects.filter(
-        Q(home_player=team_player, fixture_result__fixture__home_team=team)
-        | Q(away_player=team_player, fixture_result__fixture__away_team=team)
+    is_home = Q(fixture_result__fixture__home_team=team)
+    is_away = Q(fixture_result__fixture__away_team=team)
+
+    # Played and won counts grouped by the player representing this team
+    match_stats = (
+        SinglesMatch.objects.filter(is_home | is_away)
+        .values(
+            team_player_id=Case(
+                When(is_home, then=F("home_player")),
+                default=F("away_player"),
+            )
+        )
+        .annotate(
+            played=Count("id"),
+            wins=Count(
+                "id",
+                filter=(is_home & Q(winner="home"))
+                | (is_away & Q(winner="away")),
+            ),
+        )
+        .order_by()
     )
+    stats_by_player = {row["team_player_id"]: row for row in match_stats}
 
-    # Count matches played
-    played = matches.count()
+    # Registered players and reserves who have played for the team
+    team_players = TeamPlayer.objects.filter(
+        Q(team=team) | Q(id__in=list(stats_by_player))
+    ).select_related("player")
 
-    # Count wins
-    wins = matches.filter(
-        (Q(home_player=team_player) & Q(winner="home"))
-        | (Q(away_player=team_player) & Q(winner="away"))
-    ).count()
+    player_data = []
+    for team_player in team_players:
+        stats = stats_by_player.get(team_player.id, {})
+        played = stats.get("played", 0)
+        wins = stats.get("wins", 0)
 
-    # Count percentage wins
-    percent = round((wins / played) * 100, 1) if played else 0.0
+        player_data.append(
+            {
+                "name": f"{team_player.player.full_name}",
+                "is_registered": team_player.team_id == team.id,
+                "played": played,
+                "wins": wins,
+                "percent": round((wins / played) * 100, 1) if played else 0.0,
+            }
+        )
 
-    return {
-        "name": f"{team_player.player.full_name}",
-        "is_registered": is_registered,
-        "played": played,
-        "wins": wins,
-        "percent": percent,
-    }
+    return player_data
 
 
 def get_result_data(team, fixture, fixture_result):
@@ -253,136 +306,219 @@ def get_team_summary_stats(results_data):
     }
 
 
-def generate_league_table(season, division):
+# Views for pages
+# Conditional GET scopes (see league/conditional.py)
+def get_season_page_scope(request):
     """
-    Generates the league table data for a given season and division.
+    Returns the querysets displayed on a page listing league data for the
+    season in the GET parameters (defaults to current season).
 
-    Calculates points from team wins, draws and losses.
+    Records are matched on the season id from a subquery rather than by
+    joining the season table, so each table is searched by its season
+    index instead of being read in full.
+    """
 
-    Teams are sorted in the final table by:
-    1. Total points (Pts) - 2 for a win, 1 for a draw
-    2. Number of wins (W)
-    3. Team sets won (team_sets_won)
-    4. Individual sets won (individual_sets_won)
+    slug = request.GET.get("season")
+    seasons = Season.objects.filter(
+        **({"slug": slug} if slug else {"is_current": True})
+    ).values("id")
+
+    def in_season(prefix):
+        return {f"{prefix}season__in": seasons}
+
+    return [
+        Season.objects.all(),
+        Division.objects.all(),
+        Club.objects.all(),
+        Venue.objects.all(),
+        Week.objects.filter(**in_season("")),
+        Team.objects.filter(**in_season("")),
+        Fixture.objects.filter(**in_season("")),
+        FixtureResult.objects.filter(**in_season("fixture__")),
+        SinglesMatch.objects.filter(**in_season("fixture_result__fixture__")),
+        DoublesMatch.objects.filter(**in_season("fixture_result__fixture__")),
+    ]
 
-    Args:
-        season (Season): The season for which to generate the league table.
-        division (Division): The division within the season.
 
-    Returns:
-        list[dict]: A list of dictionaries, each containing the team stats
-                    and sorted in league table order.
+def get_archived_season_page_scope(request):
     """
+    Returns the querysets displayed on a results or tables page, which for
+    an archived season are the season's snapshot and the seasons, divisions
+    and clubs shown around it.
+    """
+    archive = get_requested_archive(request)
+    if not archive:
+        return get_season_page_scope(request)
+    return [
+        Season.objects.all(),
+        Division.objects.all(),
+        Club.objects.all(),
+        SeasonArchive.objects.filter(season_id=archive.season_id),
+    ]
 
-    # Get all teams for the specified season and division
-    teams = Team.objects.filter(season=season, division=division)
-
-    # Initialize all teams with default data
-    teams_data = {team: get_default_team_data(team) for team in teams}
 
-    # Prefetch fixture result queryset
-    fixture_results_qs = (
-        FixtureResult.objects.filter(
-            fixture__season=season, fixture__division=division
-        )
-        .select_related("fixture", "fixture__home_team", "fixture__away_team")
-        .prefetch_related("singles_matches", "doubles_match")
+def get_team_summary_scope(request, team_id):
+    """
+    Returns the querysets displayed on the team summary page: the teams and
+    players in the team's season plus the team's fixtures and results.
+    """
+    in_fixture = Q(home_team_id=team_id) | Q(away_team_id=team_id)
+    in_result = Q(fixture__home_team_id=team_id) | Q(
+        fixture__away_team_id=team_id
+    )
+    in_match = Q(fixture_result__fixture__home_team_id=team_id) | Q(
+        fixture_result__fixture__away_team_id=team_id
     )
+    return [
+        SeasonArchive.objects.filter(season__season_teams=team_id),
+        Season.objects.all(),
+        Club.objects.all(),
+        Venue.objects.all(),
+        Player.objects.all(),
+        Team.objects.filter(season__season_teams=team_id),
+        TeamPlayer.objects.filter(team__season__season_teams=team_id),
+        Fixture.objects.filter(in_fixture),
+        FixtureResult.objects.filter(in_result),
+        SinglesMatch.objects.filter(in_match),
+        DoublesMatch.objects.filter(in_match),
+    ]
+
 
-    for result in fixture_results_qs:
-        home_team = result.fixture.home_team
-        away_team = result.fixture.away_team
-
-        # Update matches played
-        teams_data[home_team]["P"] += 1
-        teams_data[away_team]["P"] += 1
-
-        # Update Team Sets
-        teams_data[home_team]["team_sets_won"] += result.home_score
-        teams_data[away_team]["team_sets_won"] += result.away_score
-
-        # Win/draw/loss
-        if result.winner == "home":
-            teams_data[home_team]["W"] += 1
-            teams_data[away_team]["L"] += 1
-            teams_data[home_team]["Pts"] += POINTS_FOR_WIN
-        elif result.winner == "away":
-            teams_data[away_team]["W"] += 1
-            teams_data[home_team]["L"] += 1
-            teams_data[away_team]["Pts"] += POINTS_FOR_WIN
-        elif result.winner == "draw":
-            teams_data[home_team]["D"] += 1
-            teams_data[away_team]["D"] += 1
-            teams_data[home_team]["Pts"] += POINTS_FOR_DRAW
-            teams_data[away_team]["Pts"] += POINTS_FOR_DRAW
-
-        # Singles Matches Won
-        for sm in result.singles_matches.all():
-            teams_data[home_team]["individual_sets_won"] += sm.home_sets
-            teams_data[away_team]["individual_sets_won"] += sm.away_sets
-
-        # Track doubles match win
-        if hasattr(result, "doubles_match"):
-            dm = result.doubles_match
-            teams_data[home_team]["individual_sets_won"] += dm.home_sets
-            teams_data[away_team]["individual_sets_won"] += dm.away_sets
-
-    # Sort by points, then team match wins then team sets,
-    # then singles/doubles match sets
-    sorted_result = sorted(
-        teams_data.values(),
-        key=lambda x: (
-            -x["Pts"],
-            -x["W"],
-            -x["team_sets_won"],
-            -x["individual_sets_won"],
+def get_result_breakdown_scope(request, fixture_id):
+    """
+    Returns the querysets displayed on the result breakdown page for a
+    fixture, down to individual games.
+    """
+    in_fixture = Q(home_fixtures=fixture_id) | Q(away_fixtures=fixture_id)
+    return [
+        SeasonArchive.objects.filter(season__season_fixtures=fixture_id),
+        Player.objects.all(),
+        Team.objects.filter(in_fixture),
+        Fixture.objects.filter(id=fixture_id),
+        FixtureResult.objects.filter(fixture_id=fixture_id),
+        SinglesMatch.objects.filter(fixture_result__fixture_id=fixture_id),
+        DoublesMatch.objects.filter(fixture_result__fixture_id=fixture_id),
+        SinglesGame.objects.filter(
+            singles_match__fixture_result__fixture_id=fixture_id
         ),
+        DoublesGame.objects.filter(
+            doubles_match__fixture_result__fixture_id=fixture_id
+        ),
+    ]
+
+
+def get_season_page_max_age(request):
+    """Returns how long browsers may reuse an archived season's page."""
+    return ARCHIVE_MAX_AGE if get_requested_archive(request) else None
+
+
+def found_season_archive(request):
+    """
+    Returns whether the conditional GET check of a team summary or result
+    breakdown found an archive of the page's season (the first queryset in
+    its scope), or True if the check did not run.
+    """
+    if not hasattr(request, "_league_page_state"):
+        return True
+    state = request._league_page_state or {}
+    _, total = state.get(0, (None, 0))
+    return total > 0
+
+
+def get_team_summary_max_age(request, team_id):
+    """Returns how long browsers may reuse an archived team summary."""
+    archived = found_season_archive(request) and get_archived_team_summary(
+        team_id, request
     )
-    return sorted_result
+    return ARCHIVE_MAX_AGE if archived else None
 
 
-# Views for pages
-def fixtures(request):
+def get_result_breakdown_max_age(request, fixture_id):
+    """Returns how long browsers may reuse an archived result breakdown."""
+    archived = found_season_archive(request) and get_archived_breakdown(
+        fixture_id, request
+    )
+    return ARCHIVE_MAX_AGE if archived else None
+
+
+def get_filter_ids(fixture_filter):
     """
-    Displays the fixture list, filtered by season and optionally division
-    and club.
+    Returns the season chosen in a valid FixtureFilter with the ids of the
+    division and club chosen (or None).
+    """
+    division = fixture_filter.form.cleaned_data.get("division")
+    club = fixture_filter.form.cleaned_data.get("club")
+    return (
+        fixture_filter.form.cleaned_data.get("season"),
+        division.id if division else None,
+        club.id if club else None,
+    )
 
-    Supports both full-page rendering and partial updates via HTMX.
-    Filters are applied using FixtureFilter, and results are grouped by weeks.
+
+def build_fixtures_context(request, stream=False):
     """
+    Builds the template context for the fixtures section, filtered by season
+    and optionally division and club using the GET parameters.
 
-    # Prefetch related data for efficiency
-    all_fixtures = Fixture.objects.select_related(
-        "season", "division", "home_team__club", "away_team__club"
-    )
+    Args:
+        request (HttpRequest): The HTTP request containing filter parameters.
+        stream (bool, optional): Whether every week of the season is being
+                                 streamed (see league/streaming.py), in
+                                 which case each week's fixtures are
+                                 grouped as the week is sent.
 
-    # Apply filters from GET params using FixtureFilter
-    fixture_filter = FixtureFilter(request.GET, queryset=all_fixtures)
-    filtered_fixtures_qs = fixture_filter.qs
+    Returns:
+        dict: Context for the fixtures_section partial template.
+    """
+
+    # Validate the filters from GET params using FixtureFilter (the
+    # fixtures themselves are read from the season index)
+    fixture_filter = FixtureFilter(
+        request.GET, queryset=Fixture.objects.all(), request=request
+    )
 
     # Get season from bound form - defaults to current season or None
     if fixture_filter.is_valid():
-        season = fixture_filter.form.cleaned_data.get("season")
+        season, division_id, club_id = get_filter_ids(fixture_filter)
     else:
         season = None
 
-    # Get season_weeks
+    # Get the page of season_weeks (see league/paging.py) from the season
+    # index, with each week's fixtures grouped now or as it is streamed
+    # (see league/streaming.py)
     current_week_id = None
+    earlier_weeks_url = later_weeks_url = streamed_weeks = None
     if season:
-        season_weeks = (
-            Week.objects.filter(season=season)
-            .prefetch_related(
-                Prefetch("week_fixtures", queryset=filtered_fixtures_qs)
-            )
-            .order_by("start_date")
-        )
+        today = timezone.now().date()
+        index = get_season_index(season, request)
+        page = get_fixture_week_page(index.weeks, request, today)
+        shown_weeks = index.iter_weeks(page.weeks, division_id, club_id)
+        if stream:
+            season_weeks = page.weeks
+            streamed_weeks = shown_weeks
+        else:
+            season_weeks = list(shown_weeks)
 
         # Find current week (start_date <= today <= end_date)
-        today = timezone.now().date()
         for week in season_weeks:
             if week.start_date <= today <= week.start_date + timedelta(days=6):
                 current_week_id = week.id
                 break
+
+        if page.has_earlier:
+            earlier_weeks_url = get_more_weeks_url(
+                "fixture_weeks",
+                request,
+                season,
+                before=season_weeks[0].start_date,
+            )
+        if page.has_later:
+            later_weeks_url = get_more_weeks_url(
+                "fixture_weeks",
+                request,
+                season,
+                after=season_weeks[-1].start_date,
+            )
     else:
         season_weeks = None
 
@@ -395,7 +531,7 @@ def fixtures(request):
     ]
 
     # Deduce whether filters are applied by checking for get parameters
-    filters_applied = len(request.GET) > 0
+    filters_applied = any(param not in PAGING_PARAMS for param in request.GET)
 
     # Build context
     context = {
@@ -406,59 +542,167 @@ def fixtures(request):
         "filters_applied": filters_applied,
         "filter_clear_url": reverse("fixtures"),
         "current_week_id": current_week_id,
+        "earlier_weeks_url": earlier_weeks_url,
+        "later_weeks_url": later_weeks_url,
     }
+    if streamed_weeks:
+        context["streamed_weeks"] = streamed_weeks
 
-    # If htmx request, return only the fixtures_section partial template
-    if request.headers.get("HX-Request") == "true":
-        return render(
-            request, "league/partials/fixtures_section.html", context
-        )
+    return context
 
-    return render(request, "league/fixtures.html", context)
 
+def wants_streamed_page(request):
+    """
+    Returns whether a page showing every week of a season should be
+    streamed (see league/streaming.py). HTMX requests receive the cached
+    section instead.
+    """
+    return (
+        shows_all_weeks(request)
+        and request.headers.get("HX-Request") != "true"
+    )
 
-def results(request):
+
+@conditional_page(get_season_page_scope)
+def fixtures(request):
     """
-    Displays the results list, filtered by season and optionally division
+    Displays the fixture list, filtered by season and optionally division
     and club.
 
     Supports both full-page rendering and partial updates via HTMX.
-    Filters are applied using FixtureFilter and results are grouped by weeks.
+    Filters are applied using FixtureFilter, and results are grouped by weeks,
+    opening on the current week (other weeks are loaded by fixture_weeks).
+    The rendered fixtures section is cached until the fixtures change, except
+    for full-season pages, which are streamed one week at a time.
     """
+    if wants_streamed_page(request):
+        context = build_fixtures_context(request, stream=True)
+        if context.get("streamed_weeks"):
+            return stream_weeks_page(
+                request,
+                "league/fixtures.html",
+                "league/partials/fixtures_section.html",
+                "league/partials/fixture_week.html",
+                context,
+            )
 
-    # Prefetch related data for efficiency
-    fixtures_with_results = Fixture.objects.select_related(
-        "season", "division", "home_team__club", "away_team__club", "result"
-    ).filter(result__isnull=False)
+    # Today's date is part of the name as it determines the current week
+    section = get_or_render_section(
+        f"fixtures:{timezone.now().date()}",
+        request,
+        get_season_page_tags(request),
+        lambda: render_to_string(
+            "league/partials/fixtures_section.html",
+            build_fixtures_context(request),
+            request,
+        ),
+    )
+
+    # If htmx request, return only the fixtures_section partial template
+    if request.headers.get("HX-Request") == "true":
+        return HttpResponse(section)
+
+    return render(request, "league/fixtures.html", {"section": section})
+
+
+@conditional_page(get_season_page_scope)
+def fixture_weeks(request):
+    """
+    Renders the page of weeks before the "before" date or after the "after"
+    date for the fixtures page (loaded via HTMX), filtered as the fixtures
+    page is.
+    """
+    # If not HTMX request, return error 400
+    if not request.headers.get("HX-Request") == "true":
+        return HttpResponseBadRequest(
+            "This endpoint is for HTMX requests only."
+        )
+
+    # Today's date is part of the name as it determines the current week
+    section = get_or_render_section(
+        f"fixture_weeks:{timezone.now().date()}",
+        request,
+        get_season_page_tags(request),
+        lambda: render_to_string(
+            "league/partials/fixture_weeks.html",
+            build_fixtures_context(request),
+            request,
+        ),
+    )
+    return HttpResponse(section)
+
+
+def build_results_context(request, archive=None, stream=False):
+    """
+    Builds the template context for the results section, filtered by season
+    and optionally division and club using the GET parameters.
+
+    Args:
+        request (HttpRequest): The HTTP request containing filter parameters.
+        archive (SeasonSnapshot, optional): The snapshot of the requested
+                                            season, if it is archived.
+        stream (bool, optional): Whether every week of the season is being
+                                 streamed (see league/streaming.py).
+
+    Returns:
+        dict: Context for the results_section partial template.
+    """
 
-    # Apply filters from GET params using FixtureFilter
-    fixture_filter = FixtureFilter(request.GET, queryset=fixtures_with_results)
-    filtered_fixtures_qs = fixture_filter.qs
+    # Validate the filters from GET params using FixtureFilter (the
+    # results themselves are read from the season index or snapshot)
+    fixture_filter = FixtureFilter(
+        request.GET, queryset=Fixture.objects.all(), request=request
+    )
 
     # Get season from bound form - defaults to current season or None
     if fixture_filter.is_valid():
-        season = fixture_filter.form.cleaned_data.get("season")
+        season, division_id, club_id = get_filter_ids(fixture_filter)
     else:
         season = None
 
-    # Get season_weeks
-    if season:
-        season_weeks = (
-            Week.objects.filter(
-                season=season, week_fixtures__in=filtered_fixtures_qs
-            )
-            .prefetch_related(
-                Prefetch("week_fixtures", queryset=filtered_fixtures_qs)
-            )
-            .distinct()
-            .order_by("-start_date")
+    # Get the page of season_weeks (see league/paging.py) from the season
+    # snapshot or index, streamed if every week is shown (see
+    # league/streaming.py)
+    earlier_weeks_url = streamed_weeks = None
+    has_earlier = False
+    before = get_cursor(request, "before")
+    if season and archive and archive.season_id == season.id:
+        page = get_result_week_page(
+            archive.get_result_weeks(
+                fixture_filter.form.cleaned_data.get("division"),
+                fixture_filter.form.cleaned_data.get("club"),
+                before,
+            ),
+            request,
         )
-
+        season_weeks, has_earlier = page.weeks, page.has_earlier
+    elif season:
+        index = get_season_index(season, request)
+        shown_weeks = index.iter_result_weeks(division_id, club_id, before)
+        if stream:
+            # Only the first week is built before the page is sent (to
+            # tell whether there are any results), the rest as they are
+            # streamed
+            first_week = next(shown_weeks, None)
+            season_weeks = [first_week] if first_week else []
+            if first_week:
+                streamed_weeks = chain([first_week], shown_weeks)
+        else:
+            page = get_result_week_page(shown_weeks, request)
+            season_weeks, has_earlier = page.weeks, page.has_earlier
     else:
         season_weeks = None
 
+    if season_weeks and has_earlier:
+        earlier_weeks_url = get_more_weeks_url(
+            "result_weeks",
+            request,
+            season,
+            before=get_start_date(season_weeks[-1]),
+        )
+
     # Deduce whether filters are applied by checking for get parameters
-    filters_applied = len(request.GET) > 0
+    filters_applied = any(param not in PAGING_PARAMS for param in request.GET)
 
     # Build context
     context = {
@@ -467,32 +711,101 @@ def results(request):
         "filter": fixture_filter,
         "filters_applied": filters_applied,
         "filter_clear_url": reverse("results"),
+        "earlier_weeks_url": earlier_weeks_url,
     }
+    if streamed_weeks:
+        context["streamed_weeks"] = streamed_weeks
+
+    return context
+
+
+def render_results(request, archive, name, template_name):
+    """
+    Renders the results section or a page of its weeks, from the season
+    snapshot if the season is archived and otherwise through the section
+    cache.
+    """
+    if archive:
+        return render_to_string(
+            template_name, build_results_context(request, archive), request
+        )
+    return get_or_render_section(
+        name,
+        request,
+        get_season_page_tags(request),
+        lambda: render_to_string(
+            template_name, build_results_context(request), request
+        ),
+    )
+
+
+@conditional_page(get_archived_season_page_scope, get_season_page_max_age)
+def results(request):
+    """
+    Displays the results list, filtered by season and optionally division
+    and club.
+
+    Supports both full-page rendering and partial updates via HTMX.
+    Filters are applied using FixtureFilter and results are grouped by weeks,
+    showing the latest weeks first (earlier weeks are loaded by result_weeks).
+    The rendered results section is cached until the results change, except
+    for full-season pages, which are streamed one week at a time.
+    Archived seasons are served from the season snapshot.
+    """
+    archive = get_requested_archive(request)
+    if wants_streamed_page(request) and not archive:
+        context = build_results_context(request, stream=True)
+        if context.get("streamed_weeks"):
+            return stream_weeks_page(
+                request,
+                "league/results.html",
+                "league/partials/results_section.html",
+                "league/partials/result_week.html",
+                context,
+            )
+
+    section = render_results(
+        request, archive, "results", "league/partials/results_section.html"
+    )
 
     # If htmx request, return only the results_section partial template
     if request.headers.get("HX-Request") == "true":
-        return render(request, "league/partials/results_section.html", context)
+        response = HttpResponse(section)
+    else:
+        response = render(request, "league/results.html", {"section": section})
 
-    return render(request, "league/results.html", context)
+    return response
 
 
-def result_breakdown(request, fixture_id):
+@conditional_page(get_archived_season_page_scope, get_season_page_max_age)
+def result_weeks(request):
     """
-    Display a detailed breakdown of a fixture's result, including singles
-    and doubles match scores and individual player win counts.
+    Renders the page of weeks before the "before" date for the results
+    page (loaded via HTMX), filtered as the results page is.
+    """
+    # If not HTMX request, return error 400
+    if not request.headers.get("HX-Request") == "true":
+        return HttpResponseBadRequest(
+            "This endpoint is for HTMX requests only."
+        )
 
-    If no result exists for the given fixture, the user is redirected to
-    the results page with a warning.
+    archive = get_requested_archive(request)
+    response = HttpResponse(
+        render_results(
+            request,
+            archive,
+            "result_weeks",
+            "league/partials/result_weeks.html",
+        )
+    )
+    return response
 
-    Args:
-        request (HttpRequest): The HTTP request object.
-        fixture_id (int): The ID of the fixture with the related results.
 
-    Returns:
-        HttpResponse: Rendered result breakdown page or redirect to
-        the results page.
+def get_breakdown_fixtures():
+    """
+    Returns a Fixture queryset prefetching everything shown on the result
+    breakdown page, down to individual games.
     """
-    # Define querysets
     singles_qs = SinglesMatch.objects.select_related(
         "home_player__player", "away_player__player"
     ).prefetch_related("singles_games")
@@ -501,19 +814,25 @@ def result_breakdown(request, fixture_id):
         "home_players__player", "away_players__player", "doubles_games"
     )
 
-    fixture_qs = Fixture.objects.select_related("result").prefetch_related(
+    return Fixture.objects.select_related(
+        "season", "venue", "home_team", "away_team", "result"
+    ).prefetch_related(
         Prefetch("result__singles_matches", queryset=singles_qs),
         Prefetch("result__doubles_match", queryset=doubles_qs),
     )
 
-    # Get fixture with prefetched data
-    fixture = get_object_or_404(fixture_qs, id=fixture_id)
 
-    # Redirect to Results page if fixture has no result
-    if not hasattr(fixture, "result"):
-        messages.warning(request, "No result found for this fixture.")
-        return redirect("results")
+def build_result_breakdown_context(fixture):
+    """
+    Builds the template context for the result breakdown of a fixture with
+    a result, counting the singles wins of each player.
 
+    Args:
+        fixture (Fixture): A fixture from get_breakdown_fixtures().
+
+    Returns:
+        dict: Context for the result_breakdown template.
+    """
     # Count singles wins for both home and away players
     home_player_win_counts = {}
     away_player_win_counts = {}
@@ -535,41 +854,113 @@ def result_breakdown(request, fixture_id):
     if doubles_match:
         doubles_winning_team = doubles_match.winner
 
+    return {
+        "fixture": fixture,
+        "home_player_win_counts": home_player_win_counts,
+        "away_player_win_counts": away_player_win_counts,
+        "doubles_winning_team": doubles_winning_team,
+    }
+
+
+@conditional_page(get_result_breakdown_scope, get_result_breakdown_max_age)
+def result_breakdown(request, fixture_id):
+    """
+    Display a detailed breakdown of a fixture's result, including singles
+    and doubles match scores and individual player win counts.
+
+    If no result exists for the given fixture, the user is redirected to
+    the results page with a warning. Results in archived seasons are
+    served from the season snapshot.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        fixture_id (int): The ID of the fixture with the related results.
+
+    Returns:
+        HttpResponse: Rendered result breakdown page or redirect to
+        the results page.
+    """
+    archived_context = get_archived_breakdown(fixture_id, request)
+    if archived_context:
+        response = render(
+            request, "league/result_breakdown.html", archived_context
+        )
+        return response
+
+    # Get fixture with prefetched data
+    fixture = get_object_or_404(get_breakdown_fixtures(), id=fixture_id)
+
+    # Redirect to Results page if fixture has no result
+    if not hasattr(fixture, "result"):
+        messages.warning(request, "No result found for this fixture.")
+        return redirect("results")
+
     return render(
         request,
         "league/result_breakdown.html",
-        {
-            "fixture": fixture,
-            "home_player_win_counts": home_player_win_counts,
-            "away_player_win_counts": away_player_win_counts,
-            "doubles_winning_team": doubles_winning_team,
-        },
+        build_result_breakdown_context(fixture),
     )
 
 
-def tables(request):
+def get_division_tables(season):
     """
-    Displays the league tables page with optional season filtering
-    (defaults to current season).
+    Returns the league table of each division in a season from the stored
+    standings.
 
-    Supports HTMX for filtering.
+    Args:
+        season (Season): The season.
+
+    Returns:
+        list[dict]: One dictionary per division (in rank order) with keys:
+            - 'division' (Division): The division.
+            - 'table' (list[dict]): Team data from get_standing_data, in
+                                    league table order.
+    """
+    # Group stored standings (already in league table order) by division
+    standings_qs = (
+        LeagueStanding.objects.filter(season=season)
+        .select_related("team")
+        .order_by(*STANDING_ORDER)
+    )
+    tables_by_division = {}
+    for standing in standings_qs:
+        tables_by_division.setdefault(standing.division_id, []).append(
+            get_standing_data(standing)
+        )
+
+    return [
+        {
+            "division": division,
+            "table": tables_by_division.get(division.id, []),
+        }
+        for division in season.divisions.all()
+    ]
+
+
+def build_tables_context(request, archive=None):
     """
-    form = LeagueTableForm(request.GET or None)
+    Builds the template context for the league tables section for the season
+    in the GET parameters (defaults to current season).
+
+    Args:
+        request (HttpRequest): The HTTP request containing filter parameters.
+        archive (SeasonSnapshot, optional): The snapshot of the requested
+                                            season, if it is archived.
+
+    Returns:
+        dict: Context for the tables_section partial template.
+    """
+    form = LeagueTableForm(request.GET or None, request=request)
 
     if form.is_valid():
         season = form.cleaned_data["season"]
     else:
-        season = Season.objects.filter(is_current=True).first()
+        season = get_current_season(request)
 
-    if season:
-        season_divisions = season.divisions.all()
-        division_tables = [
-            {
-                "division": division,
-                "table": generate_league_table(season, division),
-            }
-            for division in season_divisions
-        ]
+    if season and archive and archive.season_id == season.id:
+        division_tables = archive.get_division_tables()
+    elif season:
+        division_tables = get_division_tables(season)
     else:
         division_tables = []
 
@@ -584,59 +975,70 @@ def tables(request):
         "filters_applied": filters_applied,
     }
 
+    return context
+
+
+@conditional_page(get_archived_season_page_scope, get_season_page_max_age)
+def tables(request):
+    """
+    Displays the league tables page with optional season filtering
+    (defaults to current season).
+
+    Supports HTMX for filtering. The rendered tables section is cached until
+    the season's standings change. Archived seasons are served from the
+    season snapshot.
+    """
+    archive = get_requested_archive(request)
+    if archive:
+        section = render_to_string(
+            "league/partials/tables_section.html",
+            build_tables_context(request, archive),
+            request,
+        )
+    else:
+        section = get_or_render_section(
+            "tables",
+            request,
+            get_season_page_tags(request),
+            lambda: render_to_string(
+                "league/partials/tables_section.html",
+                build_tables_context(request),
+                request,
+            ),
+        )
+
     # If htmx request, return only the tables_section partial template
     if request.headers.get("HX-Request") == "true":
-        return render(request, "league/partials/tables_section.html", context)
+        response = HttpResponse(section)
+    else:
+        response = render(request, "league/tables.html", {"section": section})
 
-    return render(request, "league/tables.html", context)
+    return response
 
 
-def team_summary(request, team_id):
+def build_team_summary_context(team_id):
     """
-    Displays the summary page for a specific team including
-    - team summary details and stats
-    - performance stats for each team player (including reserves)
-    - fixture results
-    - upcoming fixtures
+    Builds the template context for the team summary section.
 
     Args:
-        request (HttpRequest): The incoming HTTP request.
         team_id (int): The primary key of the team to summarize.
 
     Returns:
-        HttpResponse: Rendered HTML page displaying the team summary
-                      or 404 page.
+        dict: Context for the team_summary_section partial template.
+
+    Raises:
+        Http404: If the team does not exist.
     """
 
     team = get_object_or_404(Team, id=team_id)
 
     team_fixtures_qs = (
         Fixture.objects.filter(Q(home_team=team) | Q(away_team=team))
-        .select_related("result", "venue", "home_team", "away_team")
-        .prefetch_related("result__singles_matches", "result__doubles_match")
+        .select_related("result", "week", "venue", "home_team", "away_team")
     )
 
-    # Get registered players and IDs for quick lookup
-    registered_players = TeamPlayer.objects.filter(team=team)
-    registered_player_ids = set(
-        registered_players.values_list("id", flat=True)
-    )
-
-    # Get players who played singles matches for the team
-    singles_players = TeamPlayer.objects.filter(
-        Q(home_singles_matches__fixture_result__fixture__home_team=team)
-        | Q(away_singles_matches__fixture_result__fixture__away_team=team)
-    )
-
-    # Combine all team players (registered + played)
-    all_team_players = registered_players | singles_players
-    all_team_players = all_team_players.distinct().select_related("player")
-
-    # Get player summary data
-    player_data = []
-    for team_player in all_team_players:
-        data = get_player_match_stats(team_player, team, registered_player_ids)
-        player_data.append(data)
+    # Get player summary data (registered players and reserves)
+    player_data = get_team_player_stats(team)
 
     # Sort player summary data by percentage wins
     player_data = sorted(
@@ -667,7 +1069,53 @@ def team_summary(request, team_id):
         "team_stats": team_stats,
     }
 
-    return render(request, "league/team_summary.html", context)
+    return context
+
+
+@conditional_page(get_team_summary_scope, get_team_summary_max_age)
+def team_summary(request, team_id):
+    """
+    Displays the summary page for a specific team including
+    - team summary details and stats
+    - performance stats for each team player (including reserves)
+    - fixture results
+    - upcoming fixtures
+
+    The rendered summary is cached until the team's data changes. Teams in
+    archived seasons are served from the season snapshot.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request.
+        team_id (int): The primary key of the team to summarize.
+
+    Returns:
+        HttpResponse: Rendered HTML page displaying the team summary
+                      or 404 page.
+    """
+    archived_context = get_archived_team_summary(team_id, request)
+    if archived_context:
+        section = render_to_string(
+            "league/partials/team_summary_section.html",
+            archived_context,
+            request,
+        )
+        response = render(
+            request, "league/team_summary.html", {"section": section}
+        )
+        return response
+
+    section = get_or_render_section(
+        f"team_summary:{team_id}",
+        request,
+        [SEASONS_TAG, CLUBS_TAG, team_tag(team_id)],
+        lambda: render_to_string(
+            "league/partials/team_summary_section.html",
+            build_team_summary_context(team_id),
+            request,
+        ),
+    )
+
+    return render(request, "league/team_summary.html", {"section": section})
 
 
 # View for filter panel
@@ -689,9 +1137,84 @@ def fixtures_filter(request):
     parsed_url = urlparse(referer)
     clear_url = parsed_url.path  # Ensures query string is excluded
 
-    fixture_filter = FixtureFilter(request.GET or None)
+    fixture_filter = FixtureFilter(request.GET or None, request=request)
     return render(
         request,
         "league/partials/fixtures_filter_panel_inner.html",
         {"filter": fixture_filter, "filter_clear_url": clear_url},
     )
+
+
+# Views restricted to league administrators
+def get_result_json(result):
+    """Returns the JSON response data for a saved fixture result."""
+    return {
+        "fixture_id": result.fixture_id,
+        "home_score": result.home_score,
+        "away_score": result.away_score,
+        "winner": result.winner,
+        "url": reverse("result_breakdown", args=[result.fixture_id]),
+    }
+
+
+@staff_member_required
+def scorecard(request, fixture_id):
+    """
+    Allows a league administrator to enter the complete scorecard for a
+    fixture (all singles and doubles games) in one submission.
+
+    POST requests with a JSON body (see league/scorecard.py for its
+    structure) return the saved result (status 201) or the list of errors
+    (status 400). Otherwise the scorecard form is rendered and, once
+    submitted successfully, the user is redirected to the result breakdown.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        fixture_id (int): The ID of the fixture being scored.
+
+    Returns:
+        HttpResponse: JSON response, rendered scorecard page or redirect.
+    """
+    fixture = get_object_or_404(get_scorecard_fixtures(), id=fixture_id)
+    players = get_scorecard_players(fixture)
+
+    # JSON submission
+    if request.method == "POST" and request.content_type == "application/json":
+        try:
+            data = json.loads(request.body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return JsonResponse({"errors": ["Invalid JSON."]}, status=400)
+        try:
+            result = save_scorecard(build_scorecard(fixture, data, players))
+        except ValidationError as error:
+            return JsonResponse({"errors": error.messages}, status=400)
+        return JsonResponse(get_result_json(result), status=201)
+
+    # Redirect to breakdown page if a result has already been entered
+    if hasattr(fixture, "result"):
+        messages.warning(request, "A result has already been entered.")
+        return redirect("result_breakdown", fixture_id=fixture.id)
+
+    if request.method == "POST":
+        form = ScorecardForm(request.POST, fixture=fixture, players=players)
+        if form.is_valid():
+            try:
+                save_scorecard(form.scorecard)
+            except ValidationError as error:
+                messages.warning(request, error.messages[0])
+                return redirect("result_breakdown", fixture_id=fixture.id)
+            messages.success(request, "Scorecard has been saved.")
+            return redirect("result_breakdown", fixture_id=fixture.id)
+        messages.warning(
+            request,
+            (
+                "Form data was invalid - please check the error message(s)"
+                " in the form and try again"
+            ),
+        )
+    else:
+        form = ScorecardForm(fixture=fixture, players=players)
+
+    return render(
+        request, "league/scorecard.html", {"form": form, "fixture": fixture}
+    )